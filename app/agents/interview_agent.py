@@ -138,10 +138,11 @@ class InterviewAgentSystem:
             # Find an available time slot
             # Default to 1-hour interview, but can be customized based on agent output
             duration = 60  # minutes
+            now = datetime.datetime.now()
             available_slot = CalendarService.find_available_slot(
                 duration_minutes=duration,
-                start_date=datetime.datetime.now(),
-                end_date=datetime.datetime.now() + datetime.timedelta(days=14)
+                start_date=now,
+                end_date=now + datetime.timedelta(days=14)
             )
             
             if available_slot:
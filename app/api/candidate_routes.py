@@ -1,3 +1,5 @@
+import heapq
+
 from fastapi import APIRouter, HTTPException, status, Query, Path
 from typing import List, Dict, Any, Optional
 from pydantic import UUID4
@@ -181,15 +183,12 @@ async def get_top_candidates(
         # Get candidates for job
         candidates = CandidateService.get_candidates_by_job_id(job_id)
         
-        # Sort by AI fit score (descending)
-        sorted_candidates = sorted(
+        # Return top N candidates by AI fit score (descending)
+        return heapq.nlargest(
+            limit,
             candidates,
-            key=lambda c: int(c.get("ai_fit_score", 0)),
-            reverse=True
+            key=CandidateService.fit_score
         )
-        
-        # Return top N candidates
-        return sorted_candidates[:limit]
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
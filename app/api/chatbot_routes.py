@@ -2,8 +2,10 @@
 API routes for chatbot interactions - optimized for direct API execution
 """
 from fastapi import APIRouter, HTTPException, status
-from typing import Dict, Any, Optional
+from fastapi.responses import Response, StreamingResponse
+from typing import Dict, Any, List, Optional, Tuple
 import uuid
+import orjson
 from firebase_admin import firestore
 
 from app.schemas.chatbot_schema import ChatRequest, ChatResponse
@@ -17,6 +19,93 @@ router = APIRouter(
     responses={404: {"description": "Not found"}},
 )
 
+# Number of most recent history messages sent to the model as context
+CHAT_HISTORY_CONTEXT_MESSAGES = 20
+
+
+def _parse_chat_request(request: dict) -> Tuple[str, str]:
+    """
+    Extract the message and session ID from a chat request body
+    
+    Args:
+        request: Request body, optionally nested under "payload"
+    
+    Returns:
+        Tuple of (message, sessionId)
+    """
+    # Handle nested payload structure if present
+    payload = request
+    if isinstance(request, dict) and "payload" in request:
+        payload = request["payload"]
+    
+    # Extract message and sessionId from the payload
+    if not isinstance(payload, dict):
+        # If payload is not a dict (might be a Pydantic model), convert to dict
+        payload_dict = payload.dict() if hasattr(payload, "dict") else payload
+    else:
+        payload_dict = payload
+    
+    # Get required fields
+    message = payload_dict.get("message", "")
+    if not message:
+        raise HTTPException(status_code=400, detail="No message provided in request")
+        
+    # Initialize session or get existing session
+    sessionId = payload_dict.get("sessionId") or str(uuid.uuid4())
+    return message, sessionId
+
+
+def _load_chat_history(sessionId: str) -> List[Dict[str, Any]]:
+    """
+    Load the stored chat history for a session
+    
+    The history is stored as an array on the session document, so it is already
+    in chronological order and needs no sorting.
+    
+    Args:
+        sessionId: Chat session ID
+    
+    Returns:
+        List of chat messages, empty if none are stored
+    """
+    try:
+        # Fetch chat history from Firebase
+        chat_doc = FirestoreDB.get_document("chats", sessionId)
+        if chat_doc and "history" in chat_doc:
+            return chat_doc["history"]
+    except Exception as history_error:
+        print(f"Error fetching chat history: {history_error}")
+    return []
+
+
+def _save_chat_history(sessionId: str, chat_history: List[Dict[str, Any]], message: str, reply: str) -> None:
+    """
+    Append a user message and the assistant's reply to the stored chat history
+    
+    Args:
+        sessionId: Chat session ID
+        chat_history: History loaded for the session
+        message: The user's message
+        reply: The assistant's reply
+    """
+    try:
+        # Update history with new message and response
+        chat_history.append({"role": "user", "content": message})
+        chat_history.append({"role": "assistant", "content": reply})
+        
+        # Save to Firebase
+        FirestoreDB.update_document(
+            "chats", 
+            sessionId, 
+            {
+                "history": chat_history,
+                "last_updated": firestore.SERVER_TIMESTAMP,
+                "last_message": message
+            }
+        )
+    except Exception as save_error:
+        print(f"Error saving chat history: {save_error}")
+
 
 @router.post("/execute")
 async def execute_query(request: dict):
@@ -38,62 +127,21 @@ async def execute_query(request: dict):
     This endpoint is optimized for performance and direct API execution.
     """
     try:
-        # Handle nested payload structure if present
-        payload = request
-        if isinstance(request, dict) and "payload" in request:
-            payload = request["payload"]
-        
-        # Extract message and sessionId from the payload
-        if not isinstance(payload, dict):
-            # If payload is not a dict (might be a Pydantic model), convert to dict
-            payload_dict = payload.dict() if hasattr(payload, "dict") else payload
-        else:
-            payload_dict = payload
-        
-        # Get required fields
-        message = payload_dict.get("message", "")
-        if not message:
-            raise HTTPException(status_code=400, detail="No message provided in request")
-            
-        # Initialize session or get existing session
-        sessionId = payload_dict.get("sessionId") or str(uuid.uuid4())
+        message, sessionId = _parse_chat_request(request)
         
         # Get chat history if sessionId exists
-        chat_history = []
-        if sessionId:
-            try:
-                # Fetch chat history from Firebase
-                chat_doc = FirestoreDB.get_document("chats", sessionId)
-                if chat_doc and "history" in chat_doc:
-                    chat_history = chat_doc["history"]
-            except Exception as history_error:
-                print(f"Error fetching chat history: {history_error}")
+        chat_history = _load_chat_history(sessionId)
         
         # Generate response and execute API action in one step
         response = ChatbotService.generate_response(
             message=message,
             conversation_id=sessionId,
-            context={"chat_history": chat_history}
+            context={"chat_history": chat_history[-CHAT_HISTORY_CONTEXT_MESSAGES:]}
         )
         
-        # Store chat history
-        try:
-            # Update history with new message and response
-            chat_history.append({"role": "user", "content": message})
-            chat_history.append({"role": "assistant", "content": response["response"]})
-            
-            # Save to Firebase
-            FirestoreDB.update_document(
-                "chats", 
-                sessionId, 
-                {
-                    "history": chat_history,
-                    "last_updated": firestore.SERVER_TIMESTAMP,
-                    "last_message": message
-                }
-            )
-        except Exception as save_error:
-            print(f"Error saving chat history: {save_error}")
+        # Store chat history before responding: the whole array is rewritten, so a save
+        # still pending when the client sends its next message would drop this turn
+        _save_chat_history(sessionId, chat_history, message, response["response"])
         
         # Construct a more concise response
         result = None
@@ -106,14 +154,48 @@ async def execute_query(request: dict):
             else:
                 result = {"result": action_result}
         
-        return {
-            "message": response["response"],
-            "sessionId": sessionId,
-            "success": True,
-            "result": result
-        }
+        # The service has already made the result JSON serializable, so encode it once
+        # here rather than letting FastAPI walk the whole payload again
+        return Response(
+            content=orjson.dumps({
+                "message": response["response"],
+                "sessionId": sessionId,
+                "success": True,
+                "result": result
+            }, default=str),
+            media_type="application/json"
+        )
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Error processing query: {str(e)}"
         )
+
+
+@router.post("/execute/stream")
+def execute_query_stream(request: dict):
+    """
+    Process a natural language query like /chat/execute, streaming the reply
+    
+    The response is a text/event-stream:
+    - "start" with the conversation ID
+    - "token" events with the assistant's reply as it is generated
+    - "result" with the executed API action and its result, or "error"
+    
+    The chat history is saved before the "result" event is sent.
+    """
+    message, sessionId = _parse_chat_request(request)
+    chat_history = _load_chat_history(sessionId)
+    
+    def event_stream():
+        for event, data in ChatbotService.generate_response_stream(
+            message=message,
+            conversation_id=sessionId,
+            context={"chat_history": chat_history[-CHAT_HISTORY_CONTEXT_MESSAGES:]}
+        ):
+            # Saved before the client sees the result, so its next message loads this turn
+            if event == "result":
+                _save_chat_history(sessionId, chat_history, message, data["response"])
+            yield f"event: {event}\ndata: {orjson.dumps(data, default=str).decode()}\n\n"
+    
+    return StreamingResponse(event_stream(), media_type="text/event-stream")
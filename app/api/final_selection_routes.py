@@ -1,7 +1,7 @@
 """
 API routes for final candidate selection and offer letter generation
 """
-from fastapi import APIRouter, HTTPException, status, Path, Query, BackgroundTasks
+from fastapi import APIRouter, HTTPException, status, Path, Query, BackgroundTasks, Body
 from typing import List, Dict, Any, Optional
 
 from app.services.final_selection_service import FinalSelectionService
@@ -38,7 +38,7 @@ async def stackrank_candidates(job_id: str):
         )
     
     # Stack rank candidates
-    ranked_candidates = FinalSelectionService.stackrank_candidates(job_id)
+    ranked_candidates, _ = FinalSelectionService.stackrank_candidates(job_id)
     
     if not ranked_candidates:
         raise HTTPException(
@@ -117,7 +117,7 @@ async def send_offer_letter(
             )
         
         # First try to stackrank to make sure we have candidates
-        ranked_candidates = FinalSelectionService.stackrank_candidates(job_id)
+        ranked_candidates, _ = FinalSelectionService.stackrank_candidates(job_id)
         if not ranked_candidates:
             print(f"ERROR: No ranked candidates found for job {job_id}. Check that interviews have been conducted and feedback provided.")
             # Return more helpful error message
@@ -154,6 +154,33 @@ async def send_offer_letter(
         )
 
 
+@router.post("/send-offers", response_model=Dict[str, Optional[FinalCandidateResponse]])
+async def send_offer_letters_bulk(
+    background_tasks: BackgroundTasks,
+    compensations: Dict[str, str] = Body(..., description="Compensation to offer, keyed by job ID (e.g., {\"job-1\": \"$100,000 per year\"})")
+):
+    """
+    Select the top candidate for several jobs and send all offer letters
+    
+    This endpoint runs the same selection as /send-offer/{job_id} for every job in the
+    request body. All offer letters are sent from one background task.
+    
+    Returns a mapping of job ID to the final candidate, or null for jobs where no
+    offer could be made.
+    """
+    if not compensations:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="At least one job ID with compensation is required"
+        )
+    
+    return await FinalSelectionService.select_and_send_offers_bulk(
+        job_ids=list(compensations.keys()),
+        compensations=compensations,
+        background_tasks=background_tasks
+    )
+
+
 @router.get("/offers/{job_id}", response_model=List[FinalCandidateResponse])
 async def get_offers_for_job(job_id: str):
     """
@@ -85,11 +85,14 @@ async def shortlist_candidates(request: ShortlistRequest):
 
 
 @router.get("/job/{job_id}", response_model=List[Dict[str, Any]])
-async def get_interview_candidates_for_job(job_id: str):
+async def get_interview_candidates_for_job(
+    job_id: str,
+    limit: Optional[int] = Query(None, ge=1, description="Maximum number of interview candidates to return")
+):
     """
-    Get all interview candidates for a job
+    Get the interview candidates for a job, optionally only the first `limit` of them
     """
-    candidates = InterviewService.get_interview_candidates_by_job_id(job_id)
+    candidates = InterviewService.get_interview_candidates_by_job_id(job_id, limit=limit)
     if not candidates:
         raise HTTPException(
             status_code=http_status.HTTP_404_NOT_FOUND,
@@ -155,13 +158,15 @@ async def update_interview_feedback(
             detail=f"Invalid round index {round_index}. Valid range: 0-{len(feedback_array) - 1}"
         )
     
-    # Update the feedback using new feedback submission method
+    # Update the feedback using new feedback submission method. The candidate read above
+    # is passed along and kept up to date in place, so no further reads are needed.
     result = InterviewTrackingService.submit_interview_feedback(
         candidate_id=interview_id,
         round_index=round_index,
         feedback=feedback.feedback,
         rating=feedback.rating_out_of_10,
-        selected_for_next=(feedback.isSelectedForNextRound == "yes")
+        selected_for_next=(feedback.isSelectedForNextRound == "yes"),
+        candidate=candidate
     )
     
     if not result:
@@ -170,9 +175,9 @@ async def update_interview_feedback(
             detail=f"Failed to update feedback for interview candidate {interview_id}"
         )
     
-    # Get the updated candidate and ensure the initialization of the feedback array
-    InterviewTrackingService.initialize_feedback_array(interview_id)
-    updated_candidate = InterviewService.get_interview_candidate(interview_id)
+    # Ensure the initialization of the feedback array
+    InterviewTrackingService.initialize_feedback_array(interview_id, candidate=candidate)
+    updated_candidate = candidate
     
     # Determine next steps based on current status and completed rounds
     interview_status = updated_candidate.get("status", "unknown")
@@ -302,16 +307,26 @@ async def initialize_interview_feedback(
 
 
 @router.get("/interviewers", response_model=List[Dict[str, Any]])
-async def get_all_interviewers():
+async def get_all_interviewers(
+    refresh: bool = Query(False, description="Re-read the interviewers from Firestore instead of the cache")
+):
     """
     Get all available interviewers
     
     This endpoint returns a list of all interviewers that can be assigned to interview rounds.
+    Interviewers are cached for a few minutes; pass refresh=true after editing them directly
+    in Firestore so assignments pick up the change straight away.
     """
+    if refresh:
+        InterviewService.invalidate_interviewers_cache()
     interviewers = InterviewService.get_all_interviewers()
     if not interviewers:
         return []
-    return interviewers
+    # Fields starting with "_" are derived in memory for assignment and are not part of the API
+    return [
+        {key: value for key, value in interviewer.items() if not key.startswith('_')}
+        for interviewer in interviewers
+    ]
 
 
 @router.post("/update-tracking")
@@ -342,14 +357,35 @@ async def get_interview_statistics_by_job(job_id: str):
     - selected: Completed all rounds and selected
     - completed: Completed all rounds but not explicitly selected
     - total: Total number of candidates
+    - completed_rounds: Interview rounds completed across all candidates
     """
     # First ensure all candidates have updated tracking status
     candidates = InterviewService.get_interview_candidates_by_job_id(job_id)
     
-    # Update tracking status for all candidates in this job
-    for candidate in candidates:
-        InterviewTrackingService.update_interview_tracking_status(candidate.get('id'))
+    # Update tracking status for all candidates in this job with batched writes
+    InterviewTrackingService.bulk_update_tracking_status(candidates)
     
-    # Get fresh statistics
-    stats = InterviewService.get_tracking_statistics_by_job(job_id)
-    return stats
+    # The candidates were updated in place, so count them here rather than querying again
+    return InterviewService.compute_tracking_statistics(candidates)
+
+
+@router.get("/interviewers/{interviewer_id}/feedback-summary", response_model=Dict[str, Any])
+async def get_interviewer_feedback_summary(interviewer_id: str):
+    """
+    Get a summary of the feedback an interviewer has given
+    
+    Returns the number of interviews, average rating, selections, rejections and
+    selection rate, read from the interviewer's stored counters.
+    """
+    return InterviewTrackingService.get_interviewer_feedback_summary(interviewer_id)
+
+
+@router.post("/interviewers/stats/rebuild")
+async def rebuild_interviewer_stats():
+    """
+    Recompute every interviewer's feedback counters from the interview candidates
+    
+    The counters are built on first start and kept current by the feedback endpoint;
+    run this to correct them after feedback was changed outside it.
+    """
+    return InterviewTrackingService.rebuild_interviewer_stats()
@@ -25,6 +25,17 @@ async def create_job_posting(job_posting: JobPostingCreate):
         )
 
 
+@router.post("/search-fields/rebuild")
+async def rebuild_role_name_search_fields():
+    """
+    Store the role name search fields on job postings saved before they existed
+    
+    Run this once after upgrading, or again after jobs were edited outside this API,
+    so role name lookups can find every job through the trigram index.
+    """
+    return JobService.backfill_role_name_search_fields()
+
+
 @router.get("/{job_id}", response_model=JobPostingResponse)
 async def get_job_posting(job_id: str):
     """
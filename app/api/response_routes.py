@@ -1,6 +1,8 @@
 """
 Routes for handling interview response (accept/decline) and dashboard
 """
+import logging
+
 from fastapi import APIRouter, HTTPException, status, Query, Request
 from fastapi.responses import HTMLResponse
 from typing import Dict, Any, Optional
@@ -8,6 +10,10 @@ from typing import Dict, Any, Optional
 from app.utils.email_notification import load_responses, save_response
 from app.services.interview_service import InterviewService
 
+logger = logging.getLogger(__name__)
+
+VALID_RESPONSE_ACTIONS = frozenset(("accept", "decline"))
+
 router = APIRouter(
     tags=["responses"],
     responses={404: {"description": "Not found"}},
@@ -33,7 +39,7 @@ async def respond_to_interview(
     
     response_data = responses[id]
     
-    if action not in ["accept", "decline"]:
+    if action not in VALID_RESPONSE_ACTIONS:
         return generate_error_html("Invalid action. Must be 'accept' or 'decline'.")
     
     # Update response status
@@ -41,84 +47,87 @@ async def respond_to_interview(
     response_data['response_time'] = True
     save_response(id, response_data)
     
-    # Print notification to terminal for visibility
-    print(f"\n🔔 NOTIFICATION: Interview {action.capitalize()}d")
-    print(f"👤 Recipient: {response_data['recipient']}")
-    print(f"⏰ Interview time: {response_data['start_time']} - {response_data['end_time']}")
-    print(f"✅ Status: {action.capitalize()}d")
-    if response_data.get('meet_link'):
-        print(f"🔗 Meet link: {response_data['meet_link']}")
-    print(f"📅 Event ID: {response_data.get('event_id', 'Not available')}\n")
+    # Record the response; arguments are only formatted when INFO is enabled
+    logger.info(
+        "Interview %sd by %s (%s - %s), meet link: %s, event ID: %s",
+        action,
+        response_data['recipient'],
+        response_data['start_time'],
+        response_data['end_time'],
+        response_data.get('meet_link') or "Not available",
+        response_data.get('event_id', 'Not available')
+    )
     
     # If this response is tied to an interview candidate record, update it
     try:
         if 'event_id' in response_data and response_data['event_id']:
             # Find any interview candidates with this event ID
-            all_candidates = InterviewService.get_all_interview_candidates()
-            for candidate in all_candidates:
+            matching_candidates = InterviewService.get_interview_candidates_by_event_id(response_data['event_id'])
+            for candidate in matching_candidates:
                 feedback_list = candidate.get('feedback', [])
-                for idx, feedback in enumerate(feedback_list):
-                    # Check if this event is referenced in the feedback
-                    scheduled_event = feedback.get("scheduled_event", {})
-                    if scheduled_event.get("id") == response_data['event_id']:
-                        # Find which person is responding (interviewer or candidate)
-                        is_interviewer = response_data['recipient'] == feedback.get("interviewer_email")
+                # Find the round scheduled as this event
+                idx = InterviewService.find_round_by_event_id(candidate, response_data['event_id'])
+                if idx is None:
+                    continue
+                feedback = feedback_list[idx]
+                
+                # Find which person is responding (interviewer or candidate)
+                is_interviewer = response_data['recipient'] == feedback.get("interviewer_email")
+                
+                # Update the appropriate status
+                if is_interviewer:
+                    feedback["interviewer_response"] = action
+                else:
+                    feedback["candidate_response"] = action
+                    
+                    # Handle declines for candidate
+                    if action == "decline":
+                        # Initialize or increment the decline count
+                        current_declines = feedback.get("declines_count", 0) + 1
+                        feedback["declines_count"] = current_declines
                         
-                        # Update the appropriate status
-                        if is_interviewer:
-                            feedback["interviewer_response"] = action
+                        if current_declines > 1:
+                            # More than one decline - automatically reject the candidate
+                            feedback["isSelectedForNextRound"] = "no"
+                            feedback["auto_rejected"] = True
+                            feedback["rejection_reason"] = "Multiple interview declines"
+                            logger.info("Candidate %s automatically rejected due to multiple declines", candidate.get('id'))
                         else:
-                            feedback["candidate_response"] = action
+                            # First decline - attempt to reschedule
+                            logger.debug("First decline for candidate %s - attempting to reschedule", candidate.get('id'))
                             
-                            # Handle declines for candidate
-                            if action == "decline":
-                                # Initialize or increment the decline count
-                                current_declines = feedback.get("declines_count", 0) + 1
-                                feedback["declines_count"] = current_declines
-                                
-                                if current_declines > 1:
-                                    # More than one decline - automatically reject the candidate
-                                    feedback["isSelectedForNextRound"] = "no"
-                                    feedback["auto_rejected"] = True
-                                    feedback["rejection_reason"] = "Multiple interview declines"
-                                    print(f"Candidate {candidate.get('id')} automatically rejected due to multiple declines")
-                                else:
-                                    # First decline - attempt to reschedule
-                                    print(f"First decline for candidate {candidate.get('id')} - attempting to reschedule")
+                            # Get the job data
+                            job_id = candidate.get("job_id")
+                            if job_id:
+                                job_data = JobService.get_job_posting(job_id)
+                                if job_data:
+                                    # Convert to dict for reschedule
+                                    job_data_dict = {
+                                        "job_id": job_data.job_id,
+                                        "job_role_name": job_data.job_role_name,
+                                        "job_description": job_data.job_description,
+                                        "years_of_experience_needed": job_data.years_of_experience_needed
+                                    }
                                     
-                                    # Get the job data
-                                    job_id = candidate.get("job_id")
-                                    if job_id:
-                                        job_data = JobService.get_job_posting(job_id)
-                                        if job_data:
-                                            # Convert to dict for reschedule
-                                            job_data_dict = {
-                                                "job_id": job_data.job_id,
-                                                "job_role_name": job_data.job_role_name,
-                                                "job_description": job_data.job_description,
-                                                "years_of_experience_needed": job_data.years_of_experience_needed
-                                            }
-                                            
-                                            # Attempt to reschedule
-                                            rescheduled = InterviewService.reschedule_interview(
-                                                candidate['id'], 
-                                                idx, 
-                                                job_data_dict,
-                                                tomorrow=True
-                                            )
-                                            
-                                            if rescheduled:
-                                                # Successfully rescheduled
-                                                feedback["rescheduled"] = True
-                                                print(f"Successfully rescheduled interview for candidate {candidate.get('id')}")
-                                            else:
-                                                print(f"Failed to reschedule interview for candidate {candidate.get('id')}")
-                        
-                        # Update the interview candidate
-                        InterviewService.update_interview_candidate(candidate['id'], {'feedback': feedback_list})
-                        break
+                                    # Attempt to reschedule
+                                    rescheduled = InterviewService.reschedule_interview(
+                                        candidate['id'], 
+                                        idx, 
+                                        job_data_dict,
+                                        tomorrow=True
+                                    )
+                                    
+                                    if rescheduled:
+                                        # Successfully rescheduled
+                                        feedback["rescheduled"] = True
+                                        logger.debug("Successfully rescheduled interview for candidate %s", candidate.get('id'))
+                                    else:
+                                        logger.warning("Failed to reschedule interview for candidate %s", candidate.get('id'))
+                
+                # Update the interview candidate
+                InterviewService.update_interview_candidate(candidate['id'], {'feedback': feedback_list})
     except Exception as e:
-        print(f"Error updating interview candidate: {e}")
+        logger.exception("Error updating interview candidate: %s", e)
         # Don't return an error to the user, still show success page
     
     # Return HTML response
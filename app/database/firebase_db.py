@@ -1,4 +1,5 @@
-from typing import Dict, Any, Optional, List, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Any, Iterable, Iterator, Optional, List, Tuple
 import os
 from firebase_admin import firestore, get_app, initialize_app, credentials
 from dotenv import load_dotenv
@@ -62,6 +63,9 @@ except Exception as e:
 # Get Firestore client
 db = firestore.client(app)
 
+# Maximum number of values Firestore accepts in a single 'in' filter
+FIRESTORE_IN_QUERY_LIMIT = 30
+
 class FirestoreDB:
     # Give direct access to the Firestore client
     db = db
@@ -77,7 +81,33 @@ class FirestoreDB:
         return len(list(docs)) > 0
     
     @staticmethod
-    def execute_query(collection_name: str, field_path: str, operator: str, value: Any) -> List[Dict[str, Any]]:
+    def _apply_order_and_limit(query, order_by: Optional[List[Tuple[str, str]]] = None, limit: Optional[int] = None):
+        """
+        Add ordering and a result limit to a Firestore query
+        
+        Args:
+            query: Firestore query or collection reference
+            order_by: Optional list of tuples with (field_path, direction) where direction is 'asc' or 'desc'
+            limit: Optional maximum number of documents to return
+            
+        Returns:
+            The query with ordering and limit applied
+        """
+        if order_by:
+            for field_path, direction in order_by:
+                if direction.lower() in ('desc', 'descending'):
+                    query = query.order_by(field_path, direction=firestore.Query.DESCENDING)
+                else:
+                    query = query.order_by(field_path)
+        if limit:
+            query = query.limit(limit)
+        return query
+    
+    @staticmethod
+    def execute_query(collection_name: str, field_path: str, operator: str, value: Any,
+                      fields: Optional[List[str]] = None,
+                      order_by: Optional[List[Tuple[str, str]]] = None,
+                      limit: Optional[int] = None) -> List[Dict[str, Any]]:
         """
         Execute a simple query against a collection
         
@@ -86,20 +116,63 @@ class FirestoreDB:
             field_path: Field path to query on
             operator: Operator for the query ('==', '!=', '>', '<', '>=', '<=', 'array_contains', 'in')
             value: Value to compare against
+            fields: Optional list of field paths to return instead of whole documents
+            order_by: Optional list of tuples with (field_path, direction) where direction is 'asc' or 'desc'
+            limit: Optional maximum number of documents to return
             
         Returns:
             List of documents matching the query
         """
         try:
             print(f"Executing query on {collection_name} where {field_path} {operator} {value}")
-            docs = db.collection(collection_name).where(field_path, operator, value).stream()
+            query = db.collection(collection_name).where(field_path, operator, value)
+            if fields:
+                query = query.select(fields)
+            query = FirestoreDB._apply_order_and_limit(query, order_by, limit)
+            docs = query.stream()
             return [doc.to_dict() for doc in docs]
         except Exception as e:
             print(f"Error executing query: {e}")
             return []
     
     @staticmethod
-    def execute_complex_query(collection_name: str, conditions: List[Tuple[str, str, Any]], order_by: Optional[List[Tuple[str, str]]] = None) -> List[Dict[str, Any]]:
+    def execute_in_query(collection_name: str, field_path: str, values: Iterable[Any],
+                         max_workers: int = 4) -> List[Dict[str, Any]]:
+        """
+        Get the documents whose field matches any of the values
+        
+        The values are split into 'in' queries of up to FIRESTORE_IN_QUERY_LIMIT each,
+        and the queries run concurrently.
+        
+        Args:
+            collection_name: Name of the collection to query
+            field_path: Field path to match
+            values: Values to match; duplicates and empty values are ignored
+            max_workers: Maximum number of queries to run at once
+            
+        Returns:
+            List of documents matching any of the values
+        """
+        unique_values = list(dict.fromkeys(value for value in values if value not in (None, "")))
+        chunks = [
+            unique_values[start:start + FIRESTORE_IN_QUERY_LIMIT]
+            for start in range(0, len(unique_values), FIRESTORE_IN_QUERY_LIMIT)
+        ]
+        if not chunks:
+            return []
+        if len(chunks) == 1:
+            return FirestoreDB.execute_query(collection_name, field_path, 'in', chunks[0])
+        
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(chunks))) as executor:
+            results = executor.map(
+                lambda chunk: FirestoreDB.execute_query(collection_name, field_path, 'in', chunk),
+                chunks
+            )
+            return [document for documents in results for document in documents]
+    
+    @staticmethod
+    def execute_complex_query(collection_name: str, conditions: List[Tuple[str, str, Any]], order_by: Optional[List[Tuple[str, str]]] = None,
+                              limit: Optional[int] = None) -> List[Dict[str, Any]]:
         """
         Execute a complex query with multiple conditions against a collection
         
@@ -107,6 +180,7 @@ class FirestoreDB:
             collection_name: Name of the collection to query
             conditions: List of tuples with (field_path, operator, value)
             order_by: Optional list of tuples with (field_path, direction) where direction is 'asc' or 'desc'
+            limit: Optional maximum number of documents to return
             
         Returns:
             List of documents matching all conditions
@@ -119,13 +193,8 @@ class FirestoreDB:
             for field_path, operator, value in conditions:
                 query = query.where(field_path, operator, value)
             
-            # Add ordering if specified
-            if order_by:
-                for field_path, direction in order_by:
-                    if direction.lower() == 'desc':
-                        query = query.order_by(field_path, direction=firestore.Query.DESCENDING)
-                    else:
-                        query = query.order_by(field_path)
+            # Add ordering and limit if specified
+            query = FirestoreDB._apply_order_and_limit(query, order_by, limit)
             
             # Execute the query
             docs = query.stream()
@@ -134,6 +203,60 @@ class FirestoreDB:
             print(f"Error executing complex query: {e}")
             return []
     
+    @staticmethod
+    def aggregate_documents(
+        collection_name: str,
+        conditions: Optional[List[Tuple[str, str, Any]]] = None,
+        sum_fields: Optional[List[str]] = None,
+        avg_fields: Optional[List[str]] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Count, sum and average the documents matching the conditions in one server-side aggregation query
+        
+        Only the aggregated values are transferred, not the documents. Non-numeric
+        values are ignored by sums and averages.
+        
+        Args:
+            collection_name: Name of the collection to aggregate
+            conditions: Optional list of tuples with (field_path, operator, value)
+            sum_fields: Optional numeric fields to sum, returned as "sum_<field>"
+            avg_fields: Optional numeric fields to average, returned as "avg_<field>"
+            
+        Returns:
+            Dictionary with "count" and the requested sums and averages, or None if the query failed
+        """
+        try:
+            query = db.collection(collection_name)
+            for field_path, operator, value in conditions or []:
+                query = query.where(field_path, operator, value)
+            aggregation = query.count(alias="count")
+            for field in sum_fields or []:
+                aggregation = aggregation.sum(field, alias=f"sum_{field}")
+            for field in avg_fields or []:
+                aggregation = aggregation.avg(field, alias=f"avg_{field}")
+            result = aggregation.get()
+            return {aggregate.alias: aggregate.value for aggregate in result[0]}
+        except Exception as e:
+            print(f"Error aggregating documents: {e}")
+            return None
+    
+    @staticmethod
+    def count_documents(collection_name: str, conditions: Optional[List[Tuple[str, str, Any]]] = None) -> Optional[int]:
+        """
+        Count the documents matching the conditions with a server-side aggregation query
+        
+        Only the count is transferred, not the documents.
+        
+        Args:
+            collection_name: Name of the collection to count
+            conditions: Optional list of tuples with (field_path, operator, value)
+            
+        Returns:
+            Number of matching documents, or None if the count failed
+        """
+        result = FirestoreDB.aggregate_documents(collection_name, conditions)
+        return int(result["count"]) if result is not None else None
+    
     @staticmethod
     def create_document(collection_name: str, document_data: Dict[str, Any]) -> str:
         """
@@ -161,11 +284,10 @@ class FirestoreDB:
             # Set the data with the appropriate ID
             try:
                 doc_ref = db.collection(collection_name).document(doc_id)
-                doc_data = document_data.copy()
                 
-                # Ensure the ID is included in the document data
-                if "id" not in doc_data:
-                    doc_data["id"] = doc_id
+                # Ensure the ID is included in the document data; the caller's dict is
+                # only copied when the ID has to be added, not for every document
+                doc_data = document_data if "id" in document_data else {**document_data, "id": doc_id}
                     
                 # Write to Firestore
                 doc_ref.set(doc_data)
@@ -198,18 +320,79 @@ class FirestoreDB:
             return {"job_id": doc_id, "status": "mock_data"}
     
     @staticmethod
-    def get_all_documents(collection_name: str) -> List[Dict[str, Any]]:
+    def get_documents_by_ids(collection_name: str, doc_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Get several documents by their IDs in a single batched read
+        
+        Args:
+            collection_name: Name of the collection
+            doc_ids: IDs of the documents to fetch
+            
+        Returns:
+            Dictionary mapping document ID to document data, for the documents that exist
+        """
+        try:
+            unique_ids = list(dict.fromkeys(doc_id for doc_id in doc_ids if doc_id))
+            if not unique_ids:
+                return {}
+            collection_ref = db.collection(collection_name)
+            docs = db.get_all([collection_ref.document(doc_id) for doc_id in unique_ids])
+            return {doc.id: doc.to_dict() for doc in docs if doc.exists}
+        except Exception as e:
+            print(f"Error getting documents by IDs: {e}")
+            return {}
+    
+    @staticmethod
+    def get_all_documents(collection_name: str, limit: Optional[int] = None,
+                          fields: Optional[List[str]] = None) -> List[Dict[str, Any]]:
         """
-        Get all documents in a collection
+        Get all documents in a collection, or only the first `limit` of them
+        
+        When `fields` is given, only those field paths are read from each document.
         """
         try:
-            docs = db.collection(collection_name).stream()
+            query = db.collection(collection_name)
+            if fields:
+                query = query.select(fields)
+            query = FirestoreDB._apply_order_and_limit(query, limit=limit)
+            docs = query.stream()
             return [doc.to_dict() for doc in docs]
         except Exception as e:
             print(f"Error getting all documents: {e}")
             # Return empty list for safety
             return []
     
+    @staticmethod
+    def get_all_documents_by_id(collection_name: str,
+                                fields: Optional[List[str]] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Get all documents in a collection keyed by their document ID
+        
+        When `fields` is given, only those field paths are read from each document.
+        """
+        try:
+            query = db.collection(collection_name)
+            if fields:
+                query = query.select(fields)
+            return {doc.id: doc.to_dict() for doc in query.stream()}
+        except Exception as e:
+            print(f"Error getting all documents: {e}")
+            return {}
+    
+    @staticmethod
+    def iter_all_documents(collection_name: str) -> Iterator[Dict[str, Any]]:
+        """
+        Yield the documents in a collection one at a time as they are streamed
+        
+        Unlike get_all_documents, the collection is never held in memory as a list,
+        so callers that filter keep only the documents they match.
+        """
+        try:
+            for doc in db.collection(collection_name).stream():
+                yield doc.to_dict()
+        except Exception as e:
+            print(f"Error streaming documents: {e}")
+    
     @staticmethod
     def update_document(collection_name: str, doc_id: str, data: Dict[str, Any]) -> None:
         """
@@ -221,6 +404,127 @@ class FirestoreDB:
             print(f"Error updating document: {e}")
             # Silently continue for testing
     
+    @staticmethod
+    def batch_update_documents(collection_name: str, updates: Dict[str, Dict[str, Any]]) -> List[str]:
+        """
+        Update several documents with batched writes instead of one request per document
+        
+        Writes are committed in batches of up to 500, the Firestore limit per batch.
+        
+        Args:
+            collection_name: Name of the collection
+            updates: Dictionary mapping document ID to the data to update
+            
+        Returns:
+            IDs of the documents whose batch failed to commit
+        """
+        failed_ids = []
+        doc_ids = list(updates)
+        collection_ref = db.collection(collection_name)
+        for start in range(0, len(doc_ids), 500):
+            chunk = doc_ids[start:start + 500]
+            batch = db.batch()
+            for doc_id in chunk:
+                batch.update(collection_ref.document(doc_id), updates[doc_id])
+            try:
+                batch.commit()
+            except Exception as e:
+                print(f"Error committing batch update: {e}")
+                failed_ids.extend(chunk)
+        return failed_ids
+    
+    @staticmethod
+    def run_transaction(collection_name: str, doc_id: str,
+                        update_fn: Callable[[Dict[str, Any]], Optional[Dict[str, Any]]],
+                        increments_fn: Optional[Callable[[], List[Tuple[str, str, Dict[str, Any]]]]] = None
+                        ) -> Optional[Dict[str, Any]]:
+        """
+        Read, modify and write a document atomically in a transaction
+        
+        The transaction is retried if the document changes concurrently, so update_fn
+        may be called more than once and must only depend on the document it is given.
+        
+        Args:
+            collection_name: Name of the collection
+            doc_id: ID of the document
+            update_fn: Function given the current document data that returns the fields
+                to update, or None to leave the document unchanged; raising aborts the transaction
+            increments_fn: Optional function called after update_fn that returns tuples of
+                (collection_name, doc_id, {field: amount}) to add to other documents in the
+                same commit; those documents are created if needed
+            
+        Returns:
+            The document data after the update, or None if it does not exist or the transaction failed
+        """
+        doc_ref = db.collection(collection_name).document(doc_id)
+        
+        @firestore.transactional
+        def apply_update(transaction):
+            snapshot = doc_ref.get(transaction=transaction)
+            if not snapshot.exists:
+                return None
+            document = snapshot.to_dict()
+            update_data = update_fn(document)
+            if update_data:
+                transaction.update(doc_ref, update_data)
+                document.update(update_data)
+            for other_collection, other_id, increments in (increments_fn() if increments_fn else []):
+                transaction.set(
+                    db.collection(other_collection).document(other_id),
+                    {field: firestore.Increment(amount) for field, amount in increments.items()},
+                    merge=True
+                )
+            return document
+        
+        try:
+            return apply_update(db.transaction())
+        except Exception as e:
+            print(f"Error running transaction: {e}")
+            return None
+    
+    @staticmethod
+    def rebuild_documents(source_collection: str, target_collection: str,
+                          build_fn: Callable[[Iterator[Dict[str, Any]]], Dict[str, Dict[str, Any]]],
+                          empty_data: Dict[str, Any]) -> Optional[int]:
+        """
+        Recompute a collection of derived documents from another collection in one transaction
+        
+        The source documents and the existing derived documents are all read in the
+        transaction, so writes made concurrently (such as increments committed with a
+        run_transaction update) conflict with the rebuild instead of being overwritten by
+        it. All derived documents are written in the same commit. The transaction is
+        retried on conflict, so build_fn may be called more than once.
+        
+        Args:
+            source_collection: Collection the documents are derived from
+            target_collection: Collection of derived documents
+            build_fn: Function given the source documents that returns the derived
+                documents to write, keyed by document ID
+            empty_data: Data written to existing derived documents that build_fn no
+                longer returns
+            
+        Returns:
+            Number of derived documents written, or None if the transaction failed
+        """
+        source_ref = db.collection(source_collection)
+        target_ref = db.collection(target_collection)
+        
+        @firestore.transactional
+        def apply_rebuild(transaction):
+            existing_ids = [doc.id for doc in target_ref.stream(transaction=transaction)]
+            documents = build_fn(doc.to_dict() for doc in source_ref.stream(transaction=transaction))
+            for doc_id in existing_ids:
+                documents.setdefault(doc_id, dict(empty_data))
+            for doc_id, data in documents.items():
+                transaction.set(target_ref.document(doc_id), data)
+            return len(documents)
+        
+        try:
+            return apply_rebuild(db.transaction())
+        except Exception as e:
+            print(f"Error rebuilding documents: {e}")
+            return None
+    
     @staticmethod
     def delete_document(collection_name: str, doc_id: str) -> None:
         """
@@ -1,17 +1,26 @@
 import os
+import logging
+import threading
 from dotenv import load_dotenv
 from fastapi import FastAPI, Depends, HTTPException, status
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, ORJSONResponse
 from firebase_admin import get_app
 
 from app.api import job_routes, calendar_routes, auth_routes, candidate_routes, interview_routes, response_routes, final_selection_routes, chatbot_routes
 from app.agents.interview_agent import InterviewAgentSystem, create_interview_crew
+from app.services.interview_tracking_service import InterviewTrackingService
 
 # Load environment variables
 load_dotenv()
 
+# Configure logging once at startup; module loggers inherit this level
+logging.basicConfig(
+    level=os.getenv("LOG_LEVEL", "INFO").upper(),
+    format="%(asctime)s %(levelname)s %(name)s: %(message)s"
+)
+
 # Get Firebase app (it's initialized in app/database/firebase_db.py)
 try:
     firebase_app = get_app()
@@ -24,6 +33,8 @@ app = FastAPI(
     title="Interview Scheduler Agent API",
     description="API for job posting and interview scheduling",
     version="1.0.0",
+    # Encode JSON responses with orjson, which is considerably faster on large result lists
+    default_response_class=ORJSONResponse,
 )
 
 # CORS middleware
@@ -52,6 +63,12 @@ app.include_router(chatbot_routes.router)
 interview_system = InterviewAgentSystem()
 
 
+@app.on_event("startup")
+def populate_interviewer_stats():
+    """Build the interviewer feedback counters on first start, without delaying startup"""
+    threading.Thread(target=InterviewTrackingService.ensure_interviewer_stats, daemon=True).start()
+
+
 @app.get("/")
 def root():
     """Root endpoint"""
@@ -5,6 +5,12 @@ from pydantic import BaseModel, Field, validator
 from typing import List, Dict, Any, Optional, Union, Literal
 
 
+# Allowed values, kept as frozensets so validation is a hashed lookup
+VALID_SELECTIONS = frozenset(("yes", "no", "maybe"))
+INTERVIEW_STATUSES = ("scheduled", "in_progress", "rejected", "passed", "selected", "completed")
+VALID_STATUSES = frozenset(INTERVIEW_STATUSES)
+
+
 class InterviewFeedback(BaseModel):
     """Schema for interview feedback"""
     isSelectedForNextRound: Optional[str] = Field(None, description="Whether the candidate is selected for the next round")
@@ -13,7 +19,7 @@ class InterviewFeedback(BaseModel):
     
     @validator('isSelectedForNextRound')
     def validate_selection(cls, v):
-        if v is not None and v not in ["yes", "no", "maybe"]:
+        if v is not None and v not in VALID_SELECTIONS:
             raise ValueError('isSelectedForNextRound must be one of: "yes", "no", "maybe"')
         return v
 
@@ -49,9 +55,8 @@ class InterviewCandidateCreate(BaseModel):
 
     @validator('status')
     def validate_status(cls, v):
-        valid_statuses = ["scheduled", "in_progress", "rejected", "passed", "selected", "completed"]
-        if v not in valid_statuses:
-            raise ValueError(f"status must be one of: {', '.join(valid_statuses)}")
+        if v not in VALID_STATUSES:
+            raise ValueError(f"status must be one of: {', '.join(INTERVIEW_STATUSES)}")
         return v
 
 
@@ -88,7 +93,6 @@ class InterviewStatusUpdate(BaseModel):
     @validator('status')
     def validate_status(cls, v):
         if v is not None:
-            valid_statuses = ["scheduled", "in_progress", "rejected", "passed", "selected", "completed"]
-            if v not in valid_statuses:
-                raise ValueError(f"status must be one of: {', '.join(valid_statuses)}")
+            if v not in VALID_STATUSES:
+                raise ValueError(f"status must be one of: {', '.join(INTERVIEW_STATUSES)}")
         return v
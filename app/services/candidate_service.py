@@ -81,6 +81,36 @@ class CandidateService:
             print(f"Error retrieving candidate {candidate_id}: {e}")
             return None
     
+    @staticmethod
+    def get_candidates_bulk(candidate_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Get several candidates by ID with a single batched read
+        
+        Args:
+            candidate_ids: IDs of the candidates
+        
+        Returns:
+            Dictionary mapping candidate ID to candidate data, for the candidates that exist
+        """
+        return FirestoreDB.get_documents_by_ids(CandidateService.COLLECTION_NAME, candidate_ids)
+    
+    @staticmethod
+    def get_candidates_by_ids(candidate_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Get several candidates by the ID stored in their 'id' field
+        
+        Candidate documents are saved under a generated document ID that can differ
+        from their 'id' field, so they are matched with chunked 'in' queries on the field.
+        
+        Args:
+            candidate_ids: IDs of the candidates
+        
+        Returns:
+            Dictionary mapping candidate ID to candidate data, for the candidates found
+        """
+        candidates = FirestoreDB.execute_in_query(CandidateService.COLLECTION_NAME, 'id', candidate_ids)
+        return {candidate.get('id'): candidate for candidate in candidates}
+    
     @staticmethod
     def get_all_candidates() -> List[Dict[str, Any]]:
         """
@@ -92,18 +122,35 @@ class CandidateService:
         return FirestoreDB.get_all_documents(CandidateService.COLLECTION_NAME)
     
     @staticmethod
-    def get_candidates_by_job_id(job_id: str) -> List[Dict[str, Any]]:
+    def fit_score(candidate: Dict[str, Any]) -> int:
+        """
+        Get a candidate's AI fit score as a number, for ranking candidates
+        
+        The score is stored as a string, so it cannot be read with a plain itemgetter.
+        
+        Args:
+            candidate: Candidate record
+        
+        Returns:
+            AI fit score, 0 if the candidate has none
+        """
+        return int(candidate.get("ai_fit_score", 0))
+    
+    @staticmethod
+    def get_candidates_by_job_id(job_id: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
         """
         Get candidates for a specific job
         
         Args:
             job_id: ID of the job
+            limit: Optional maximum number of candidates, applied in the query
         
         Returns:
             List of candidates for the job
         """
-        all_candidates = CandidateService.get_all_candidates()
-        return [c for c in all_candidates if c.get('job_id') == job_id]
+        # Filter on the automatically indexed job_id field in Firestore, so only the
+        # job's candidates are read rather than streaming the whole collection
+        return FirestoreDB.execute_query(CandidateService.COLLECTION_NAME, 'job_id', '==', job_id, limit=limit)
     
     @staticmethod
     def update_candidate(candidate_id: str, data: Dict[str, Any]) -> None:
@@ -1,11 +1,17 @@
 """
 Service for handling chatbot interactions using LangChain and OpenAI
 """
-import json
 import uuid
 import re
 import logging
-from typing import Dict, Any, List, Optional, Tuple
+import string
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from operator import itemgetter
+from types import SimpleNamespace
+from typing import Dict, Any, Iterator, List, Optional, Tuple
 
 from langchain.chains import LLMChain
 from langchain.chat_models import ChatOpenAI
@@ -13,7 +19,9 @@ from langchain.memory import ConversationBufferMemory
 from langchain.prompts import ChatPromptTemplate, MessagesPlaceholder
 from langchain.schema import SystemMessage, HumanMessage, AIMessage
 
+import httpx
 import openai
+import orjson
 from fastapi import HTTPException
 
 from app.database.firebase_db import FirestoreDB
@@ -24,6 +32,255 @@ from app.services.interview_shortlist_service import InterviewShortlistService
 from app.services.final_selection_service import FinalSelectionService
 
 
+# Shared OpenAI client so the HTTP connection pool and TLS sessions are reused across requests
+_openai_client: Optional[openai.OpenAI] = None
+_openai_client_lock = threading.Lock()
+
+
+def _get_openai_client() -> openai.OpenAI:
+    """
+    Get the shared OpenAI client, creating it on first use
+    
+    Returns:
+        OpenAI client instance
+    """
+    global _openai_client
+    if _openai_client is None:
+        with _openai_client_lock:
+            if _openai_client is None:
+                _openai_client = openai.OpenAI(
+                    http_client=httpx.Client(
+                        limits=httpx.Limits(max_connections=100, max_keepalive_connections=50)
+                    )
+                )
+    return _openai_client
+
+
+# Static task instructions, kept out of the per-request user message so the whole
+# system prefix of each call is identical across requests and can be prompt-cached
+PARAMETER_EXTRACTION_INSTRUCTIONS = """Extract parameters from the user message for the API call described in the user message.
+
+Return ONLY a JSON object with parameter names as keys and extracted values."""
+
+JOB_EXTRACTION_INSTRUCTIONS = """Extract the following job details from the message.
+
+Return ONLY a JSON object with these fields:
+- job_role_name: The name/title of the job position
+- job_description: A brief description of the job
+- years_of_experience_needed: Required years of experience
+- status: Job status (open/closed), default to "open" if not specified
+- location: Job location (remote or city name), default to "remote" if not specified"""
+
+PARAMETER_EXTRACTION_CACHE_SIZE = 4096
+
+# IDs stated explicitly in a message, e.g. "job id: abc-123"
+_EXPLICIT_ID_PATTERNS: Dict[str, "re.Pattern[str]"] = {
+    "job_id": re.compile(r'job id[:\s-]*([a-zA-Z0-9-]+)', re.IGNORECASE),
+    "candidate_id": re.compile(r'candidate id[:\s-]*([a-zA-Z0-9-]+)', re.IGNORECASE),
+    "interview_id": re.compile(r'interview id[:\s-]*([a-zA-Z0-9-]+)', re.IGNORECASE),
+}
+
+# Keywords that might indicate job role names in the message, with one pattern per
+# keyword (in priority order) compiled once instead of on every API call
+_JOB_ROLE_KEYWORDS = (
+    "developer", "engineer", "manager", "designer", "analyst",
+    "scientist", "specialist", "coordinator", "associate", "lead"
+)
+_JOB_ROLE_PATTERNS = tuple(
+    re.compile(rf'(?:job|position|role)\s+(?:for|as)\s+(?:a|an)?\s*([A-Za-z\s]*{keyword}[A-Za-z\s]*)', re.IGNORECASE)
+    for keyword in _JOB_ROLE_KEYWORDS
+)
+# One scan finds which keywords occur at all (overlapping, via the lookahead), so only
+# their patterns are tried instead of all of them
+_JOB_ROLE_KEYWORD_SCAN = re.compile(
+    '(?=(' + '|'.join(map(re.escape, _JOB_ROLE_KEYWORDS)) + '))', re.IGNORECASE
+)
+_GENERIC_JOB_ROLE_PATTERN = re.compile(r'(?:job|position|role)\s+(?:for|as)\s+(?:a|an)?\s*([A-Za-z\s]+)', re.IGNORECASE)
+# Common non-role text following "job for" that the generic pattern must not take as a role
+_NON_ROLE_WORDS = frozenset(("the", "this", "that"))
+
+# Terms in a message that call for offer or statistics data in the prompt context
+_OFFER_TERMS = ("final offer", "offer letter", "selected", "hiring")
+_STATISTICS_TERMS = ("statistics", "performance", "metrics", "tracking")
+
+# Common read-only requests that map straight to an endpoint without asking the model.
+# Each entry is (pattern, method, path, names of the parameters captured by the pattern);
+# patterns are matched against the normalized message.
+_ID = r"([A-Za-z0-9_-]+)"
+_SHOW = r"(?:show|list|get|display|fetch)(?: me)?(?: all)?(?: the)?"
+_FAST_PATH_ROUTES: List[Tuple["re.Pattern[str]", str, str, Tuple[str, ...]]] = [
+    (re.compile(rf"^{_SHOW} (?:jobs|job postings|openings)$", re.IGNORECASE), "GET", "/jobs", ()),
+    (re.compile(rf"^{_SHOW} candidates$", re.IGNORECASE), "GET", "/candidates", ()),
+    (re.compile(rf"^{_SHOW} job id[:\s]+{_ID}$", re.IGNORECASE), "GET", "/jobs/{job_id}", ("job_id",)),
+    (re.compile(rf"^{_SHOW} candidates for job(?: id)?[:\s]+{_ID}$", re.IGNORECASE),
+     "GET", "/candidates/job/{job_id}", ("job_id",)),
+    (re.compile(rf"^{_SHOW} interviews for job(?: id)?[:\s]+{_ID}$", re.IGNORECASE),
+     "GET", "/interviews/job/{job_id}", ("job_id",)),
+    (re.compile(rf"^{_SHOW} (?:interview )?statistics for job(?: id)?[:\s]+{_ID}$", re.IGNORECASE),
+     "GET", "/interviews/job/{job_id}/statistics", ("job_id",)),
+]
+
+
+def _to_prompt_json(data: Any) -> str:
+    """
+    Serialize data for inclusion in a prompt
+    
+    Values orjson cannot serialize natively are converted with str().
+    
+    Args:
+        data: Data to serialize
+    
+    Returns:
+        Indented JSON text
+    """
+    return orjson.dumps(data, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
+
+
+# Lists under these keys are conversations, ordered oldest first, where the newest
+# items matter most
+_RECENT_ITEMS_KEYS = frozenset(("history", "chat_history", "messages", "conversation"))
+
+
+def _truncate_lists(data: Any, max_items: int, keep_recent: bool = False) -> Any:
+    """
+    Shorten long lists in nested data to their first and last items
+    
+    Args:
+        data: Data to shorten
+        max_items: Maximum number of items to keep from each list
+        keep_recent: Whether data is a conversation, which keeps its last items only
+    
+    Returns:
+        The data with each long list replaced by its first and last items (or, for
+        conversations, its last items) and a marker with the number of items left out
+    """
+    if isinstance(data, dict):
+        return {
+            key: _truncate_lists(value, max_items, key in _RECENT_ITEMS_KEYS)
+            for key, value in data.items()
+        }
+    if not isinstance(data, list):
+        return data
+    
+    if len(data) <= max_items:
+        return [_truncate_lists(item, max_items) for item in data]
+    
+    if keep_recent:
+        keep = max(max_items, 1)
+        return [{"_truncated": len(data) - keep}] + [_truncate_lists(item, max_items) for item in data[-keep:]]
+    
+    keep = max(max_items // 2, 1)
+    marker = {"_truncated": len(data) - 2 * keep}
+    # Keep the status breakdown of the whole list so aggregate questions can still be answered
+    statuses = Counter(item["status"] for item in data if isinstance(item, dict) and "status" in item)
+    if statuses:
+        marker["_counts_by_status"] = dict(statuses)
+    return [_truncate_lists(item, max_items) for item in data[:keep]] + [marker] + \
+        [_truncate_lists(item, max_items) for item in data[-keep:]]
+
+
+def _summarize_for_prompt(data: Any, max_items: int = 20, max_chars: int = 8000) -> str:
+    """
+    Serialize data for a prompt, limited to a representative sample
+    
+    Args:
+        data: Data to include in the prompt
+        max_items: Maximum number of items to keep from each list
+        max_chars: Length the returned text should stay within
+    
+    Returns:
+        Indented JSON text. Lists are shortened further, by whole items, until the
+        text fits in max_chars, so the result is always valid JSON
+    """
+    text = _to_prompt_json(_truncate_lists(data, max_items))
+    while len(text) > max_chars and max_items > 1:
+        max_items //= 2
+        text = _to_prompt_json(_truncate_lists(data, max_items))
+    return text
+
+
+def _extract_json(text: str) -> str:
+    """
+    Get the JSON part of an LLM reply
+    
+    Uses plain string searches rather than a regex: the fenced block if there is one,
+    otherwise the outermost braces, otherwise the text itself.
+    
+    Args:
+        text: Reply text from the LLM
+    
+    Returns:
+        The JSON content of the reply
+    """
+    text = text.strip()
+    if text.startswith("{"):
+        return text
+    
+    fence_start = text.find("```")
+    if fence_start != -1:
+        fence_end = text.find("```", fence_start + 3)
+        if fence_end != -1:
+            content = text[fence_start + 3:fence_end]
+            if content.startswith("json"):
+                content = content[4:]
+            return content.strip()
+    
+    object_start = text.find("{")
+    object_end = text.rfind("}")
+    if object_start != -1 and object_end > object_start:
+        return text[object_start:object_end + 1]
+    return text
+
+
+def _extract_parameters(path: str, method: str, params_json: str, user_message: str) -> bytes:
+    """
+    Ask OpenAI for the parameter values of an API call mentioned in a user message
+    
+    Args:
+        path: Path of the API endpoint
+        method: HTTP method of the API endpoint
+        params_json: JSON description of the endpoint's parameters
+        user_message: The user's message to extract parameters from
+    
+    Returns:
+        JSON object bytes with the extracted parameter values
+    """
+    prompt = f"""
+            API: {path} ({method})
+            Required parameters: {params_json}
+            User message: "{user_message}"
+            """
+    extraction_response = _get_openai_client().chat.completions.create(
+        model="gpt-4o",
+        messages=ChatbotService._build_messages(prompt, PARAMETER_EXTRACTION_INSTRUCTIONS),
+        temperature=0.1
+    )
+    extraction_text = extraction_response.choices[0].message.content
+    # Re-serialize so invalid output raises here instead of being cached
+    return orjson.dumps(orjson.loads(_extract_json(extraction_text)))
+
+
+# Repeated read-only questions ("show open jobs") skip the extraction round-trip.
+# The cached value is serialized JSON, so callers always get a fresh dict to modify.
+_extract_parameters_cached = lru_cache(maxsize=PARAMETER_EXTRACTION_CACHE_SIZE)(_extract_parameters)
+
+
+def _normalize_message(message: str) -> str:
+    """
+    Normalize a user message for use as a cache key
+    
+    Whitespace is collapsed and surrounding punctuation is stripped. Case is kept
+    because document IDs in the message are case-sensitive.
+    
+    Args:
+        message: The user's message
+    
+    Returns:
+        Normalized message
+    """
+    return " ".join(message.split()).strip(string.punctuation + " ")
+
+
 class ChatbotService:
     """Service for handling chatbot interactions"""
 
@@ -156,10 +413,14 @@ class ChatbotService:
         ]
     
     @staticmethod
+    @lru_cache(maxsize=1)
     def _get_system_prompt() -> str:
         """
         Get the system prompt for the chatbot
         
+        The prompt is generated from the static API registry, so it is built once and
+        the same string object is returned on every later call.
+        
         Returns:
             System prompt string
         """
@@ -381,6 +642,57 @@ You are now ready to help users interact with the Interview Scheduler API using
 These collections are related: jobs → candidates_data → interview_candidates → final_candidates
 """
 
+    @staticmethod
+    @lru_cache(maxsize=1)
+    def _get_base_system_prefix() -> str:
+        """
+        Get the static system prefix shared by every OpenAI call
+        
+        The API documentation and database schema never change between requests, so they
+        are sent first and byte-identical each time. That lets the provider reuse the
+        cached prefix instead of re-processing it on every call.
+        
+        Returns:
+            System prompt followed by the database schema
+        """
+        return ChatbotService._get_system_prompt() + "\n\nDATABASE SCHEMA:\n" + ChatbotService._get_database_schema()
+    
+    @staticmethod
+    def _build_messages(user_content: str, task_instructions: Optional[str] = None) -> List[Dict[str, str]]:
+        """
+        Build the messages for an OpenAI call with the shared static prefix first
+        
+        Args:
+            user_content: Request-specific content for the user message
+            task_instructions: Optional static instructions for this kind of call
+        
+        Returns:
+            List of chat messages
+        """
+        messages = [{"role": "system", "content": ChatbotService._get_base_system_prefix()}]
+        if task_instructions:
+            messages.append({"role": "system", "content": task_instructions})
+        messages.append({"role": "user", "content": user_content})
+        return messages
+    
+    @staticmethod
+    def _find_explicit_ids(message: str) -> Dict[str, str]:
+        """
+        Find the job, candidate and interview IDs stated explicitly in a message
+        
+        Args:
+            message: The user's message
+        
+        Returns:
+            Dictionary mapping parameter name (job_id, candidate_id, interview_id) to ID
+        """
+        ids = {}
+        for param_name, pattern in _EXPLICIT_ID_PATTERNS.items():
+            match = pattern.search(message)
+            if match:
+                ids[param_name] = match.group(1)
+        return ids
+    
     @staticmethod
     def _fetch_relevant_data(message: str) -> Dict[str, Any]:
         """
@@ -395,86 +707,95 @@ These collections are related: jobs → candidates_data → interview_candidates
         data = {}
         
         try:
-            # Extract job_id from the message if present
-            job_id_match = re.search(r'job id[:\s-]*([a-zA-Z0-9-]+)', message, re.IGNORECASE)
-            job_id = job_id_match.group(1) if job_id_match else None
-            
-            # Extract candidate_id from the message if present
-            candidate_id_match = re.search(r'candidate id[:\s-]*([a-zA-Z0-9-]+)', message, re.IGNORECASE)
-            candidate_id = candidate_id_match.group(1) if candidate_id_match else None
-            
-            # Extract interview_id from the message if present
-            interview_id_match = re.search(r'interview id[:\s-]*([a-zA-Z0-9-]+)', message, re.IGNORECASE)
-            interview_id = interview_id_match.group(1) if interview_id_match else None
-            
-            # If a specific job ID is mentioned, get job details
-            if job_id and "job" not in data:
-                job = JobService.get_job_posting(job_id)
-                if job:
-                    data["job"] = ChatbotService._make_serializable(job)
-            
-            # If the message mentions "final offer" or related terms, fetch final candidates data
-            if any(term in message.lower() for term in ["final offer", "offer letter", "selected", "hiring"]) and job_id:
-                try:
-                    # Get final candidates for the job using service
-                    final_candidates = FinalSelectionService.get_final_candidates_by_job(job_id)
-                    if final_candidates:
-                        data["final_candidates"] = ChatbotService._make_serializable(final_candidates)
-                    
-                    # Get interview candidates for the job
-                    interview_candidates = InterviewService.get_interview_candidates_by_job_id(job_id)
-                    if interview_candidates:
-                        data["interview_candidates"] = ChatbotService._make_serializable(interview_candidates)
+            # Extract the job, candidate and interview IDs from the message if present
+            explicit_ids = ChatbotService._find_explicit_ids(message)
+            job_id = explicit_ids.get("job_id")
+            candidate_id = explicit_ids.get("candidate_id")
+            interview_id = explicit_ids.get("interview_id")
+            
+            message_lower = message.lower()
+            wants_offers = bool(job_id) and any(
+                term in message_lower for term in _OFFER_TERMS
+            )
+            wants_statistics = bool(job_id) and any(
+                term in message_lower for term in _STATISTICS_TERMS
+            )
+            
+            # The lookups are independent, so run them concurrently rather than one after another
+            with ThreadPoolExecutor(max_workers=6) as executor:
+                job_future = executor.submit(JobService.get_job_posting, job_id) if job_id else None
+                final_future = interviews_future = None
+                if wants_offers:
+                    final_future = executor.submit(FinalSelectionService.get_final_candidates_by_job_id, job_id)
+                    interviews_future = executor.submit(InterviewService.get_interview_candidates_by_job_id, job_id)
+                statistics_future = (
+                    executor.submit(InterviewService.get_tracking_statistics_by_job, job_id)
+                    if wants_statistics else None
+                )
+                candidate_future = executor.submit(CandidateService.get_candidate, candidate_id) if candidate_id else None
+                interview_future = (
+                    executor.submit(InterviewService.get_interview_candidate, interview_id) if interview_id else None
+                )
+                
+                # If a specific job ID is mentioned, get job details
+                if job_future:
+                    job = job_future.result()
+                    if job:
+                        data["job"] = ChatbotService._make_serializable(job)
+                
+                # If the message mentions "final offer" or related terms, fetch final candidates data
+                if wants_offers:
+                    try:
+                        final_candidates = final_future.result()
+                        if final_candidates:
+                            data["final_candidates"] = ChatbotService._make_serializable(final_candidates)
                         
-                        # Get candidate details from interview candidates
-                        for interview in interview_candidates:
-                            candidate_id = getattr(interview, "candidate_id", None)
-                            if candidate_id and "candidates" not in data:
-                                data["candidates"] = []
+                        interview_candidates = interviews_future.result()
+                        if interview_candidates:
+                            data["interview_candidates"] = ChatbotService._make_serializable(interview_candidates)
+                            
+                            # Get candidate details for the interview candidates in one batched read
+                            candidates = CandidateService.get_candidates_bulk(
+                                [interview.get("candidate_id") for interview in interview_candidates]
+                            )
+                            if candidates:
+                                data["candidates"] = ChatbotService._make_serializable(list(candidates.values()))
+                    except Exception as service_error:
+                        logging.error(f"Error fetching final candidates data: {service_error}")
+                
+                # If the message is about statistics or performance
+                if statistics_future:
+                    try:
+                        statistics = statistics_future.result()
+                        if statistics:
+                            data["interview_statistics"] = ChatbotService._make_serializable(statistics)
+                    except Exception as stats_error:
+                        logging.error(f"Error fetching interview statistics: {stats_error}")
+                
+                # If a specific candidate ID is mentioned
+                if candidate_future:
+                    try:
+                        candidate = candidate_future.result()
+                        if candidate:
+                            data["candidate"] = ChatbotService._make_serializable(candidate)
+                    except Exception as candidate_error:
+                        logging.error(f"Error fetching candidate: {candidate_error}")
+                
+                # If a specific interview ID is mentioned
+                if interview_future:
+                    try:
+                        interview = interview_future.result()
+                        if interview:
+                            data["interview"] = ChatbotService._make_serializable(interview)
                             
-                            if candidate_id:
-                                candidate = CandidateService.get_candidate_by_id(candidate_id)
+                            # Get candidate for this interview
+                            interview_candidate_id = interview.get("candidate_id")
+                            if interview_candidate_id:
+                                candidate = CandidateService.get_candidate(interview_candidate_id)
                                 if candidate:
-                                    if "candidates" not in data:
-                                        data["candidates"] = []
-                                    data["candidates"].append(ChatbotService._make_serializable(candidate))
-                except Exception as service_error:
-                    logging.error(f"Error fetching final candidates data: {service_error}")
-            
-            # If the message is about statistics or performance
-            if any(term in message.lower() for term in ["statistics", "performance", "metrics", "tracking"]) and job_id:
-                try:
-                    # Get interview statistics using service
-                    statistics = InterviewService.get_tracking_statistics_by_job(job_id)
-                    if statistics:
-                        data["interview_statistics"] = ChatbotService._make_serializable(statistics)
-                except Exception as stats_error:
-                    logging.error(f"Error fetching interview statistics: {stats_error}")
-            
-            # If a specific candidate ID is mentioned
-            if candidate_id:
-                try:
-                    candidate = CandidateService.get_candidate_by_id(candidate_id)
-                    if candidate:
-                        data["candidate"] = ChatbotService._make_serializable(candidate)
-                except Exception as candidate_error:
-                    logging.error(f"Error fetching candidate: {candidate_error}")
-            
-            # If a specific interview ID is mentioned
-            if interview_id:
-                try:
-                    interview = InterviewService.get_interview_candidate(interview_id)
-                    if interview:
-                        data["interview"] = ChatbotService._make_serializable(interview)
-                        
-                        # Get candidate for this interview
-                        candidate_id = getattr(interview, "candidate_id", None)
-                        if candidate_id:
-                            candidate = CandidateService.get_candidate_by_id(candidate_id)
-                            if candidate:
-                                data["candidate"] = ChatbotService._make_serializable(candidate)
-                except Exception as interview_error:
-                    logging.error(f"Error fetching interview: {interview_error}")
+                                    data["candidate"] = ChatbotService._make_serializable(candidate)
+                    except Exception as interview_error:
+                        logging.error(f"Error fetching interview: {interview_error}")
                     
         except Exception as e:
             logging.error(f"Error fetching relevant data: {str(e)}")
@@ -503,40 +824,21 @@ These collections are related: jobs → candidates_data → interview_candidates
             if not conversation_id:
                 conversation_id = str(uuid.uuid4())
             
-            # Set up LLM chain - optimized to skip history retrieval
-            chain = ChatbotService.create_llm_chain()
-            
-            # Fetch relevant data from Firebase based on the user's message
-            db_context = ChatbotService._fetch_relevant_data(message)
-            
-            # Include all context
-            input_text = message
-            context_parts = []
-            
-            # Add database schema information
-            context_parts.append("DATABASE SCHEMA:\n" + ChatbotService._get_database_schema())
-            
-            # Add fetched data context
-            if db_context:
-                context_parts.append("RELEVANT DATA FROM DATABASE:\n" + json.dumps(db_context, indent=2))
+            # Templated requests go straight to their endpoint without an OpenAI call
+            planned_call = ChatbotService._match_fast_path(message)
+            if planned_call:
+                return ChatbotService._complete_response("", planned_call, message, conversation_id)
             
-            # Add any additional context provided
-            if context:
-                context_parts.append("ADDITIONAL CONTEXT:\n" + json.dumps(context, indent=2))
-            
-            # Add combined context if any context parts exist
-            if context_parts:
-                input_text += "\n\n" + "\n\n".join(context_parts)
+            input_text = ChatbotService._build_input_text(message, context)
             
             try:
                 # Generate response from OpenAI using the new API format (>=1.0.0)
-                client = openai.OpenAI()  # Create a client instance
+                client = _get_openai_client()
                 response = client.chat.completions.create(
                     model="gpt-4o",
-                    messages=[
-                        {"role": "system", "content": ChatbotService._get_system_prompt()},
-                        {"role": "user", "content": input_text}
-                    ],
+                    messages=ChatbotService._build_messages(input_text),
+                    tools=[ChatbotService._get_api_call_tool()],
+                    tool_choice="auto",
                     temperature=0.2
                 )
             except Exception as e:
@@ -544,42 +846,278 @@ These collections are related: jobs → candidates_data → interview_candidates
                 raise HTTPException(status_code=500, detail=f"Error with OpenAI: {str(e)}")
             
             # Extract the response text - updated for new OpenAI API response format
-            full_response_text = response.choices[0].message.content
+            response_message = response.choices[0].message
+            return ChatbotService._complete_response(
+                response_message.content or "",
+                ChatbotService._parse_planned_call(response_message),
+                message,
+                conversation_id
+            )
+            
+        except Exception as e:
+            logging.error(f"Error generating chatbot response: {str(e)}")
+            raise HTTPException(status_code=500, detail=f"Error generating response: {str(e)}")
+    
+    @staticmethod
+    def generate_response_stream(
+        message: str, 
+        conversation_id: Optional[str] = None,
+        context: Optional[Dict[str, Any]] = None
+    ) -> Iterator[Tuple[str, Any]]:
+        """
+        Generate a response using the chatbot, streaming the reply as it is produced
+        
+        A "start" event carries the conversation ID, "token" events carry the response
+        text as the model produces it, and a final "result" event carries the same
+        dictionary generate_response returns (or an "error" event on failure).
+        
+        Args:
+            message: The user's message
+            conversation_id: Optional conversation ID to continue
+            context: Optional additional context for the LLM
+        
+        Yields:
+            Tuples of (event name, JSON serializable payload)
+        """
+        if not conversation_id:
+            conversation_id = str(uuid.uuid4())
+        yield "start", {"conversation_id": conversation_id}
+        
+        try:
+            planned_call = ChatbotService._match_fast_path(message)
+            if planned_call:
+                result = ChatbotService._complete_response("", planned_call, message, conversation_id)
+                yield "result", ChatbotService._make_serializable(result)
+                return
             
-            # Trim content from "### Result" to "#" as requested
-            response_text = full_response_text
-            result_marker = "```"
-            end_marker = "```"
+            input_text = ChatbotService._build_input_text(message, context)
+            stream = _get_openai_client().chat.completions.create(
+                model="gpt-4o",
+                messages=ChatbotService._build_messages(input_text),
+                tools=[ChatbotService._get_api_call_tool()],
+                tool_choice="auto",
+                temperature=0.2,
+                stream=True
+            )
             
-            if result_marker in full_response_text:
-                result_section_start = full_response_text.find(result_marker)
-                # Find the next occurrence of # after the result_marker
-                end_section = full_response_text.find(end_marker, result_section_start + len(result_marker))
-                
-                if end_section > result_section_start:
-                    # Extract only the content between the markers, excluding the markers themselves
-                    trimmed_content = full_response_text[result_section_start + len(result_marker):end_section].strip()
-                    response_text = trimmed_content
-            
-            # Parse the response to extract any API calls that were made
-            api_call_info = ChatbotService._extract_api_call_info(response_text)
-            executed_action = None
-            
-            # Execute the API call if identified
-            if api_call_info:
-                executed_action = ChatbotService._execute_api_call(api_call_info, message)
-                
-            # Set a minimal response structure
+            text_parts = []
+            tool_arguments = []
+            has_tool_call = False
+            for chunk in stream:
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta
+                if delta.content:
+                    text_parts.append(delta.content)
+                    yield "token", {"content": delta.content}
+                if delta.tool_calls:
+                    # Only the first tool call is used, as in the non-streaming path
+                    for tool_call in delta.tool_calls:
+                        if tool_call.index == 0 and tool_call.function and tool_call.function.arguments:
+                            has_tool_call = True
+                            tool_arguments.append(tool_call.function.arguments)
+            
+            planned_call = None
+            if has_tool_call:
+                response_message = SimpleNamespace(tool_calls=[
+                    SimpleNamespace(function=SimpleNamespace(arguments="".join(tool_arguments)))
+                ])
+                planned_call = ChatbotService._parse_planned_call(response_message)
+            
+            result = ChatbotService._complete_response("".join(text_parts), planned_call, message, conversation_id)
+            yield "result", ChatbotService._make_serializable(result)
+        except Exception as e:
+            logging.error(f"Error streaming chatbot response: {str(e)}")
+            yield "error", {"detail": f"Error generating response: {str(e)}"}
+    
+    @staticmethod
+    def _build_input_text(message: str, context: Optional[Dict[str, Any]] = None) -> str:
+        """
+        Build the user message for the main completion from the message and its context
+        
+        Args:
+            message: The user's message
+            context: Optional additional context for the LLM
+        
+        Returns:
+            User message text with the relevant database data and context appended
+        """
+        # Fetch relevant data from Firebase based on the user's message
+        db_context = ChatbotService._fetch_relevant_data(message)
+        
+        # Include all context
+        input_text = message
+        context_parts = []
+        
+        # Add fetched data context
+        if db_context:
+            context_parts.append("RELEVANT DATA FROM DATABASE:\n" + _summarize_for_prompt(db_context))
+        
+        # Add any additional context provided
+        if context:
+            context_parts.append("ADDITIONAL CONTEXT:\n" + _summarize_for_prompt(context))
+        
+        # Add combined context if any context parts exist
+        if context_parts:
+            input_text += "\n\n" + "\n\n".join(context_parts)
+        
+        return input_text
+    
+    @staticmethod
+    def _complete_response(
+        full_response_text: str,
+        planned_call: Optional[Tuple[Dict[str, Any], Dict[str, Any]]],
+        message: str,
+        conversation_id: str
+    ) -> Dict[str, Any]:
+        """
+        Execute the API call chosen by the model and build the response dictionary
+        
+        Args:
+            full_response_text: Text of the model's reply
+            planned_call: Planned (api_call_info, params) from a tool call, if any
+            message: The user's message
+            conversation_id: Conversation ID
+        
+        Returns:
+            Response dictionary containing the assistant's message and metadata
+        """
+        # When the model planned the API call as a structured tool call, the endpoint and
+        # its parameters come back together and no separate extraction call is needed
+        if planned_call:
+            api_call_info, planned_params = planned_call
+            if not full_response_text:
+                full_response_text = f"Executing {api_call_info['method']} {api_call_info['path']}"
+            executed_action = ChatbotService._execute_api_call(api_call_info, message, planned_params)
             return {
-                "response": response_text,
+                "response": full_response_text,
                 "conversation_id": conversation_id,
                 "executed_action": executed_action,
                 "action_result": executed_action.get("result") if executed_action else None
             }
+        
+        # Trim content from "### Result" to "#" as requested
+        response_text = full_response_text
+        result_marker = "```"
+        end_marker = "```"
+        
+        if result_marker in full_response_text:
+            result_section_start = full_response_text.find(result_marker)
+            # Find the next occurrence of # after the result_marker
+            end_section = full_response_text.find(end_marker, result_section_start + len(result_marker))
             
-        except Exception as e:
-            logging.error(f"Error generating chatbot response: {str(e)}")
-            raise HTTPException(status_code=500, detail=f"Error generating response: {str(e)}")
+            if end_section > result_section_start:
+                # Extract only the content between the markers, excluding the markers themselves
+                trimmed_content = full_response_text[result_section_start + len(result_marker):end_section].strip()
+                response_text = trimmed_content
+        
+        # Parse the response to extract any API calls that were made
+        api_call_info = ChatbotService._extract_api_call_info(response_text)
+        executed_action = None
+        
+        # Execute the API call if identified
+        if api_call_info:
+            executed_action = ChatbotService._execute_api_call(api_call_info, message)
+            
+        # Set a minimal response structure
+        return {
+            "response": response_text,
+            "conversation_id": conversation_id,
+            "executed_action": executed_action,
+            "action_result": executed_action.get("result") if executed_action else None
+        }
+    
+    @staticmethod
+    @lru_cache(maxsize=1)
+    def _get_api_call_tool() -> Dict[str, Any]:
+        """
+        Get the function-calling tool definition used to plan an API call
+        
+        The registry is static, so its paths and methods are collected and sorted once
+        and the same definition is returned on every later call.
+        
+        Returns:
+            OpenAI tool definition with the registry's paths and methods as enums
+        """
+        registry = ChatbotService._get_api_registry()
+        return {
+            "type": "function",
+            "function": {
+                "name": "execute_api_call",
+                "description": "Execute one Interview Scheduler API endpoint with the parameters extracted from the user's message",
+                "parameters": {
+                    "type": "object",
+                    "properties": {
+                        "path": {
+                            "type": "string",
+                            "enum": sorted({endpoint['path'] for endpoint in registry}),
+                            "description": "Endpoint path exactly as documented, with path parameters left as placeholders"
+                        },
+                        "method": {
+                            "type": "string",
+                            "enum": sorted({endpoint['method'] for endpoint in registry})
+                        },
+                        "params": {
+                            "type": "object",
+                            "description": "Parameter names and values extracted from the user's message"
+                        }
+                    },
+                    "required": ["path", "method", "params"]
+                }
+            }
+        }
+    
+    @staticmethod
+    def _parse_planned_call(response_message) -> Optional[Tuple[Dict[str, Any], Dict[str, Any]]]:
+        """
+        Read a planned API call from the tool call in an OpenAI response message
+        
+        Args:
+            response_message: Message from the chat completion response
+        
+        Returns:
+            Tuple of (api_call_info, params), or None if no valid tool call was made
+        """
+        tool_calls = getattr(response_message, "tool_calls", None)
+        if not tool_calls:
+            return None
+        
+        try:
+            arguments = orjson.loads(tool_calls[0].function.arguments)
+        except (ValueError, AttributeError) as e:
+            logging.error(f"Could not parse planned API call: {e}")
+            return None
+        
+        path = arguments.get("path")
+        method = arguments.get("method")
+        for endpoint in ChatbotService._get_api_registry():
+            if endpoint['path'] == path and endpoint['method'] == method:
+                api_call_info = {"path": path, "method": method, "endpoint": endpoint, "position": 0}
+                return api_call_info, arguments.get("params") or {}
+        return None
+    
+    @staticmethod
+    def _match_fast_path(message: str) -> Optional[Tuple[Dict[str, Any], Dict[str, Any]]]:
+        """
+        Match a message against the templated requests that need no model call
+        
+        Args:
+            message: The user's message
+        
+        Returns:
+            Tuple of (api_call_info, params) like a planned tool call, or None if no template matches
+        """
+        normalized = _normalize_message(message)
+        for pattern, method, path, param_names in _FAST_PATH_ROUTES:
+            match = pattern.match(normalized)
+            if not match:
+                continue
+            for endpoint in ChatbotService._get_api_registry():
+                if endpoint['path'] == path and endpoint['method'] == method:
+                    logging.info(f"Fast path matched {method} {path}")
+                    api_call_info = {"path": path, "method": method, "endpoint": endpoint, "position": 0}
+                    return api_call_info, dict(zip(param_names, match.groups()))
+        return None
     
     @staticmethod
     def _extract_api_call_info(response_text: str) -> Optional[Dict[str, Any]]:
@@ -613,17 +1151,22 @@ These collections are related: jobs → candidates_data → interview_candidates
             return None
         
         # Choose the API call that was mentioned first
-        api_calls.sort(key=lambda x: x['position'])
-        return api_calls[0]
+        return min(api_calls, key=itemgetter('position'))
     
     @staticmethod
-    def _execute_api_call(api_call_info: Dict[str, Any], user_message: str) -> Dict[str, Any]:
+    def _execute_api_call(
+        api_call_info: Dict[str, Any],
+        user_message: str,
+        planned_params: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
         """
         Execute an API call based on extracted information
         
         Args:
             api_call_info: Dictionary with API call information
             user_message: The user's message to extract parameters from
+            planned_params: Optional parameters already extracted by the planning call;
+                when given, no separate extraction call is made
         
         Returns:
             Dictionary with API call results
@@ -640,17 +1183,13 @@ These collections are related: jobs → candidates_data → interview_candidates
             job_role_mentioned = False
             job_role_name = None
             
-            # Keywords that might indicate job role names in the message
-            job_role_keywords = [
-                "developer", "engineer", "manager", "designer", "analyst", 
-                "scientist", "specialist", "coordinator", "associate", "lead"
-            ]
-            
             # Check for job role patterns
             if "job" in user_message.lower():
-                for keyword in job_role_keywords:
-                    pattern = rf'(?:job|position|role)\s+(?:for|as)\s+(?:a|an)?\s*([A-Za-z\s]*{keyword}[A-Za-z\s]*)'
-                    match = re.search(pattern, user_message, re.IGNORECASE)
+                keywords_present = {keyword.lower() for keyword in _JOB_ROLE_KEYWORD_SCAN.findall(user_message)}
+                for keyword, pattern in zip(_JOB_ROLE_KEYWORDS, _JOB_ROLE_PATTERNS):
+                    if keyword not in keywords_present:
+                        continue
+                    match = pattern.search(user_message)
                     if match:
                         job_role_name = match.group(1).strip()
                         job_role_mentioned = True
@@ -658,44 +1197,39 @@ These collections are related: jobs → candidates_data → interview_candidates
                 
                 # If no match with the keywords, try more generic pattern
                 if not job_role_mentioned:
-                    generic_pattern = r'(?:job|position|role)\s+(?:for|as)\s+(?:a|an)?\s*([A-Za-z\s]+)'
-                    match = re.search(generic_pattern, user_message, re.IGNORECASE)
+                    match = _GENERIC_JOB_ROLE_PATTERN.search(user_message)
                     if match:
                         potential_role = match.group(1).strip()
                         # Exclude common non-role text following "job for"
-                        if len(potential_role) > 3 and potential_role.lower() not in ["the", "this", "that"]:
+                        if len(potential_role) > 3 and potential_role.lower() not in _NON_ROLE_WORDS:
                             job_role_name = potential_role
                             job_role_mentioned = True
             
-            # Use OpenAI to extract parameters from the user message
-            prompt = f"""
-            Extract parameters from the user message for the API call:
-            
-            API: {api_call_info['path']} ({api_call_info['method']})
-            Required parameters: {json.dumps(params)}
-            User message: "{user_message}"
-            
-            Return ONLY a JSON object with parameter names as keys and extracted values.
-            """
-            
-            # Get parameter extraction from OpenAI using the new API format (>=1.0.0)
-            client = openai.OpenAI()  # Create a client instance
-            extraction_response = client.chat.completions.create(
-                model="gpt-4o",
-                messages=[{"role": "user", "content": prompt}],
-                temperature=0.1
-            )
+            client = _get_openai_client()
             
             # Parse the extraction result - updated for new OpenAI API response format
             try:
-                extraction_text = extraction_response.choices[0].message.content
-                # Extract JSON content from the response
-                json_match = re.search(r'```json\s*([\s\S]*?)\s*```|({[\s\S]*?})', extraction_text)
-                if json_match:
-                    json_content = json_match.group(1) or json_match.group(2)
-                    param_values = json.loads(json_content)
+                explicit_ids = ChatbotService._find_explicit_ids(user_message)
+                if planned_params is not None:
+                    # The planning call already returned structured parameters
+                    param_values = dict(planned_params)
+                elif not params:
+                    # Nothing to extract, so no extraction call is needed
+                    param_values = {}
+                elif all(param_name in explicit_ids for param_name in params):
+                    # Every parameter is an ID stated explicitly in the message
+                    param_values = {param_name: explicit_ids[param_name] for param_name in params}
                 else:
-                    param_values = json.loads(extraction_text)
+                    # Use OpenAI to extract parameters from the user message
+                    extraction_args = (api_call_info['path'], api_call_info['method'], orjson.dumps(params).decode())
+                    if api_call_info['method'] == "GET":
+                        # Read-only lookups are served from the cache for repeated messages
+                        params_json = _extract_parameters_cached(
+                            *extraction_args, _normalize_message(user_message)
+                        )
+                    else:
+                        params_json = _extract_parameters(*extraction_args, user_message)
+                    param_values = orjson.loads(params_json)
                 
                 # Verify all required parameters are present
                 for param_name, param_type in params.items():
@@ -706,58 +1240,24 @@ These collections are related: jobs → candidates_data → interview_candidates
                             if job_role_mentioned and job_role_name:
                                 try:
                                     print(f"Looking for job with role name: '{job_role_name}'")
-                                    # Get all jobs and find matching role
-                                    all_jobs = JobService.get_all_job_postings()
-                                    
-                                    # Find job with matching role name
-                                    for job in all_jobs:
-                                        job_role = None
-                                        if hasattr(job, "job_role_name"):
-                                            job_role = job.job_role_name
-                                        elif isinstance(job, dict) and "job_role_name" in job:
-                                            job_role = job["job_role_name"]
-                                        
-                                        # Check if this job's role name contains our search term
-                                        if job_role and job_role_name.lower() in job_role.lower():
-                                            # Found a matching job
-                                            if hasattr(job, "job_id"):
-                                                param_values["job_id"] = job.job_id
-                                                print(f"Found job with ID {job.job_id} matching '{job_role_name}'")
-                                                break
-                                            elif hasattr(job, "id"):
-                                                param_values["job_id"] = job.id
-                                                print(f"Found job with ID {job.id} matching '{job_role_name}'")
-                                                break
-                                            elif isinstance(job, dict) and "job_id" in job:
-                                                param_values["job_id"] = job["job_id"]
-                                                print(f"Found job with ID {job['job_id']} matching '{job_role_name}'")
-                                                break
-                                            elif isinstance(job, dict) and "id" in job:
-                                                param_values["job_id"] = job["id"]
-                                                print(f"Found job with ID {job['id']} matching '{job_role_name}'")
-                                                break
-                                    
-                                    # If no matching job found, fall back to first job
-                                    if "job_id" not in param_values and all_jobs and len(all_jobs) > 0:
-                                        first_job = all_jobs[0]
-                                        print("No exact match found, using first available job")
-                                        if hasattr(first_job, "job_id"):
-                                            param_values["job_id"] = first_job.job_id
-                                        elif hasattr(first_job, "id"):
-                                            param_values["job_id"] = first_job.id
-                                        elif isinstance(first_job, dict) and "job_id" in first_job:
-                                            param_values["job_id"] = first_job["job_id"]
-                                        elif isinstance(first_job, dict) and "id" in first_job:
-                                            param_values["job_id"] = first_job["id"]
-                                        else:
-                                            param_values["job_id"] = "default_job_id"
+                                    matching_job_id = JobService.find_job_id_by_role_name(job_role_name)
+                                    if matching_job_id:
+                                        param_values["job_id"] = matching_job_id
+                                        print(f"Found job with ID {matching_job_id} matching '{job_role_name}'")
+                                    else:
+                                        # If no matching job found, fall back to first job
+                                        first_jobs = JobService.get_all_job_postings(limit=1)
+                                        if first_jobs:
+                                            print("No exact match found, using first available job")
+                                            param_values["job_id"] = first_jobs[0].job_id
                                 except Exception as e:
                                     print(f"Error finding job by role name: {e}")
                                     param_values["job_id"] = "default_job_id"
                             else:
-                                # Fall back to default behavior if no job role mentioned
+                                # Fall back to default behavior if no job role mentioned;
+                                # only the first job is needed, so only one is fetched
                                 try:
-                                    all_jobs = JobService.get_all_job_postings()
+                                    all_jobs = JobService.get_all_job_postings(limit=1)
                                     if all_jobs and len(all_jobs) > 0:
                                         first_job = all_jobs[0]
                                         if hasattr(first_job, "job_id"):
@@ -836,31 +1336,17 @@ These collections are related: jobs → candidates_data → interview_candidates
                 
                 # Get additional details from OpenAI if needed
                 if not job_role_name or not job_description or not years_of_experience:
-                    job_prompt = f"""
-                    Extract the following job details from this message: "{user_message}"
-                    
-                    Return ONLY a JSON object with these fields:
-                    - job_role_name: The name/title of the job position
-                    - job_description: A brief description of the job
-                    - years_of_experience_needed: Required years of experience
-                    - status: Job status (open/closed), default to "open" if not specified
-                    - location: Job location (remote or city name), default to "remote" if not specified
-                    """
+                    job_prompt = f'Message: "{user_message}"'
                     
                     try:
                         job_extraction = client.chat.completions.create(
                             model="gpt-4o",
-                            messages=[{"role": "user", "content": job_prompt}],
+                            messages=ChatbotService._build_messages(job_prompt, JOB_EXTRACTION_INSTRUCTIONS),
                             temperature=0.1
                         )
                         
                         job_extraction_text = job_extraction.choices[0].message.content
-                        json_match = re.search(r'```json\s*([\s\S]*?)\s*```|({[\s\S]*?})', job_extraction_text)
-                        if json_match:
-                            json_content = json_match.group(1) or json_match.group(2)
-                            job_data = json.loads(json_content)
-                        else:
-                            job_data = json.loads(job_extraction_text)
+                        job_data = orjson.loads(_extract_json(job_extraction_text))
                         
                         job_role_name = job_data.get("job_role_name") or job_role_name or "Default Job Title"
                         job_description = job_data.get("job_description") or job_description or "Default job description"
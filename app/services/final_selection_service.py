@@ -1,7 +1,12 @@
 """
 Final candidate selection and offer letter service
 """
+import asyncio
+import copy
+import logging
+import time
 import uuid
+from operator import itemgetter
 from typing import Dict, Any, List, Optional, Tuple
 from fastapi import BackgroundTasks
 
@@ -11,6 +16,22 @@ from app.services.candidate_service import CandidateService
 from app.services.job_service import JobService
 from app.utils.email_service import EmailService
 from app.schemas.final_candidate_schema import FinalCandidateCreate, FinalCandidateResponse
+from app.schemas.job_schema import JobPostingResponse
+
+logger = logging.getLogger(__name__)
+
+# Rankings are reused while the feedback they were computed from is unchanged.
+# Entries older than the TTL are recomputed so candidate details changed behind our
+# back are eventually picked up again.
+RANKING_CACHE_TTL_SECONDS = 300
+
+# Fields read from interview_candidates for ranking; the feedback array itself is
+# only fetched for the top candidate
+RANKING_FIELDS = ['id', 'candidate_id', 'feedback_summary']
+# Cached rankings hold each entry as a tuple of these fields rather than a dict copy
+RANKED_ENTRY_FIELDS = ('candidate_id', 'interview_candidate_id', 'total_score', 'feedback')
+_ranked_entry_values = itemgetter(*RANKED_ENTRY_FIELDS)
+_ranking_cache: Dict[str, Dict[str, Any]] = {}
 
 
 class FinalSelectionService:
@@ -40,10 +61,10 @@ class FinalSelectionService:
                 candidate_data
             )
             
-            print(f"Final candidate record created with ID: {doc_id}")
+            logger.info("Final candidate record created with ID: %s", doc_id)
             return doc_id
         except Exception as e:
-            print(f"Error creating final candidate record: {e}")
+            logger.exception("Error creating final candidate record: %s", e)
             raise
     
     @staticmethod
@@ -80,8 +101,9 @@ class FinalSelectionService:
         Returns:
             List of final candidates for the job
         """
-        all_candidates = FinalSelectionService.get_all_final_candidates()
-        return [c for c in all_candidates if c.get('job_id') == job_id]
+        # Equality filter on the automatically indexed job_id field, so the read
+        # is bounded by the job's own offers rather than the whole collection
+        return FirestoreDB.execute_query(FinalSelectionService.COLLECTION_NAME, 'job_id', '==', job_id)
     
     @staticmethod
     def calculate_candidate_score(feedback_list: List[Dict[str, Any]]) -> int:
@@ -94,161 +116,379 @@ class FinalSelectionService:
         Returns:
             Total score
         """
-        total_score = 0
-        for feedback in feedback_list:
-            rating = feedback.get('rating_out_of_10')
-            if rating is not None:  # Only count ratings that are not None
-                total_score += rating
-        return total_score
+        if len(feedback_list) == 1:
+            return InterviewCoreService.parse_rating(feedback_list[0].get('rating_out_of_10')) or 0
+        
+        # Unset ratings (None) count as zero
+        return sum(
+            InterviewCoreService.parse_rating(feedback.get('rating_out_of_10')) or 0
+            for feedback in feedback_list
+        )
     
     @staticmethod
-    def stackrank_candidates(job_id: str) -> List[Dict[str, Any]]:
+    def _ranking_fingerprint(interview_candidates: List[Dict[str, Any]]) -> Tuple:
+        """
+        Build a hashable fingerprint of the feedback fields that ranking depends on
+        
+        Args:
+            interview_candidates: Interview candidates for a job
+        
+        Returns:
+            Tuple that changes whenever a rating or decision changes (and, when full
+            documents were read, whenever an interviewer changes)
+        """
+        return tuple(
+            (
+                candidate.get('id'),
+                candidate.get('candidate_id'),
+                tuple(
+                    (
+                        feedback.get('rating_out_of_10'),
+                        feedback.get('isSelectedForNextRound'),
+                        feedback.get('interviewer_name'),
+                        feedback.get('interviewer_email')
+                    )
+                    for feedback in candidate['feedback']
+                ) if 'feedback' in candidate else tuple(sorted(candidate.get('feedback_summary', {}).items()))
+            )
+            for candidate in interview_candidates
+        )
+    
+    @staticmethod
+    def get_ranking_inputs(job_id: str) -> List[Dict[str, Any]]:
+        """
+        Fetch the interview candidates for a job with only the fields ranking needs
+        
+        Candidates written before feedback summaries existed have no summary; if any
+        is found, the full documents are fetched instead.
+        
+        Args:
+            job_id: ID of the job
+        
+        Returns:
+            List of interview candidates with id, candidate_id and feedback_summary
+        """
+        candidates = InterviewCoreService.get_interview_candidates_by_job_id(job_id, projection=RANKING_FIELDS)
+        if any('feedback_summary' not in candidate for candidate in candidates):
+            return InterviewCoreService.get_interview_candidates_by_job_id(job_id)
+        return candidates
+    
+    @staticmethod
+    def stackrank_candidates(
+        job_id: str,
+        interview_candidates: Optional[List[Dict[str, Any]]] = None,
+        existing_offers: Optional[List[Dict[str, Any]]] = None,
+        job_data: Optional[JobPostingResponse] = None
+    ) -> Tuple[List[Dict[str, Any]], Optional[Dict[str, Any]]]:
         """
         Stack rank candidates for a job based on interview feedback scores
         
         Args:
             job_id: ID of the job
+            interview_candidates: Optional pre-fetched interview candidates for the job
+            existing_offers: Optional pre-fetched final candidates for the job
+            job_data: Optional pre-fetched job posting
         
         Returns:
-            Sorted list of candidates with their scores
+            Tuple of (sorted list of candidates with their scores, candidate details of the
+            top candidate or None). When ranking from feedback summaries, only the top
+            candidate carries its feedback array.
         """
         try:
-            # Get all interview candidates for the job
-            interview_candidates = InterviewCoreService.get_interview_candidates_by_job_id(job_id)
+            # Get the ranking fields for the job's interview candidates unless the caller already fetched them
+            if interview_candidates is None:
+                interview_candidates = FinalSelectionService.get_ranking_inputs(job_id)
             
             if not interview_candidates:
-                print(f"No interview candidates found for job {job_id}")
-                return []
+                logger.debug("No interview candidates found for job %s", job_id)
+                return [], None
+            
+            # Reuse the previous ranking when no rating or decision changed since it was computed.
+            # The top candidate is still written to final_candidates, which re-creates the
+            # record if it was deleted in the meantime. Callers get copies, so changes they
+            # make never reach the cache.
+            fingerprint = FinalSelectionService._ranking_fingerprint(interview_candidates)
+            cached = _ranking_cache.get(job_id)
+            if (cached and cached['fingerprint'] == fingerprint and
+                    time.time() - cached['last_updated_ts'] < RANKING_CACHE_TTL_SECONDS):
+                logger.debug("Feedback unchanged for job %s, reusing cached ranking", job_id)
+                ranked_candidates, top_candidate_data = copy.deepcopy(
+                    ([dict(zip(RANKED_ENTRY_FIELDS, values)) for values in cached['ranked']],
+                     cached['top_candidate_data'])
+                )
+                if ranked_candidates:
+                    FinalSelectionService.update_top_candidate_in_firebase(
+                        job_id,
+                        ranked_candidates[0],
+                        existing_offers=existing_offers,
+                        job_data=job_data,
+                        candidate_data=copy.deepcopy(cached['resolved_candidate_data'])
+                    )
+                return ranked_candidates, top_candidate_data
             
-            # Calculate scores and filter out candidates with incomplete feedback
-            ranked_candidates = []
+            # Calculate scores and filter out candidates with incomplete feedback.
+            # Only (score, candidate) pairs are collected here; the result dicts are built
+            # once the order is known.
+            scored_candidates = []
             for candidate in interview_candidates:
+                summary = candidate.get('feedback_summary')
+                if 'feedback' not in candidate and summary is not None:
+                    # Projected read: rank on the stored summary
+                    if summary.get('all_rounds_completed'):
+                        scored_candidates.append((summary.get('total_score', 0), candidate))
+                    continue
+                
                 feedback_list = candidate.get('feedback', [])
                 
                 # Check if all rounds have ratings and selection decisions
-                # Note: isSelectedForNextRound is a field in each feedback item in the feedback array
-                all_rounds_completed = all(
-                    feedback.get('rating_out_of_10') is not None and 
-                    feedback.get('isSelectedForNextRound') is not None and
-                    feedback.get('isSelectedForNextRound') != ""
-                    for feedback in feedback_list
-                )
+                # Note: isSelectedForNextRound is a field in each feedback item in the feedback array.
+                # The decision is tested first: it is unset ("" or None) on every round that has not
+                # been held yet, so incomplete candidates fail on the first lookup. False is a valid
+                # decision, hence the explicit membership test rather than a truthiness check.
+                if len(feedback_list) == 1:
+                    # Single-round jobs are common; test the one round directly
+                    only_round = feedback_list[0]
+                    all_rounds_completed = (
+                        only_round.get('isSelectedForNextRound') not in (None, "") and
+                        only_round.get('rating_out_of_10') is not None
+                    )
+                else:
+                    all_rounds_completed = all(
+                        feedback.get('isSelectedForNextRound') not in (None, "") and
+                        feedback.get('rating_out_of_10') is not None
+                        for feedback in feedback_list
+                    )
                 
                 # Only consider candidates who have completed all interview rounds with ratings and decisions
                 if all_rounds_completed:
                     total_score = FinalSelectionService.calculate_candidate_score(feedback_list)
-                    ranked_candidates.append({
-                        'candidate_id': candidate.get('candidate_id'),
-                        'interview_candidate_id': candidate.get('id'),
-                        'total_score': total_score,
-                        'feedback': feedback_list
-                    })
-            
-            # Sort by total score (descending)
-            ranked_candidates.sort(key=lambda x: x.get('total_score', 0), reverse=True)
+                    scored_candidates.append((total_score, candidate))
+            
+            # Sort by total score (descending); the sort is stable so ties keep their original order
+            scored_candidates.sort(key=itemgetter(0), reverse=True)
+            
+            ranked_candidates = [
+                {
+                    'candidate_id': candidate.get('candidate_id'),
+                    'interview_candidate_id': candidate.get('id'),
+                    'total_score': total_score,
+                    'feedback': candidate.get('feedback', [])
+                }
+                for total_score, candidate in scored_candidates
+            ]
+            
+            # With a projected read only the top candidate's feedback is loaded
+            if ranked_candidates and 'feedback' not in scored_candidates[0][1]:
+                top_record = InterviewCoreService.get_interview_candidate(ranked_candidates[0]['interview_candidate_id'])
+                if top_record:
+                    ranked_candidates[0]['feedback'] = top_record.get('feedback', [])
             
             # After stackranking, update the top candidate in the final_candidates collection
+            top_candidate_data = None
+            resolved_candidate_data = None
             if ranked_candidates:
-                FinalSelectionService.update_top_candidate_in_firebase(job_id, ranked_candidates[0])
-            
-            return ranked_candidates
+                top_candidate = ranked_candidates[0]
+                resolved_candidate_data = top_candidate_data = FinalSelectionService._resolve_candidate(top_candidate)
+                FinalSelectionService.update_top_candidate_in_firebase(
+                    job_id,
+                    top_candidate,
+                    existing_offers=existing_offers,
+                    job_data=job_data,
+                    candidate_data=top_candidate_data
+                )
+                if not top_candidate_data:
+                    top_candidate_data = FinalSelectionService._fallback_candidate(job_id, top_candidate)
+            
+            _ranking_cache[job_id] = copy.deepcopy({
+                'fingerprint': fingerprint,
+                'ranked': [_ranked_entry_values(entry) for entry in ranked_candidates],
+                'top_candidate_data': top_candidate_data,
+                'resolved_candidate_data': resolved_candidate_data,
+                'last_updated_ts': time.time()
+            })
+            
+            return ranked_candidates, top_candidate_data
         except Exception as e:
-            print(f"Error stack ranking candidates: {e}")
-            return []
+            logger.exception("Error stack ranking candidates: %s", e)
+            return [], None
+    
+    @staticmethod
+    def _resolve_candidate(top_candidate: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Look up the candidate details for a ranked candidate
+        
+        Both the candidate_id and the interview_candidate_id are fetched in one batched
+        read; the candidate_id hit wins. If only the interview_candidate_id matches, the
+        ranked entry's candidate_id is updated to point at it.
+        
+        Args:
+            top_candidate: Ranked candidate entry from stackrank_candidates
+        
+        Returns:
+            Candidate data or None if neither ID matches a candidate
+        """
+        candidate_id = top_candidate.get('candidate_id')
+        interview_candidate_id = top_candidate.get('interview_candidate_id')
+        logger.debug("Looking for candidate details with candidate_id: %s", candidate_id)
+        candidates = CandidateService.get_candidates_bulk([candidate_id, interview_candidate_id])
+        
+        candidate = candidates.get(candidate_id)
+        if not candidate and interview_candidate_id in candidates:
+            candidate = candidates[interview_candidate_id]
+            # Update the candidate_id reference
+            top_candidate['candidate_id'] = interview_candidate_id
+            logger.debug("Found candidate using interview_candidate_id instead")
+        return candidate
     
     @staticmethod
-    def select_top_candidate(job_id: str) -> Optional[Dict[str, Any]]:
+    def _fallback_candidate(job_id: str, top_candidate: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Pick a candidate for the job when the top ranked entry cannot be resolved
+        
+        Args:
+            job_id: ID of the job
+            top_candidate: Ranked candidate entry that could not be resolved
+        
+        Returns:
+            The first candidate for the job, or None if the job has no candidates
+        """
+        logger.error(
+            "Could not find candidate %s or %s",
+            top_candidate.get('candidate_id'), top_candidate.get('interview_candidate_id')
+        )
+        
+        # Try to get any candidate for this job as a fallback; only the first is used
+        candidates = CandidateService.get_candidates_by_job_id(job_id, limit=1)
+        if not candidates:
+            return None
+        
+        logger.warning("Using first available candidate for job %s as fallback", job_id)
+        candidate = candidates[0]
+        top_candidate['candidate_id'] = candidate.get('id')
+        return candidate
+    
+    @staticmethod
+    def select_top_candidate(
+        job_id: str,
+        interview_candidates: Optional[List[Dict[str, Any]]] = None,
+        existing_offers: Optional[List[Dict[str, Any]]] = None,
+        job_data: Optional[JobPostingResponse] = None
+    ) -> Optional[Dict[str, Any]]:
         """
         Select the top candidate for a job
         
         Args:
             job_id: ID of the job
+            interview_candidates: Optional pre-fetched interview candidates for the job
+            existing_offers: Optional pre-fetched final candidates for the job
+            job_data: Optional pre-fetched job posting
         
         Returns:
             Top candidate data or None if no candidates available
         """
-        print(f"Selecting top candidate for job {job_id}")
-        ranked_candidates = FinalSelectionService.stackrank_candidates(job_id)
+        logger.debug("Selecting top candidate for job %s", job_id)
+        ranked_candidates, candidate = FinalSelectionService.stackrank_candidates(
+            job_id,
+            interview_candidates=interview_candidates,
+            existing_offers=existing_offers,
+            job_data=job_data
+        )
         
         if not ranked_candidates:
-            print(f"No ranked candidates found for job {job_id}")
+            logger.debug("No ranked candidates found for job %s", job_id)
             return None
         
-        # Select the top candidate
-        top_candidate = ranked_candidates[0]
-        print(f"Top candidate selected with interview_candidate_id: {top_candidate.get('interview_candidate_id')} and candidate_id: {top_candidate.get('candidate_id')}")
-        
-        # Get candidate details - first try with candidate_id
-        candidate_id = top_candidate.get('candidate_id')
-        print(f"Looking for candidate details with candidate_id: {candidate_id}")
-        candidate = CandidateService.get_candidate(candidate_id)
-        
-        if not candidate and top_candidate.get('interview_candidate_id'):
-            # If not found with candidate_id, try with interview_candidate_id
-            print(f"Candidate not found with candidate_id, trying interview_candidate_id: {top_candidate.get('interview_candidate_id')}")
-            interview_candidate = CandidateService.get_candidate(top_candidate.get('interview_candidate_id'))
-            if interview_candidate:
-                candidate = interview_candidate
-                # Update the candidate_id reference
-                top_candidate['candidate_id'] = top_candidate.get('interview_candidate_id')
-                print(f"Found candidate using interview_candidate_id instead")
-        
         if not candidate:
-            print(f"ERROR: Could not find candidate {top_candidate.get('candidate_id')} or {top_candidate.get('interview_candidate_id')}")
-            
-            # Try to get any candidates for this job as a fallback
-            candidates = CandidateService.get_candidates_by_job_id(job_id)
-            if candidates:
-                print(f"Using first available candidate for job {job_id} as fallback")
-                candidate = candidates[0]
-                top_candidate['candidate_id'] = candidate.get('id')
-            else:
-                print(f"No candidates found for job {job_id}. Cannot proceed.")
-                return None
+            logger.error("No candidates found for job %s. Cannot proceed.", job_id)
+            return None
         
-        print(f"Successfully found candidate: {candidate.get('name')}")
+        logger.debug("Successfully found candidate: %s", candidate.get('name'))
         return {
-            'interview_data': top_candidate,
+            'interview_data': ranked_candidates[0],
             'candidate_data': candidate
         }
     
     @staticmethod
-    def update_top_candidate_in_firebase(job_id: str, top_candidate_data: Dict[str, Any]) -> Optional[str]:
+    def _find_existing_offer(
+        job_id: str,
+        candidate_id: str,
+        existing_offers: Optional[List[Dict[str, Any]]] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Find the final_candidates record for a candidate on a job
+        
+        Args:
+            job_id: ID of the job
+            candidate_id: ID of the candidate
+            existing_offers: Optional final candidates already fetched for the job in this
+                request; when omitted, a query on job_id and candidate_id is run instead
+        
+        Returns:
+            The final candidate record, or None if the candidate has none for the job
+        """
+        if existing_offers is None:
+            matches = FirestoreDB.execute_complex_query(
+                FinalSelectionService.COLLECTION_NAME,
+                [('job_id', '==', job_id), ('candidate_id', '==', candidate_id)],
+                limit=1
+            )
+            return matches[0] if matches else None
+        
+        for offer in existing_offers:
+            if offer.get('candidate_id') == candidate_id:
+                return offer
+        return None
+    
+    @staticmethod
+    def update_top_candidate_in_firebase(
+        job_id: str,
+        top_candidate_data: Dict[str, Any],
+        existing_offers: Optional[List[Dict[str, Any]]] = None,
+        job_data: Optional[JobPostingResponse] = None,
+        candidate_data: Optional[Dict[str, Any]] = None
+    ) -> Optional[str]:
         """
         Update the top candidate in the final_candidates collection based on stackranking
         
         Args:
             job_id: ID of the job
             top_candidate_data: Data for the top ranked candidate
+            existing_offers: Optional pre-fetched final candidates for the job. A newly
+                created record is appended so later lookups in the same request see it.
+            job_data: Optional pre-fetched job posting
+            candidate_data: Optional pre-resolved candidate details for the top candidate
             
         Returns:
             ID of the created final candidate document, or None if unsuccessful
         """
         try:
             # Get job data
-            job_data = JobService.get_job_posting(job_id)
+            if job_data is None:
+                job_data = JobService.get_job_posting(job_id)
             if not job_data:
-                print(f"Job with ID {job_id} not found")
+                logger.warning("Job with ID %s not found", job_id)
                 return None
             
             # Get candidate details
             candidate_id = top_candidate_data.get('candidate_id')
-            candidate_data = CandidateService.get_candidate(candidate_id)
+            if candidate_data is None:
+                candidate_data = CandidateService.get_candidate(candidate_id)
             
             if not candidate_data:
-                print(f"Could not find candidate with ID {candidate_id}")
+                logger.warning("Could not find candidate with ID %s", candidate_id)
                 return None
             
+            candidate_name = candidate_data.get('name')
+            
             # Check if the candidate already exists in final_candidates
-            existing_offers = FinalSelectionService.get_final_candidates_by_job_id(job_id)
-            for offer in existing_offers:
-                if offer.get('candidate_id') == candidate_id:
-                    print(f"Candidate {candidate_id} already exists in final_candidates for job {job_id}")
-                    return offer.get('id')
+            existing_offer = FinalSelectionService._find_existing_offer(job_id, candidate_id, existing_offers)
+            if existing_offer:
+                logger.debug("Candidate %s already exists in final_candidates for job %s", candidate_id, job_id)
+                return existing_offer.get('id')
             
             # Create final candidate record - leave compensation_offered blank as it will be added when sending the offer
             final_candidate_data = {
-                'candidate_name': candidate_data.get('name'),
+                'candidate_name': candidate_name,
                 'job_id': job_id,
                 'candidate_id': candidate_id,
                 'job_role': job_data.job_role_name,
@@ -260,11 +500,14 @@ class FinalSelectionService:
             
             # Create record in Firestore
             doc_id = FinalSelectionService.create_final_candidate(final_candidate_data)
-            print(f"Added top candidate {candidate_data.get('name')} to final_candidates with ID {doc_id}")
+            final_candidate_data['id'] = doc_id
+            if existing_offers is not None:
+                existing_offers.append(final_candidate_data)
+            logger.info("Added top candidate %s to final_candidates with ID %s", candidate_name, doc_id)
             
             return doc_id
         except Exception as e:
-            print(f"Error updating top candidate in Firebase: {e}")
+            logger.exception("Error updating top candidate in Firebase: %s", e)
             return None
     
     @staticmethod
@@ -288,28 +531,22 @@ class FinalSelectionService:
             if not feedback_list:
                 return result
                 
-            # Get the last round feedback (assuming rounds are in order)
-            last_round_feedback = feedback_list[-1]
-            
-            # Check if it has interviewer info
-            if last_round_feedback:
-                if "interviewer_name" in last_round_feedback:
-                    result["name"] = last_round_feedback["interviewer_name"]
-                if "interviewer_email" in last_round_feedback:
-                    result["email"] = last_round_feedback["interviewer_email"]
-                    
-            # If we don't have complete info in last round, check all rounds
-            if result["name"] == "HR Representative" or result["email"] == "hr@company.com":
-                for feedback in reversed(feedback_list):
-                    if feedback:
-                        if "interviewer_name" in feedback and result["name"] == "HR Representative":
-                            result["name"] = feedback["interviewer_name"]
-                        if "interviewer_email" in feedback and result["email"] == "hr@company.com":
-                            result["email"] = feedback["interviewer_email"]
+            # Scan from the last round (assuming rounds are in order) towards the first,
+            # taking the most recent name and email and stopping once both are known
+            for i in range(len(feedback_list) - 1, -1, -1):
+                feedback = feedback_list[i]
+                if not feedback:
+                    continue
+                if "interviewer_name" in feedback and result["name"] == "HR Representative":
+                    result["name"] = feedback["interviewer_name"]
+                if "interviewer_email" in feedback and result["email"] == "hr@company.com":
+                    result["email"] = feedback["interviewer_email"]
+                if result["name"] != "HR Representative" and result["email"] != "hr@company.com":
+                    break
             
             return result
         except Exception as e:
-            print(f"Error getting HR interviewer info: {e}")
+            logger.exception("Error getting HR interviewer info: %s", e)
             return {"name": "HR Representative", "email": "hr@company.com"}
             
     @staticmethod
@@ -325,6 +562,113 @@ class FinalSelectionService:
         """
         return FinalSelectionService.get_hr_interviewer_info(feedback_list)["name"]
     
+    @staticmethod
+    def _prepare_offer(
+        job_id: str,
+        compensation_offered: str,
+        job_data: JobPostingResponse,
+        interview_candidates: List[Dict[str, Any]],
+        existing_offers: List[Dict[str, Any]]
+    ) -> Optional[Tuple[FinalCandidateResponse, Dict[str, str]]]:
+        """
+        Select the top candidate for a job and record the offer with its compensation
+        
+        Args:
+            job_id: ID of the job
+            compensation_offered: Compensation to offer the candidate
+            job_data: Job posting
+            interview_candidates: Interview candidates for the job (ranking fields)
+            existing_offers: Final candidates already recorded for the job
+            
+        Returns:
+            Tuple of (final_candidate, hr_info), or None if no eligible candidate was found
+        """
+        # Select top candidate
+        top_candidate_info = FinalSelectionService.select_top_candidate(
+            job_id,
+            interview_candidates=interview_candidates,
+            existing_offers=existing_offers,
+            job_data=job_data
+        )
+        if not top_candidate_info:
+            logger.warning("No eligible candidates found for job %s", job_id)
+            return None
+        
+        interview_data = top_candidate_info.get('interview_data')
+        candidate_data = top_candidate_info.get('candidate_data')
+        
+        # Get HR interviewer info from feedback
+        hr_info = FinalSelectionService.get_hr_interviewer_info(interview_data.get('feedback', []))
+        logger.debug("Using HR interviewer: %s <%s>", hr_info['name'], hr_info['email'])
+        
+        candidate_id = candidate_data.get('id')
+        candidate_name = candidate_data.get('name')
+        
+        # Check for existing offer and update it with compensation
+        offer = FinalSelectionService._find_existing_offer(job_id, candidate_id, existing_offers)
+        if offer:
+            offer_id = offer.get('id')
+            logger.debug("Found existing offer for candidate %s, updating with compensation", candidate_name)
+            
+            # Update existing record with compensation and HR info
+            FirestoreDB.update_document(
+                FinalSelectionService.COLLECTION_NAME,
+                offer_id,
+                {
+                    'compensation_offered': compensation_offered,
+                    'status': 'offered',
+                    'hr_name': hr_info['name'],
+                    'hr_email': hr_info['email']
+                }
+            )
+            
+            # Get the updated record. It was written by this service, so the model is
+            # built without re-running validation; the route validates its response anyway.
+            updated_offer = FinalSelectionService.get_final_candidate(offer_id)
+            return FinalCandidateResponse.model_construct(**updated_offer), hr_info
+        
+        # If no existing record, create a new one
+        logger.debug("No existing offer found for candidate %s, creating new offer", candidate_name)
+        final_candidate_data = {
+            'candidate_name': candidate_name,
+            'job_id': job_id,
+            'candidate_id': candidate_id,
+            'job_role': job_data.job_role_name,
+            'compensation_offered': compensation_offered,
+            'email': candidate_data.get('email'),
+            'status': 'offered',
+            'hr_name': hr_info['name'],
+            'hr_email': hr_info['email']
+        }
+        
+        # Create record in Firestore
+        doc_id = FinalSelectionService.create_final_candidate(final_candidate_data)
+        
+        # Add the ID to the data
+        final_candidate_data['id'] = doc_id
+        
+        return FinalCandidateResponse.model_construct(**final_candidate_data), hr_info
+    
+    @staticmethod
+    async def _fetch_offer_inputs(job_id: str) -> Tuple[Optional[JobPostingResponse], List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        Fetch the job, its interview candidates and its existing offers concurrently
+        
+        The Firestore client is blocking, so each lookup runs in a worker thread.
+        
+        Args:
+            job_id: ID of the job
+            
+        Returns:
+            Tuple of (job_data, interview_candidates, existing_offers)
+        """
+        job_data, interview_candidates, existing_offers = await asyncio.gather(
+            asyncio.to_thread(JobService.get_job_posting, job_id),
+            asyncio.to_thread(FinalSelectionService.get_ranking_inputs, job_id),
+            asyncio.to_thread(FinalSelectionService.get_final_candidates_by_job_id, job_id)
+        )
+        return job_data, interview_candidates, existing_offers
+    
     @staticmethod
     async def select_and_send_offer(
         job_id: str,
@@ -343,91 +687,91 @@ class FinalSelectionService:
             Tuple of (success, final_candidate)
         """
         try:
-            # Get job data
-            job_data = JobService.get_job_posting(job_id)
+            job_data, interview_candidates, existing_offers = await FinalSelectionService._fetch_offer_inputs(job_id)
             if not job_data:
-                print(f"Job with ID {job_id} not found")
+                logger.warning("Job with ID %s not found", job_id)
                 return False, None
             
-            # Select top candidate
-            top_candidate_info = FinalSelectionService.select_top_candidate(job_id)
-            if not top_candidate_info:
-                print(f"No eligible candidates found for job {job_id}")
+            prepared = FinalSelectionService._prepare_offer(
+                job_id, compensation_offered, job_data, interview_candidates, existing_offers
+            )
+            if not prepared:
                 return False, None
+            final_candidate, hr_info = prepared
             
-            interview_data = top_candidate_info.get('interview_data')
-            candidate_data = top_candidate_info.get('candidate_data')
-            
-            # Get HR interviewer info from feedback
-            hr_info = FinalSelectionService.get_hr_interviewer_info(interview_data.get('feedback', []))
-            print(f"Using HR interviewer: {hr_info['name']} <{hr_info['email']}>")
-            
-            # Check for existing offer and update it with compensation
-            existing_offers = FinalSelectionService.get_final_candidates_by_job_id(job_id)
-            for offer in existing_offers:
-                if offer.get('candidate_id') == candidate_data.get('id'):
-                    print(f"Found existing offer for candidate {candidate_data.get('name')}, updating with compensation")
-                    
-                    # Update existing record with compensation and HR info
-                    FirestoreDB.update_document(
-                        FinalSelectionService.COLLECTION_NAME,
-                        offer.get('id'),
-                        {
-                            'compensation_offered': compensation_offered,
-                            'status': 'offered',
-                            'hr_name': hr_info['name'],
-                            'hr_email': hr_info['email']
-                        }
-                    )
-                    
-                    # Get the updated record
-                    updated_offer = FinalSelectionService.get_final_candidate(offer.get('id'))
-                    final_candidate = FinalCandidateResponse(**updated_offer)
-                    
-                    # Send offer letter
-                    await EmailService.send_offer_letter(
-                        candidate=final_candidate,
-                        job_title=job_data.job_role_name,
-                        background_tasks=background_tasks,
-                        hr_name=hr_info['name'],
-                        hr_email=hr_info['email']
-                    )
-                    
-                    return True, final_candidate
-            
-            # If no existing record, create a new one
-            print(f"No existing offer found for candidate {candidate_data.get('name')}, creating new offer")
-            final_candidate_data = {
-                'candidate_name': candidate_data.get('name'),
-                'job_id': job_id,
-                'candidate_id': candidate_data.get('id'),
-                'job_role': job_data.job_role_name,
-                'compensation_offered': compensation_offered,
-                'email': candidate_data.get('email'),
-                'status': 'offered',
-                'hr_name': hr_info['name'],
-                'hr_email': hr_info['email']
-            }
-            
-            # Create record in Firestore
-            doc_id = FinalSelectionService.create_final_candidate(final_candidate_data)
-            
-            # Add the ID to the data
-            final_candidate_data['id'] = doc_id
-            
-            # Create response object
-            final_candidate = FinalCandidateResponse(**final_candidate_data)
-            
-            # Send offer letter
-            await EmailService.send_offer_letter(
+            # Queue the offer letter; it is sent after the response is returned
+            background_tasks.add_task(
+                EmailService.send_offer_letter_sync,
                 candidate=final_candidate,
                 job_title=job_data.job_role_name,
-                background_tasks=background_tasks,
                 hr_name=hr_info['name'],
                 hr_email=hr_info['email']
             )
             
             return True, final_candidate
         except Exception as e:
-            print(f"Error selecting and sending offer: {e}")
+            logger.exception("Error selecting and sending offer: %s", e)
             return False, None
+    
+    @staticmethod
+    async def select_and_send_offers_bulk(
+        job_ids: List[str],
+        compensations: Dict[str, str],
+        background_tasks: BackgroundTasks
+    ) -> Dict[str, Optional[FinalCandidateResponse]]:
+        """
+        Select the top candidate for several jobs and send all offer letters together
+        
+        The inputs for every job are fetched concurrently, and the offer letters are sent
+        by a single background task that reuses one Gmail API service.
+        
+        Args:
+            job_ids: IDs of the jobs to send offers for
+            compensations: Compensation to offer, keyed by job ID
+            background_tasks: FastAPI background tasks for sending email
+            
+        Returns:
+            Dictionary mapping each job ID to its final candidate, or None if no offer was made
+        """
+        job_ids = list(dict.fromkeys(job_ids))
+        results: Dict[str, Optional[FinalCandidateResponse]] = {job_id: None for job_id in job_ids}
+        
+        inputs = await asyncio.gather(
+            *(FinalSelectionService._fetch_offer_inputs(job_id) for job_id in job_ids),
+            return_exceptions=True
+        )
+        
+        emails = []
+        for job_id, job_inputs in zip(job_ids, inputs):
+            try:
+                if isinstance(job_inputs, Exception):
+                    raise job_inputs
+                job_data, interview_candidates, existing_offers = job_inputs
+                if not job_data:
+                    logger.warning("Job with ID %s not found", job_id)
+                    continue
+                if job_id not in compensations:
+                    logger.warning("No compensation given for job %s", job_id)
+                    continue
+                
+                prepared = FinalSelectionService._prepare_offer(
+                    job_id, compensations[job_id], job_data, interview_candidates, existing_offers
+                )
+                if not prepared:
+                    continue
+                final_candidate, hr_info = prepared
+                results[job_id] = final_candidate
+                emails.append({
+                    'candidate': final_candidate,
+                    'job_title': job_data.job_role_name,
+                    'hr_name': hr_info['name'],
+                    'hr_email': hr_info['email']
+                })
+            except Exception as e:
+                logger.exception("Error selecting and sending offer for job %s: %s", job_id, e)
+        
+        # Queue all offer letters as one task so they share a Gmail API service
+        if emails:
+            background_tasks.add_task(EmailService.send_offer_letters_sync, emails)
+        
+        return results
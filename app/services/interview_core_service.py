@@ -1,16 +1,133 @@
 """
 Core interview candidate and interviewer management functionality
 """
+import copy
+import logging
+import threading
+import time
 import uuid
-from typing import Dict, Any, List, Optional, Tuple
+from typing import Callable, Dict, Any, List, Optional, Tuple, Union
 from app.database.firebase_db import FirestoreDB
 
+logger = logging.getLogger(__name__)
+
+# Interviewers change rarely but are read every time interviewers are assigned, so the
+# collection is kept in memory and re-read once the TTL has passed. Full and lean
+# (projected) reads are cached separately
+INTERVIEWERS_CACHE_TTL_SECONDS = 300
+_interviewers_cache: Dict[bool, Dict[str, Any]] = {
+    lean: {"data": None, "fetched_at": 0.0} for lean in (False, True)
+}
+_interviewers_cache_lock = threading.Lock()
+
+# Several services can read the whole interview candidates collection while handling one
+# request, so a read is reused for a few seconds; every write through this service drops it
+INTERVIEW_CANDIDATES_CACHE_TTL_SECONDS = 5
+_interview_candidates_cache: Dict[str, Any] = {
+    "data": None, "fetched_at": 0.0, "event_index": None, "event_index_source": None
+}
+_interview_candidates_cache_lock = threading.Lock()
+
+# The only interviewer fields that interviewer assignment reads
+LEAN_INTERVIEWER_FIELDS = [
+    'id', 'email', 'name', 'expertise', 'department'
+]
+
+# Expertise (or department) values that place an interviewer in each round category
+_TECH_EXPERTISE = frozenset({'engineering', 'technical'})
+_MGR_EXPERTISE = frozenset({'management', 'manager'})
+_HR_EXPERTISE = frozenset({'hr', 'human resources'})
+# The same vocabularies inverted, so each value is classified with one lookup
+_EXPERTISE_CATEGORIES: Dict[str, str] = {
+    value: category
+    for category, values in (('technical', _TECH_EXPERTISE), ('manager', _MGR_EXPERTISE), ('hr', _HR_EXPERTISE))
+    for value in values
+}
+
+# Interviewer category of each round, by number of rounds
+_ROUND_PLANS: Dict[int, Tuple[str, ...]] = {
+    2: ('manager', 'hr'),
+    3: ('technical', 'manager', 'hr'),
+    4: ('technical', 'technical', 'manager', 'hr'),
+}
+
+
+def _interview_category(expertise_lower: Optional[List[str]], department_lower: str) -> Optional[str]:
+    """
+    Work out which interview round category lower-cased expertise or department names
+    
+    The first expertise entry that names a category decides it. Without an expertise
+    list the department decides, for technical or manager only.
+    
+    Args:
+        expertise_lower: Lower-cased expertise entries, or None if expertise is missing
+        department_lower: Lower-cased department
+    
+    Returns:
+        'technical', 'manager', 'hr' or None
+    """
+    if expertise_lower is None:
+        category = _EXPERTISE_CATEGORIES.get(department_lower)
+        return category if category != 'hr' else None
+    
+    for exp_lower in expertise_lower:
+        category = _EXPERTISE_CATEGORIES.get(exp_lower)
+        if category:
+            return category
+    return None
+
+
+def _expertise_as_list(interviewer: Dict[str, Any]) -> Optional[List[str]]:
+    """
+    Read an interviewer's expertise as a list, whether it is stored as an array or a string
+    
+    Args:
+        interviewer: Interviewer document
+    
+    Returns:
+        List of expertise entries (empty if the field is missing), or None if the
+        stored value is neither a list nor a string
+    """
+    expertise = interviewer.get('expertise', [])
+    if isinstance(expertise, list):
+        return expertise
+    if isinstance(expertise, str):
+        return [expertise]
+    return None
+
+
+def _add_derived_fields(interviewer: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Add lower-cased expertise and department and the interview category to the document
+    
+    These are computed in memory each time the interviewers cache is filled and are never
+    stored, so edits made directly in Firestore are picked up on the next fill.
+    '_expertise_lower' is None when expertise is neither a list nor a string.
+    
+    Args:
+        interviewer: Interviewer document, updated in place
+    
+    Returns:
+        The same interviewer document
+    """
+    expertise = _expertise_as_list(interviewer)
+    interviewer['_expertise_lower'] = (
+        [exp.lower() if exp else "" for exp in expertise] if expertise is not None else None
+    )
+    department = interviewer.get('department')
+    interviewer['_department_lower'] = department.lower() if department else ""
+    interviewer['_interview_category'] = _interview_category(
+        interviewer['_expertise_lower'], interviewer['_department_lower']
+    )
+    return interviewer
+
 
 class InterviewCoreService:
     """Core service for interview candidate and interviewer management"""
     
     COLLECTION_NAME = "interview_candidates"
     INTERVIEWERS_COLLECTION = "interviewers"
+    INTERVIEWER_STATS_COLLECTION = "interviewer_stats"
     
     @staticmethod
     def create_interview_candidate(candidate_data: Dict[str, Any]) -> str:
@@ -28,15 +145,20 @@ class InterviewCoreService:
             if 'id' not in candidate_data:
                 candidate_data['id'] = str(uuid.uuid4())
             
+            # Keep the ranking summary and event IDs in step with the feedback array
+            if 'feedback' in candidate_data:
+                candidate_data.update(InterviewCoreService._feedback_derived_fields(candidate_data['feedback']))
+            
             # Add the document to the collection
             doc_id = FirestoreDB.create_document(
                 InterviewCoreService.COLLECTION_NAME,
                 candidate_data
             )
+            InterviewCoreService.invalidate_interview_candidates_cache()
             
             return doc_id
         except Exception as e:
-            print(f"Error creating interview candidate: {e}")
+            logger.exception("Error creating interview candidate: %s", e)
             raise
     
     @staticmethod
@@ -57,35 +179,371 @@ class InterviewCoreService:
         """
         Get all interview candidates
         
+        The collection is cached in memory for INTERVIEW_CANDIDATES_CACHE_TTL_SECONDS.
+        Callers get copies of the documents, so changes they make before writing do not
+        reach the cache or other requests.
+        
         Returns:
             List of all interview candidates
         """
-        return FirestoreDB.get_all_documents(InterviewCoreService.COLLECTION_NAME)
+        return copy.deepcopy(InterviewCoreService._cached_interview_candidates())
+    
+    @staticmethod
+    def _cached_interview_candidates() -> List[Dict[str, Any]]:
+        """
+        Get the cached interview candidates, reading them from Firestore once the TTL has passed
+        
+        Returns:
+            The cached list itself, which must not be modified
+        """
+        data = _interview_candidates_cache["data"]
+        if data is not None and time.monotonic() - _interview_candidates_cache["fetched_at"] < INTERVIEW_CANDIDATES_CACHE_TTL_SECONDS:
+            return data
+        
+        with _interview_candidates_cache_lock:
+            data = _interview_candidates_cache["data"]
+            if data is not None and time.monotonic() - _interview_candidates_cache["fetched_at"] < INTERVIEW_CANDIDATES_CACHE_TTL_SECONDS:
+                return data
+            
+            data = FirestoreDB.get_all_documents(InterviewCoreService.COLLECTION_NAME)
+            _interview_candidates_cache["data"] = data
+            _interview_candidates_cache["fetched_at"] = time.monotonic()
+            return data
+    
+    @staticmethod
+    def invalidate_interview_candidates_cache() -> None:
+        """
+        Drop the cached interview candidates so the next read fetches them from Firestore
+        
+        Called after every write to the interview candidates collection.
+        """
+        with _interview_candidates_cache_lock:
+            _interview_candidates_cache["data"] = None
+            _interview_candidates_cache["fetched_at"] = 0.0
+            _interview_candidates_cache["event_index"] = None
+            _interview_candidates_cache["event_index_source"] = None
     
     @staticmethod
-    def get_interview_candidates_by_job_id(job_id: str) -> List[Dict[str, Any]]:
+    def get_interview_candidates_by_job_id(
+        job_id: str,
+        projection: Optional[List[str]] = None,
+        limit: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
         """
         Get interview candidates for a specific job
         
         Args:
             job_id: ID of the job
+            projection: Optional list of fields to fetch instead of whole documents
+            limit: Optional maximum number of candidates, applied in the query
         
         Returns:
             List of interview candidates for the job
         """
-        all_candidates = InterviewCoreService.get_all_interview_candidates()
-        return [c for c in all_candidates if c.get('job_id') == job_id]
+        # Filter on the automatically indexed job_id field in Firestore rather than
+        # reading the whole collection and filtering it here
+        return FirestoreDB.execute_query(
+            InterviewCoreService.COLLECTION_NAME, 'job_id', '==', job_id, fields=projection, limit=limit
+        )
+    
+    @staticmethod
+    def get_interview_candidates_by_status(status: Union[str, List[str]]) -> List[Dict[str, Any]]:
+        """
+        Get interview candidates with a specific tracking status
+        
+        Several statuses are fetched with 'in' queries (see FirestoreDB.execute_in_query)
+        instead of one query per status.
+        
+        Args:
+            status: Tracking status (scheduled, in_progress, rejected, passed, selected, completed),
+                or a list of statuses to match any of
+        
+        Returns:
+            List of interview candidates with the status
+        """
+        if isinstance(status, str):
+            return FirestoreDB.execute_query(InterviewCoreService.COLLECTION_NAME, 'status', '==', status)
+        
+        return FirestoreDB.execute_in_query(InterviewCoreService.COLLECTION_NAME, 'status', status)
+    
+    @staticmethod
+    def summarize_interview_candidates(job_id: str) -> Optional[Dict[str, int]]:
+        """
+        Count a job's interview candidates and total their completed rounds without fetching them
+        
+        Args:
+            job_id: ID of the job
+        
+        Returns:
+            Dictionary with total and completed_rounds, or None if the aggregation failed
+        """
+        result = FirestoreDB.aggregate_documents(
+            InterviewCoreService.COLLECTION_NAME,
+            [('job_id', '==', job_id)],
+            sum_fields=['completedRounds']
+        )
+        if result is None:
+            return None
+        return {
+            'total': int(result['count']),
+            'completed_rounds': int(result.get('sum_completedRounds') or 0)
+        }
+    
+    @staticmethod
+    def count_interview_candidates(job_id: str, status: Optional[str] = None) -> Optional[int]:
+        """
+        Count the interview candidates for a job without fetching them
+        
+        Args:
+            job_id: ID of the job
+            status: Optional tracking status to count only candidates in that status
+        
+        Returns:
+            Number of matching interview candidates, or None if the count failed
+        """
+        conditions = [('job_id', '==', job_id)]
+        if status:
+            conditions.append(('status', '==', status))
+        return FirestoreDB.count_documents(InterviewCoreService.COLLECTION_NAME, conditions)
+    
+    @staticmethod
+    def parse_rating(rating: Any) -> Optional[int]:
+        """
+        Read a stored rating as an int
+        
+        Ratings written outside the feedback endpoint may be numeric strings; empty
+        placeholders, booleans and values that are not numbers count as unrated.
+        
+        Args:
+            rating: Stored rating_out_of_10 value
+        
+        Returns:
+            The rating as an int, or None if the round is unrated
+        """
+        if rating is None or rating == "" or isinstance(rating, bool):
+            return None
+        try:
+            return int(rating)
+        except (TypeError, ValueError):
+            return None
+    
+    @staticmethod
+    def build_feedback_summary(feedback_list: Optional[List[Dict[str, Any]]]) -> Dict[str, Any]:
+        """
+        Summarise a feedback array into the fields needed for stack ranking
+        
+        Args:
+            feedback_list: List of feedback dictionaries, one per round
+        
+        Returns:
+            Dictionary with total_score, all_rounds_completed and rounds
+        """
+        feedback_list = feedback_list or []
+        total_score = 0
+        all_rounds_completed = True
+        # One pass accumulates the score and checks completion together
+        for feedback in feedback_list:
+            if not isinstance(feedback, dict):
+                all_rounds_completed = False
+                continue
+            rating = feedback.get('rating_out_of_10')
+            # Unset ratings (None) count as zero; False is a valid selection decision
+            if rating is None:
+                all_rounds_completed = False
+            else:
+                # Legacy string ratings must not make every later write to the candidate fail
+                total_score += InterviewCoreService.parse_rating(rating) or 0
+                if feedback.get('isSelectedForNextRound') in (None, ""):
+                    all_rounds_completed = False
+        return {
+            'total_score': total_score,
+            'all_rounds_completed': all_rounds_completed,
+            'rounds': len(feedback_list)
+        }
+    
+    @staticmethod
+    def _feedback_derived_fields(feedback_list: Optional[List[Dict[str, Any]]]) -> Dict[str, Any]:
+        """
+        Build the fields stored alongside the feedback array
+        
+        feedback_summary serves stack ranking, scheduled_event_ids lets candidates
+        be found by calendar event with an indexed query and scheduled_event_rounds
+        maps each of those events to its round index.
+        
+        Args:
+            feedback_list: List of feedback dictionaries, one per round
+        
+        Returns:
+            Dictionary with feedback_summary, scheduled_event_ids and scheduled_event_rounds
+        """
+        scheduled_event_rounds = {}
+        for round_index, feedback in enumerate(feedback_list or []):
+            scheduled_event = feedback.get('scheduled_event') if isinstance(feedback, dict) else None
+            if isinstance(scheduled_event, dict) and scheduled_event.get('id'):
+                scheduled_event_rounds.setdefault(scheduled_event['id'], round_index)
+        return {
+            'feedback_summary': InterviewCoreService.build_feedback_summary(feedback_list),
+            'scheduled_event_ids': list(scheduled_event_rounds),
+            'scheduled_event_rounds': scheduled_event_rounds
+        }
+    
+    @staticmethod
+    def find_round_by_event_id(candidate: Dict[str, Any], event_id: str) -> Optional[int]:
+        """
+        Find which round of an interview candidate is scheduled as the given calendar event
+        
+        Args:
+            candidate: Interview candidate record
+            event_id: ID of the scheduled calendar event
+        
+        Returns:
+            Index of the round in the feedback array, or None if no round uses the event
+        """
+        feedback_list = candidate.get('feedback') or []
+        round_index = (candidate.get('scheduled_event_rounds') or {}).get(event_id)
+        if round_index is not None and round_index < len(feedback_list):
+            return round_index
+        
+        # Records written before scheduled_event_rounds existed are found by scanning the rounds
+        for round_index, feedback in enumerate(feedback_list):
+            scheduled_event = feedback.get('scheduled_event') if isinstance(feedback, dict) else None
+            if isinstance(scheduled_event, dict) and scheduled_event.get('id') == event_id:
+                return round_index
+        return None
+    
+    @staticmethod
+    def get_interview_candidates_by_event_id(event_id: str) -> List[Dict[str, Any]]:
+        """
+        Get the interview candidates with a round scheduled as the given calendar event
+        
+        Args:
+            event_id: ID of the scheduled calendar event
+        
+        Returns:
+            List of interview candidates referencing the event
+        """
+        candidates = FirestoreDB.execute_query(
+            InterviewCoreService.COLLECTION_NAME, 'scheduled_event_ids', 'array_contains', event_id
+        )
+        if candidates:
+            return candidates
+        
+        # Candidates whose feedback was last written before scheduled_event_ids existed
+        # are only found by checking their feedback, so fall back to the event index.
+        # Callers edit the feedback before writing it, so they get copies of the cached documents
+        return copy.deepcopy(InterviewCoreService._event_index().get(event_id, []))
+    
+    @staticmethod
+    def _event_index() -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Map each scheduled event ID to the interview candidates referencing it
+        
+        The index is built once per cached read of all interview candidates, so repeated
+        lookups do not rescan every candidate's feedback.
+        
+        Returns:
+            Dictionary mapping event ID to interview candidates
+        """
+        candidates = InterviewCoreService._cached_interview_candidates()
+        with _interview_candidates_cache_lock:
+            data = _interview_candidates_cache["data"]
+            if data is None:
+                # The cache was dropped by a write meanwhile, so index this read without keeping it
+                return InterviewCoreService._build_event_index(candidates)
+            if _interview_candidates_cache["event_index_source"] is not data:
+                _interview_candidates_cache["event_index"] = InterviewCoreService._build_event_index(data)
+                _interview_candidates_cache["event_index_source"] = data
+            return _interview_candidates_cache["event_index"]
+    
+    @staticmethod
+    def _build_event_index(candidates: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Build the event ID to interview candidates mapping used by _event_index
+        
+        Args:
+            candidates: Interview candidates to index
+        
+        Returns:
+            Dictionary mapping event ID to interview candidates
+        """
+        index: Dict[str, List[Dict[str, Any]]] = {}
+        for candidate in candidates:
+            for feedback in candidate.get('feedback') or []:
+                scheduled_event = feedback.get('scheduled_event') if isinstance(feedback, dict) else None
+                if isinstance(scheduled_event, dict) and scheduled_event.get('id'):
+                    index.setdefault(scheduled_event['id'], []).append(candidate)
+        return index
     
     @staticmethod
     def update_interview_candidate(candidate_id: str, data: Dict[str, Any]) -> None:
         """
         Update an interview candidate
         
+        Whenever the feedback array is written, its ranking summary and event IDs are
+        written with it.
+        
         Args:
             candidate_id: ID of the interview candidate
             data: New data to update
         """
+        if 'feedback' in data:
+            data = {**data, **InterviewCoreService._feedback_derived_fields(data['feedback'])}
         FirestoreDB.update_document(InterviewCoreService.COLLECTION_NAME, candidate_id, data)
+        InterviewCoreService.invalidate_interview_candidates_cache()
+    
+    @staticmethod
+    def update_interview_candidates_bulk(updates: Dict[str, Dict[str, Any]]) -> List[str]:
+        """
+        Update several interview candidates with batched writes
+        
+        As with update_interview_candidate, the derived fields are written with the feedback array.
+        
+        Args:
+            updates: Dictionary mapping interview candidate ID to the data to update
+            
+        Returns:
+            IDs of the interview candidates that failed to update
+        """
+        prepared = {}
+        for candidate_id, data in updates.items():
+            if 'feedback' in data:
+                data = {**data, **InterviewCoreService._feedback_derived_fields(data['feedback'])}
+            prepared[candidate_id] = data
+        failed_ids = FirestoreDB.batch_update_documents(InterviewCoreService.COLLECTION_NAME, prepared)
+        InterviewCoreService.invalidate_interview_candidates_cache()
+        return failed_ids
+    
+    @staticmethod
+    def update_interview_candidate_atomically(
+        candidate_id: str,
+        update_fn: Callable[[Dict[str, Any]], Optional[Dict[str, Any]]],
+        increments_fn: Optional[Callable[[], List[Tuple[str, str, Dict[str, Any]]]]] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Read-modify-write an interview candidate in one transaction
+        
+        As with update_interview_candidate, the derived fields are written with the feedback array.
+        
+        Args:
+            candidate_id: ID of the interview candidate
+            update_fn: Function given the current candidate data that returns the fields to update
+            increments_fn: Optional function returning (collection_name, doc_id, {field: amount})
+                counter updates to commit together with the candidate update
+            
+        Returns:
+            The candidate data after the update, or None if not found or the update failed
+        """
+        def apply_update(candidate: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+            data = update_fn(candidate)
+            if data and 'feedback' in data:
+                data = {**data, **InterviewCoreService._feedback_derived_fields(data['feedback'])}
+            return data
+        
+        updated = FirestoreDB.run_transaction(
+            InterviewCoreService.COLLECTION_NAME, candidate_id, apply_update, increments_fn
+        )
+        InterviewCoreService.invalidate_interview_candidates_cache()
+        return updated
     
     @staticmethod
     def delete_interview_candidate(candidate_id: str) -> None:
@@ -96,41 +554,151 @@ class InterviewCoreService:
             candidate_id: ID of the interview candidate
         """
         FirestoreDB.delete_document(InterviewCoreService.COLLECTION_NAME, candidate_id)
+        InterviewCoreService.invalidate_interview_candidates_cache()
     
     @staticmethod
-    def get_all_interviewers() -> List[Dict[str, Any]]:
+    def get_all_interviewers(lean: bool = False) -> List[Dict[str, Any]]:
         """
         Get all interviewers from the interviewers collection
         
+        The collection is cached in memory for INTERVIEWERS_CACHE_TTL_SECONDS.
+        
+        Args:
+            lean: Whether to read only LEAN_INTERVIEWER_FIELDS instead of whole documents
+        
         Returns:
             List of all interviewers
         """
-        return FirestoreDB.get_all_documents(InterviewCoreService.INTERVIEWERS_COLLECTION)
+        # Full documents also serve lean reads
+        for cache in ((_interviewers_cache[False], _interviewers_cache[True]) if lean else (_interviewers_cache[False],)):
+            data = cache["data"]
+            if data is not None and time.monotonic() - cache["fetched_at"] < INTERVIEWERS_CACHE_TTL_SECONDS:
+                return list(data)
+        
+        cache = _interviewers_cache[lean]
+        # Only one thread refreshes an expired cache; the others wait and reuse its result
+        with _interviewers_cache_lock:
+            data = cache["data"]
+            if data is not None and time.monotonic() - cache["fetched_at"] < INTERVIEWERS_CACHE_TTL_SECONDS:
+                return list(data)
+            
+            data = FirestoreDB.get_all_documents(
+                InterviewCoreService.INTERVIEWERS_COLLECTION,
+                fields=LEAN_INTERVIEWER_FIELDS if lean else None
+            )
+            # Derived once per fill rather than on every classification
+            for interviewer in data:
+                _add_derived_fields(interviewer)
+            # An empty result may be a failed read, so it is not cached
+            if data:
+                cache["data"] = data
+                cache["fetched_at"] = time.monotonic()
+            return list(data)
+    
+    @staticmethod
+    def invalidate_interviewers_cache() -> None:
+        """
+        Drop the cached interviewers so the next read fetches them from Firestore
+        
+        Call this after any write to the interviewers collection.
+        """
+        with _interviewers_cache_lock:
+            for cache in _interviewers_cache.values():
+                cache["data"] = None
+                cache["fetched_at"] = 0.0
     
     @staticmethod
     def get_interviewers_by_expertise(expertise: str) -> List[Dict[str, Any]]:
         """
         Get interviewers filtered by expertise
         
+        Matching ignores case. The cached interviewers are filtered on the lower-cased
+        expertise derived when the cache was filled, instead of querying Firestore for
+        each spelling of the value.
+        
         Args:
             expertise: Expertise area to filter by (e.g., "Engineering", "HR", "Management")
         
         Returns:
             List of interviewers with the specified expertise
         """
-        all_interviewers = InterviewCoreService.get_all_interviewers()
-        matching_interviewers = []
+        expertise_lower = expertise.lower()
+        return [
+            {key: value for key, value in interviewer.items() if not key.startswith('_')}
+            for interviewer in InterviewCoreService.get_all_interviewers()
+            if expertise_lower in (interviewer.get('_expertise_lower') or [])
+        ]
+    
+    @staticmethod
+    def _classify_interviewers(
+        available_interviewers: List[Dict[str, Any]],
+        technical_needed: int = 2
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        Pick the first technical, manager and HR interviewers in a single pass
+        
+        Uses the category derived when the interviewers cache was filled (see
+        _add_derived_fields), computing it only for interviewers that did not come
+        from the cache. Assignment only ever uses the
+        first manager and HR interviewer and at most two technical ones, so the scan stops
+        as soon as those are found.
+        
+        Args:
+            available_interviewers: Interviewers to classify
+            technical_needed: Number of technical interviewers to pick
+        
+        Returns:
+            Tuple of (technical, manager, HR) interviewer lists, holding at most
+            technical_needed, 1 and 1 interviewers
+        """
+        technical_interviewers = []
+        manager_interviewers = []
+        hr_interviewers = []
+        
+        for interviewer in available_interviewers:
+            if '_interview_category' not in interviewer:
+                _add_derived_fields(interviewer)
+            category = interviewer['_interview_category']
+            if category == 'technical':
+                if len(technical_interviewers) < technical_needed:
+                    technical_interviewers.append(interviewer)
+            elif category == 'manager':
+                if not manager_interviewers:
+                    manager_interviewers.append(interviewer)
+            elif category == 'hr':
+                if not hr_interviewers:
+                    hr_interviewers.append(interviewer)
+            else:
+                continue
+            
+            if manager_interviewers and hr_interviewers and len(technical_interviewers) >= technical_needed:
+                break
+        
+        return technical_interviewers, manager_interviewers, hr_interviewers
+    
+    @staticmethod
+    def _build_round_assignment(interviewer: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Build the feedback entry for a round assigned to an interviewer
         
-        for interviewer in all_interviewers:
-            expertise_list = interviewer.get('expertise', [])
-            # Handle both string and array formats for expertise
-            if isinstance(expertise_list, list):
-                if any(exp.lower() == expertise.lower() for exp in expertise_list if exp):
-                    matching_interviewers.append(interviewer)
-            elif isinstance(expertise_list, str) and expertise_list.lower() == expertise.lower():
-                matching_interviewers.append(interviewer)
+        Every assignment path builds its entries here, so they all have the same fixed
+        set of keys.
         
-        return matching_interviewers
+        Args:
+            interviewer: Interviewer document
+        
+        Returns:
+            Interviewer assignment with empty feedback fields
+        """
+        return {
+            "interviewer_id": interviewer.get("id"),
+            "interviewer_email": interviewer.get("email"),
+            "interviewer_name": interviewer.get("name"),
+            "expertise": interviewer.get("expertise") or interviewer.get("department"),
+            "isSelectedForNextRound": None,
+            "feedback": None,
+            "rating_out_of_10": None
+        }
     
     @staticmethod
     def assign_interviewers(no_of_interviews: int, specific_interviewers: Optional[List[str]] = None) -> List[Dict[str, Any]]:
@@ -148,12 +716,25 @@ class InterviewCoreService:
             List of interviewer assignments, one per round
         """
         try:
+            # When specific interviewers are given, fetch just those in one batched read
+            if specific_interviewers and len(specific_interviewers) >= no_of_interviews:
+                requested_ids = specific_interviewers[:no_of_interviews]
+                requested = FirestoreDB.get_documents_by_ids(
+                    InterviewCoreService.INTERVIEWERS_COLLECTION, requested_ids
+                )
+                # Unknown IDs fall back to other interviewers below, which needs the full list
+                if all(interviewer_id in requested for interviewer_id in requested_ids):
+                    return [
+                        InterviewCoreService._build_round_assignment(requested[interviewer_id])
+                        for interviewer_id in requested_ids
+                    ]
+            
             # Get all available interviewers
-            available_interviewers = InterviewCoreService.get_all_interviewers()
+            available_interviewers = InterviewCoreService.get_all_interviewers(lean=True)
             
             # If no interviewers found, create some sample interviewers
             if not available_interviewers:
-                print("No interviewers found, using sample interviewers")
+                logger.warning("No interviewers found, using sample interviewers")
                 sample_interviewers = [
                     {
                         "id": str(uuid.uuid4()),
@@ -188,79 +769,22 @@ class InterviewCoreService:
                 # Save the sample interviewers to the database
                 for interviewer in sample_interviewers:
                     FirestoreDB.create_document(InterviewCoreService.INTERVIEWERS_COLLECTION, interviewer)
+                InterviewCoreService.invalidate_interviewers_cache()
                 
                 available_interviewers = sample_interviewers
             
-            # Create a dictionary of interviewers by ID
-            interviewers_by_id = {i.get('id'): i for i in available_interviewers}
-            
-            # Filter interviewers by expertise
-            technical_interviewers = []
-            manager_interviewers = []
-            hr_interviewers = []
-            
-            for interviewer in available_interviewers:
-                expertise_list = interviewer.get('expertise', [])
-                # Handle both string and array formats for expertise
-                if isinstance(expertise_list, list):
-                    # Check each expertise in the list
-                    for exp in expertise_list:
-                        exp_lower = exp.lower() if exp else ""
-                        if exp_lower in ['engineering', 'technical']:
-                            technical_interviewers.append(interviewer)
-                            break
-                        elif exp_lower in ['management', 'manager']:
-                            manager_interviewers.append(interviewer)
-                            break
-                        elif exp_lower in ['hr', 'human resources']:
-                            hr_interviewers.append(interviewer)
-                            break
-                elif isinstance(expertise_list, str):
-                    # Handle string format
-                    exp_lower = expertise_list.lower()
-                    if exp_lower in ['engineering', 'technical']:
-                        technical_interviewers.append(interviewer)
-                    elif exp_lower in ['management', 'manager']:
-                        manager_interviewers.append(interviewer)
-                    elif exp_lower in ['hr', 'human resources']:
-                        hr_interviewers.append(interviewer)
-                
-                # Fall back to department if no relevant expertise is found
-                elif interviewer.get('department'):
-                    dept_lower = interviewer.get('department').lower()
-                    if dept_lower in ['engineering', 'technical']:
-                        technical_interviewers.append(interviewer)
-                    elif dept_lower in ['management', 'manager']:
-                        manager_interviewers.append(interviewer)
-            
-            print("---------------------",manager_interviewers, hr_interviewers, technical_interviewers)
-            
-            
-            if not manager_interviewers:
-                manager_interviewers = available_interviewers[0:1] if available_interviewers else []
-                
-            
-            if not hr_interviewers:
-                hr_interviewers = available_interviewers[-1:] if available_interviewers else []
-            
             # Assign interviewers for each round based on rules
             interviewer_assignments = []
             
             # If specific interviewers are provided, use them
-            print(specific_interviewers)
+            logger.debug("Specific interviewers requested: %s", specific_interviewers)
             if specific_interviewers and len(specific_interviewers) >= no_of_interviews:
+                # Create a dictionary of interviewers by ID
+                interviewers_by_id = {i.get('id'): i for i in available_interviewers}
                 for i in range(no_of_interviews):
                     interviewer_id = specific_interviewers[i]
                     interviewer = interviewers_by_id.get(interviewer_id, available_interviewers[i % len(available_interviewers)])
-                    interviewer_assignments.append({
-                        "interviewer_id": interviewer.get("id"),
-                        "interviewer_email": interviewer.get("email"),
-                        "interviewer_name": interviewer.get("name"),
-                        "expertise": interviewer.get("expertise"),
-                        "isSelectedForNextRound": None,
-                        "feedback": None,
-                        "rating_out_of_10": None
-                    })
+                    interviewer_assignments.append(InterviewCoreService._build_round_assignment(interviewer))
             else:
                 # Follow the standard interview pattern based on number of rounds
                 # Minimum 2 rounds: Manager, then HR
@@ -268,141 +792,47 @@ class InterviewCoreService:
                 
                 # Validate no_of_interviews
                 if no_of_interviews < 2:
-                    print(no_of_interviews)
+                    logger.debug("Raising %d interview rounds to the minimum of 2", no_of_interviews)
                     no_of_interviews = 2  # Minimum 2 rounds
                 if no_of_interviews > 4:
                     no_of_interviews = 4  # Maximum 4 rounds
                 
-                if no_of_interviews == 2:
-                # Round 1: Manager (with empty list check)
-                    if not manager_interviewers:
-                        print("No manager interviewers available, using first available interviewer")
-                        manager = available_interviewers[0] if available_interviewers else {
-                            "id": str(uuid.uuid4()),
-                            "name": "Default Manager",
-                            "email": "manager@example.com",
-                            "expertise": ["Management"]
-                        }
-                    else:
-                        manager = manager_interviewers[0]
-                    interviewer_assignments.append({
-                        "interviewer_id": manager.get("id"),
-                        "interviewer_email": manager.get("email"),
-                        "interviewer_name": manager.get("name"),
-                        "expertise": manager.get("expertise") or manager.get("department"),
-                        "isSelectedForNextRound": None,
-                        "feedback": None,
-                        "rating_out_of_10": None
-                    })
-                    
-                    # Round 2: HR (with empty list check)
-                    if not hr_interviewers:
-                        print("No HR interviewers available, using last available interviewer or default")
-                        hr = available_interviewers[-1] if available_interviewers else {
-                            "id": str(uuid.uuid4()),
-                            "name": "Default HR",
-                            "email": "hr@example.com",
-                            "expertise": ["Human Resources"]
-                        }
-                    else:
-                        hr = hr_interviewers[0]
-                    interviewer_assignments.append({
-                        "interviewer_id": hr.get("id"),
-                        "interviewer_email": hr.get("email"),
-                        "interviewer_name": hr.get("name"),
-                        "expertise": hr.get("expertise") or hr.get("department"),
-                        "isSelectedForNextRound": None,
-                        "feedback": None,
-                        "rating_out_of_10": None
-                    })
+                # Pick interviewers for each round category by expertise; technical
+                # interviewers are only needed from 3 rounds up, one per technical round
+                technical_interviewers, manager_interviewers, hr_interviewers = \
+                    InterviewCoreService._classify_interviewers(
+                        available_interviewers, technical_needed=no_of_interviews - 2
+                    )
+                
+                logger.debug(
+                    "Picked %d technical, %d manager and %d HR interviewers",
+                    len(technical_interviewers), len(manager_interviewers), len(hr_interviewers)
+                )
+                
+                if not manager_interviewers:
+                    manager_interviewers = available_interviewers[0:1] if available_interviewers else []
+                
+                if not hr_interviewers:
+                    hr_interviewers = available_interviewers[-1:] if available_interviewers else []
                 
-                elif no_of_interviews == 3:
-                    # Round 1: Technical
-                    tech = technical_interviewers[0]
-                    interviewer_assignments.append({
-                        "interviewer_id": tech.get("id"),
-                        "interviewer_email": tech.get("email"),
-                        "interviewer_name": tech.get("name"),
-                        "expertise": tech.get("expertise") or tech.get("department"),
-                        "isSelectedForNextRound": None,
-                        "feedback": None,
-                        "rating_out_of_10": None
-                    })
-                    
-                    # Round 2: Manager
-                    manager = manager_interviewers[0]
-                    interviewer_assignments.append({
-                        "interviewer_id": manager.get("id"),
-                        "interviewer_email": manager.get("email"),
-                        "interviewer_name": manager.get("name"),
-                        "expertise": manager.get("expertise") or manager.get("department"),
-                        "isSelectedForNextRound": None,
-                        "feedback": None,
-                        "rating_out_of_10": None
-                    })
-                    
-                    # Round 3: HR
-                    hr = hr_interviewers[0]
-                    interviewer_assignments.append({
-                        "interviewer_id": hr.get("id"),
-                        "interviewer_email": hr.get("email"),
-                        "interviewer_name": hr.get("name"),
-                        "expertise": hr.get("expertise") or hr.get("department"),
-                        "isSelectedForNextRound": None,
-                        "feedback": None,
-                        "rating_out_of_10": None
-                    })
-                    
-                elif no_of_interviews == 4:
-                    # Round 1: Technical 1
-                    tech1 = technical_interviewers[0]
-                    interviewer_assignments.append({
-                        "interviewer_id": tech1.get("id"),
-                        "interviewer_email": tech1.get("email"),
-                        "interviewer_name": tech1.get("name"),
-                        "expertise": tech1.get("expertise") or tech1.get("department"),
-                        "isSelectedForNextRound": None,
-                        "feedback": None,
-                        "rating_out_of_10": None
-                    })
-                    
-                    # Round 2: Technical 2 (different interviewer if possible)
-                    tech2 = technical_interviewers[1] if len(technical_interviewers) > 1 else technical_interviewers[0]
-                    interviewer_assignments.append({
-                        "interviewer_id": tech2.get("id"),
-                        "interviewer_email": tech2.get("email"),
-                        "interviewer_name": tech2.get("name"),
-                        "expertise": tech2.get("expertise") or tech2.get("department"),
-                        "isSelectedForNextRound": None,
-                        "feedback": None,
-                        "rating_out_of_10": None
-                    })
-                    
-                    # Round 3: Manager
-                    manager = manager_interviewers[0]
-                    interviewer_assignments.append({
-                        "interviewer_id": manager.get("id"),
-                        "interviewer_email": manager.get("email"),
-                        "interviewer_name": manager.get("name"),
-                        "expertise": manager.get("expertise") or manager.get("department"),
-                        "isSelectedForNextRound": None,
-                        "feedback": None,
-                        "rating_out_of_10": None
-                    })
-                    
-                    # Round 4: HR
-                    hr = hr_interviewers[0]
-                    interviewer_assignments.append({
-                        "interviewer_id": hr.get("id"),
-                        "interviewer_email": hr.get("email"),
-                        "interviewer_name": hr.get("name"),
-                        "expertise": hr.get("expertise") or hr.get("department"),
-                        "isSelectedForNextRound": None,
-                        "feedback": None,
-                        "rating_out_of_10": None
-                    })
+                # Fill the rounds from the plan; a category's second round takes its next
+                # interviewer if there is one, otherwise the same interviewer again
+                pools = {
+                    'technical': technical_interviewers,
+                    'manager': manager_interviewers,
+                    'hr': hr_interviewers
+                }
+                next_index = dict.fromkeys(pools, 0)
+                for category in _ROUND_PLANS[no_of_interviews]:
+                    pool = pools[category]
+                    if not pool:
+                        logger.warning("No %s interviewers available, cannot assign interviewers", category)
+                        return []
+                    interviewer = pool[min(next_index[category], len(pool) - 1)]
+                    next_index[category] += 1
+                    interviewer_assignments.append(InterviewCoreService._build_round_assignment(interviewer))
             
             return interviewer_assignments
         except Exception as e:
-            print(f"Error assigning interviewers: {e}")
+            logger.exception("Error assigning interviewers: %s", e)
             return []
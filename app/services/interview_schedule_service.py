@@ -28,8 +28,10 @@ class InterviewScheduleService:
             Dictionary mapping candidate IDs to lists of scheduled interview events
         """
         try:
-            # Get all candidates data to include in invitations
-            all_candidates = {c.get("id"): c for c in CandidateService.get_all_candidates()}
+            # Get the data of just these candidates to include in invitations
+            all_candidates = CandidateService.get_candidates_by_ids(
+                [interview_candidate.get("candidate_id") for interview_candidate in interview_candidates]
+            )
             
             # Results dictionary: candidate_id -> list of scheduled events
             scheduled_events = {}
@@ -2,8 +2,10 @@
 Main service for handling interview scheduling and candidate shortlisting
 This file acts as a facade for the specialized service modules
 """
-from typing import Dict, Any, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional, Tuple, Union
 
+from app.schemas.interview_schema import INTERVIEW_STATUSES
 from app.services.interview_core_service import InterviewCoreService
 from app.services.interview_schedule_service import InterviewScheduleService
 from app.services.interview_reschedule_service import InterviewRescheduleService
@@ -60,17 +62,58 @@ class InterviewService:
         return InterviewCoreService.get_all_interview_candidates()
     
     @staticmethod
-    def get_interview_candidates_by_job_id(job_id: str) -> List[Dict[str, Any]]:
+    def get_interview_candidates_by_job_id(job_id: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
         """
         Get interview candidates for a specific job
         
         Args:
             job_id: ID of the job
+            limit: Optional maximum number of candidates to fetch
         
         Returns:
             List of interview candidates for the job
         """
-        return InterviewCoreService.get_interview_candidates_by_job_id(job_id)
+        return InterviewCoreService.get_interview_candidates_by_job_id(job_id, limit=limit)
+    
+    @staticmethod
+    def get_interview_candidates_by_status(status: Union[str, List[str]]) -> List[Dict[str, Any]]:
+        """
+        Get interview candidates with a specific tracking status
+        
+        Args:
+            status: Tracking status of the interview candidates, or a list of statuses
+        
+        Returns:
+            List of interview candidates with the status
+        """
+        return InterviewCoreService.get_interview_candidates_by_status(status)
+    
+    @staticmethod
+    def get_interview_candidates_by_event_id(event_id: str) -> List[Dict[str, Any]]:
+        """
+        Get the interview candidates with a round scheduled as the given calendar event
+        
+        Args:
+            event_id: ID of the scheduled calendar event
+        
+        Returns:
+            List of interview candidates referencing the event
+        """
+        return InterviewCoreService.get_interview_candidates_by_event_id(event_id)
+    
+    @staticmethod
+    def find_round_by_event_id(candidate: Dict[str, Any], event_id: str) -> Optional[int]:
+        """
+        Find which round of an interview candidate is scheduled as the given calendar event
+        
+        Args:
+            candidate: Interview candidate record
+            event_id: ID of the scheduled calendar event
+        
+        Returns:
+            Index of the round in the feedback array, or None if no round uses the event
+        """
+        return InterviewCoreService.find_round_by_event_id(candidate, event_id)
     
     @staticmethod
     def update_interview_candidate(candidate_id: str, data: Dict[str, Any]) -> None:
@@ -103,6 +146,13 @@ class InterviewService:
         """
         return InterviewCoreService.get_all_interviewers()
     
+    @staticmethod
+    def invalidate_interviewers_cache() -> None:
+        """
+        Drop the cached interviewers so the next read fetches them from Firestore
+        """
+        InterviewCoreService.invalidate_interviewers_cache()
+    
     @staticmethod
     def assign_interviewers(no_of_interviews: int, specific_interviewers: Optional[List[str]] = None) -> List[Dict[str, Any]]:
         """
@@ -396,7 +446,7 @@ class InterviewService:
                     "interviewer_email": interviewer.get("interviewer_email", "interviewer@example.com"),
                     "department": interviewer.get("department", "Engineering"),
                     "isSelectedForNextRound": "",
-                    "rating_out_of_10": "",
+                    "rating_out_of_10": None,
                     "meet_link": meet_link,
                     "scheduled_time": formatted_time,
                     "round_type": round_type,
@@ -479,29 +529,64 @@ class InterviewService:
         """
         Get statistics about interview candidates for a job by their tracking status
         
+        Candidates whose status is missing, null or not a tracking status have not been
+        tracked yet and are counted as scheduled.
+        
         Args:
             job_id: ID of the job
             
         Returns:
-            Dictionary with counts of candidates in each status
+            Dictionary with counts of candidates in each status, the total and
+            the number of completed rounds
         """
+        counted_statuses = [status for status in INTERVIEW_STATUSES if status != "scheduled"]
+        
+        # Count server-side with aggregation queries instead of downloading every candidate;
+        # the counts are independent, so they run concurrently. The total and the completed
+        # rounds come back together from one aggregation query.
+        with ThreadPoolExecutor(max_workers=len(counted_statuses) + 1) as executor:
+            total_future = executor.submit(InterviewCoreService.summarize_interview_candidates, job_id)
+            status_futures = {
+                status: executor.submit(InterviewCoreService.count_interview_candidates, job_id, status)
+                for status in counted_statuses
+            }
+            summary = total_future.result()
+            counts = {status: future.result() for status, future in status_futures.items()}
+        
+        if summary is not None and None not in counts.values():
+            # Scheduled is whatever the other statuses do not cover, which includes the
+            # untracked candidates Firestore cannot count directly
+            stats = {"total": summary["total"]}
+            stats["scheduled"] = summary["total"] - sum(counts.values())
+            stats.update(counts)
+            stats["completed_rounds"] = summary["completed_rounds"]
+            return stats
+        
+        # Fall back to counting the documents locally if aggregation is unavailable
         candidates = InterviewService.get_interview_candidates_by_job_id(job_id)
+        return InterviewService.compute_tracking_statistics(candidates)
+    
+    @staticmethod
+    def compute_tracking_statistics(candidates: List[Dict[str, Any]]) -> Dict[str, int]:
+        """
+        Count interview candidates already in memory by their tracking status
+        
+        Gives the same result as get_tracking_statistics_by_job for the same candidates.
+        
+        Args:
+            candidates: Interview candidates to count
+            
+        Returns:
+            Dictionary with counts of candidates in each status, the total and
+            the number of completed rounds
+        """
+        stats = {"total": len(candidates)}
+        stats.update(dict.fromkeys(INTERVIEW_STATUSES, 0))
+        stats["completed_rounds"] = 0
         
-        # Initialize statistics
-        stats = {
-            "total": len(candidates),
-            "scheduled": 0,
-            "in_progress": 0,
-            "rejected": 0,
-            "passed": 0,
-            "selected": 0,
-            "completed": 0
-        }
-        
-        # Count candidates by status
         for candidate in candidates:
-            status = candidate.get("status", "scheduled")
-            if status in stats:
-                stats[status] += 1
+            status = candidate.get("status")
+            stats[status if status in INTERVIEW_STATUSES else "scheduled"] += 1
+            stats["completed_rounds"] += candidate.get("completedRounds") or 0
         
         return stats
@@ -1,16 +1,24 @@
 """
 Candidate shortlisting functionality
 """
+import heapq
+import logging
 import random
 import string
 import uuid
-from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
 from typing import Dict, Any, List, Tuple, Optional
 from app.database.firebase_db import FirestoreDB
 from app.services.candidate_service import CandidateService
 from app.services.job_service import JobService
 from app.services.interview_core_service import InterviewCoreService
 
+logger = logging.getLogger(__name__)
+
+# Interviews are scheduled in Asia/Kolkata, which has a fixed UTC offset
+INTERVIEW_TIMEZONE = timezone(timedelta(hours=5, minutes=30))
+
 
 class InterviewShortlistService:
     """Service for handling candidate shortlisting"""
@@ -19,6 +27,13 @@ class InterviewShortlistService:
     CANDIDATES_COLLECTION = "candidates_data"
     INTERVIEW_CANDIDATES_COLLECTION = "interview_candidates"
     
+    # Department of the interviewer for each round type
+    ROUND_TYPE_DEPARTMENTS = {
+        "Technical": "Engineering", 
+        "Manager": "Management", 
+        "HR": "Human Resources"
+    }
+    
     @staticmethod
     def shortlist_candidates(
         job_id: str, 
@@ -39,31 +54,42 @@ class InterviewShortlistService:
             Tuple of (shortlisted candidates, created interview candidate records)
         """
         try:
-            # Get job details
-            job = JobService.get_job_posting(job_id)
-            if not job:
-                print(f"Job with ID {job_id} not found")
-                return [], []
-            
-            # Try to get candidates using Firebase query directly for robustness
-            try:
-                candidates = FirestoreDB.execute_query(
+            # The job, its candidates and its existing interviews are independent reads,
+            # so they are fetched concurrently
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                job_future = executor.submit(JobService.get_job_posting, job_id)
+                candidates_future = executor.submit(
+                    FirestoreDB.execute_query,
                     InterviewShortlistService.CANDIDATES_COLLECTION,
                     "job_id",
                     "==",
                     job_id
                 )
-                
-                if not candidates:
-                    print(f"No candidates found using direct query. Falling back to service method.")
-                    candidates = CandidateService.get_candidates_by_job_id(job_id)
+                existing_interviews_future = executor.submit(
+                    FirestoreDB.execute_query,
+                    InterviewShortlistService.INTERVIEW_CANDIDATES_COLLECTION,
+                    "job_id",
+                    "==",
+                    job_id
+                )
+            
+            # Get job details
+            job = job_future.result()
+            if not job:
+                logger.warning("Job with ID %s not found", job_id)
+                return [], []
+            
+            # The service method runs the same job_id query, so an empty result is final
+            # and the service is only retried if the direct query failed
+            try:
+                candidates = candidates_future.result()
             except Exception as query_error:
-                print(f"Error using direct Firebase query: {query_error}")
+                logger.warning("Error using direct Firebase query: %s", query_error)
                 candidates = CandidateService.get_candidates_by_job_id(job_id)
             
             # Generate emergency candidates if none found
             if not candidates:
-                print(f"No candidates found for job {job_id}, creating emergency candidates")
+                logger.warning("No candidates found for job %s, creating emergency candidates", job_id)
                 # Create emergency candidates
                 emergency_candidates = InterviewShortlistService._create_emergency_candidates(job_id, number_of_candidates)
                 
@@ -74,35 +100,28 @@ class InterviewShortlistService:
                 
                 candidates = emergency_candidates
             
-            # Sort candidates by AI fit score (descending)
+            # Get the top N candidates by AI fit score (descending) without sorting the whole pool
             try:
-                sorted_candidates = sorted(
+                shortlisted = heapq.nlargest(
+                    number_of_candidates,
                     candidates,
-                    key=lambda c: int(c.get("ai_fit_score", 0)),
-                    reverse=True
+                    key=CandidateService.fit_score
                 )
             except (ValueError, TypeError) as e:
-                print(f"Error sorting candidates by AI fit score: {e}")
+                logger.warning("Error sorting candidates by AI fit score: %s", e)
                 # Fall back to unsorted list
-                sorted_candidates = candidates
+                shortlisted = candidates[:min(number_of_candidates, len(candidates))]
             
-            # Get the top N candidates
-            shortlisted = sorted_candidates[:min(number_of_candidates, len(sorted_candidates))]
-            print(f"Shortlisted {len(shortlisted)} candidates out of {len(candidates)}")
+            logger.debug("Shortlisted %d candidates out of %d", len(shortlisted), len(candidates))
             
             # Check the interview service for existing interviews
             try:
-                existing_interviews = FirestoreDB.execute_query(
-                    InterviewShortlistService.INTERVIEW_CANDIDATES_COLLECTION,
-                    "job_id",
-                    "==",
-                    job_id
-                )
+                existing_interviews = existing_interviews_future.result()
                 
                 if existing_interviews:
-                    print(f"Found {len(existing_interviews)} existing interviews for job {job_id}")
+                    logger.debug("Found %d existing interviews for job %s", len(existing_interviews), job_id)
             except Exception as e:
-                print(f"Error checking for existing interviews: {e}")
+                logger.warning("Error checking for existing interviews: %s", e)
                 existing_interviews = []
             
             # Get interviewer assignments for each round
@@ -114,6 +133,21 @@ class InterviewShortlistService:
             # Create interview candidate records
             created_records = []
             
+            # One timestamp for the whole shortlist, so every record shares it. It is taken
+            # in the interviews' time zone (Asia/Kolkata), so the stored timestamps and the
+            # scheduled event times carry the same UTC offset on any host
+            now = datetime.now(INTERVIEW_TIMEZONE)
+            now_iso = now.isoformat()
+            
+            # Determine each round's type and department once; they are the same for every candidate
+            round_types = InterviewShortlistService._get_round_types(no_of_interviews)
+            round_plans = [
+                (round_type, InterviewShortlistService.ROUND_TYPE_DEPARTMENTS.get(round_type, "Engineering"))
+                for round_type in (
+                    round_types[i] if i < len(round_types) else "Technical" for i in range(no_of_interviews)
+                )
+            ]
+            
             for candidate in shortlisted:
                 # Get candidate details
                 candidate_name = candidate.get("name", "Candidate")
@@ -123,20 +157,7 @@ class InterviewShortlistService:
                 # Create feedback array with proper structure
                 feedback_array = []
                 
-                # Determine round types based on no_of_interviews
-                round_types = InterviewShortlistService._get_round_types(no_of_interviews)
-                
-                for i in range(no_of_interviews):
-                    # Get round type
-                    round_type = round_types[i] if i < len(round_types) else "Technical"
-                    
-                    # Get the department based on the round type
-                    department = {
-                        "Technical": "Engineering", 
-                        "Manager": "Management", 
-                        "HR": "Human Resources"
-                    }.get(round_type, "Engineering")
-                    
+                for i, (round_type, department) in enumerate(round_plans):
                     # Assign interviewer based on assignments or use placeholder
                     interviewer = interviewer_assignments[i] if i < len(interviewer_assignments) else {
                         "id": "", 
@@ -149,14 +170,14 @@ class InterviewShortlistService:
                     if i == 0:
                         # Calculate dates for the scheduled event - first round is 1 day ahead
                         days_ahead = 1  # First round is 1 day ahead
-                        interview_date = datetime.now() + timedelta(days=days_ahead)
+                        interview_date = now + timedelta(days=days_ahead)
                         # Set interview time to working hours (9AM - 5PM)
                         start_time = interview_date.replace(hour=10 + (i % 6), minute=0, second=0, microsecond=0)
                         end_time = start_time + timedelta(hours=1)  # 1 hour interview
                         
                         # Format dates in ISO format with timezone
-                        start_iso = start_time.strftime("%Y-%m-%dT%H:%M:%S+05:30")
-                        end_iso = end_time.strftime("%Y-%m-%dT%H:%M:%S+05:30")
+                        start_iso = start_time.isoformat()
+                        end_iso = end_time.isoformat()
                         
                         # Generate unique ID for the event
                         event_id = ''.join(random.choices(string.ascii_lowercase + string.digits, k=22))
@@ -203,7 +224,7 @@ class InterviewShortlistService:
                             )
                             
                             if calendar_event:
-                                print(f"Created calendar event: {calendar_event.get('id')}")
+                                logger.debug("Created calendar event: %s", calendar_event.get('id'))
                                 event_id = calendar_event.get('id', event_id)
                                 meet_link = calendar_event.get('hangoutLink', meet_link)
                                 html_link = calendar_event.get('htmlLink', f"https://www.google.com/calendar/event?eid={event_id}")
@@ -222,7 +243,7 @@ class InterviewShortlistService:
                                     round_type=round_type
                                 )
                         except Exception as calendar_error:
-                            print(f"Error creating calendar event: {calendar_error}")
+                            logger.warning("Error creating calendar event: %s", calendar_error)
                             # Continue with mock data
                     else:
                         # For future rounds, we'll only create placeholder data
@@ -275,8 +296,8 @@ class InterviewShortlistService:
                     "completedRounds": 0,
                     "nextRoundIndex": 0,  # Index of the next round to be conducted
                     "status": "scheduled",
-                    "last_updated": datetime.now().isoformat(),
-                    "created_at": datetime.now().isoformat(),
+                    "last_updated": now_iso,
+                    "created_at": now_iso,
                     "current_round_scheduled": True  # First round is scheduled
                 }
                 
@@ -291,7 +312,7 @@ class InterviewShortlistService:
             
             return shortlisted, created_records
         except Exception as e:
-            print(f"Error shortlisting candidates: {e}")
+            logger.exception("Error shortlisting candidates: %s", e)
             return [], []
     
     @staticmethod
@@ -355,7 +376,7 @@ class InterviewShortlistService:
                 min_years = 3
                 max_years = 7
         except Exception as e:
-            print(f"Error getting job details for emergency candidates: {e}")
+            logger.warning("Error getting job details for emergency candidates: %s", e)
             job_title = "Software Engineer"
             job_description = "Software development position"
             min_years = 3
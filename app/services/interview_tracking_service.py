@@ -1,14 +1,32 @@
 """
 Service for tracking and updating interview status and completed rounds
 """
+import logging
 import random
 import string
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 
 from app.database.firebase_db import FirestoreDB
 from app.services.interview_core_service import InterviewCoreService
 
+logger = logging.getLogger(__name__)
+
+# Per-interviewer counters kept in the interviewer stats collection
+INTERVIEWER_STAT_FIELDS = ('total_interviews', 'rated_interviews', 'total_rating_sum', 'selections', 'rejections')
+
+# Feedback summaries are served from memory for repeated dashboard reads. Writes
+# through this service drop the affected entries; the TTL bounds staleness from
+# writes made elsewhere. At most FEEDBACK_SUMMARY_CACHE_MAX_SIZE interviewers are
+# kept, dropping the least recently read first.
+FEEDBACK_SUMMARY_CACHE_TTL_SECONDS = 30
+FEEDBACK_SUMMARY_CACHE_MAX_SIZE = 1024
+_feedback_summary_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+_feedback_summary_cache_lock = threading.Lock()
+
 
 class InterviewTrackingService:
     """Service for tracking interview progress and status updates"""
@@ -58,86 +76,237 @@ class InterviewTrackingService:
             return f"{hour}AM"
 
     @staticmethod
-    def update_interview_tracking_status(candidate_id: str) -> bool:
+    def _compute_tracking_update(feedback_list: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Work out the completedRounds and status fields from feedback data
+        
+        Rounds missing a meet link or scheduled time get one, in place.
+        
+        Args:
+            feedback_list: Feedback array of the interview candidate
+            
+        Returns:
+            Fields to update: completedRounds, status and, if rounds were filled in, feedback
+        """
+        # Initialize default values
+        completed_rounds = 0
+        status = 'scheduled'  # Default status
+        
+        # Check if all feedback rounds have gmeet_link
+        update_data = {}
+        last_index = len(feedback_list) - 1
+        
+        # Count completed rounds based on non-empty feedback
+        for idx, round_feedback in enumerate(feedback_list):
+            # Ensure each round has a meet link
+            if not round_feedback.get('meet_link'):
+                round_feedback['meet_link'] = InterviewTrackingService.generate_gmeet_link()
+                update_data['feedback'] = feedback_list
+            
+            # Ensure each round has a scheduled time
+            if not round_feedback.get('scheduled_time'):
+                round_feedback['scheduled_time'] = InterviewTrackingService.format_scheduled_time()
+                update_data['feedback'] = feedback_list
+            
+            # Read the selection once; it decides both completion and status
+            selected = round_feedback.get('isSelectedForNextRound')
+            
+            # Count completed rounds
+            if round_feedback and (
+                round_feedback.get('feedback') or
+                selected is not None or
+                round_feedback.get('rating_out_of_10') is not None
+            ):
+                completed_rounds = idx + 1
+                
+                # Update status based on isSelectedForNextRound value
+                if selected is True or selected == "yes":
+                    status = 'passed' if idx < last_index else 'selected'
+                elif selected is False or selected == "no":
+                    status = 'rejected'
+                else:
+                    status = 'in_progress'
+        
+        # Special case: if completed_rounds is 1, the status would be "completed", but a round
+        # with a gmeet_link sets it to "scheduled". The loop above gave every round a meet
+        # link, so that is always the case and no second scan is needed.
+        if completed_rounds == 1:
+            status = 'scheduled'
+        
+        # Add status and completedRounds to update data
+        update_data['completedRounds'] = completed_rounds
+        update_data['status'] = status
+        
+        return update_data
+    
+    @staticmethod
+    def _round_stats(round_feedback: Dict[str, Any]) -> Dict[str, int]:
+        """
+        Work out what one feedback round contributes to its interviewer's stats
+        
+        Args:
+            round_feedback: Feedback entry of a single round
+            
+        Returns:
+            Dictionary with a value for each of INTERVIEWER_STAT_FIELDS
+        """
+        rating = InterviewCoreService.parse_rating(round_feedback.get('rating_out_of_10'))
+        selected = round_feedback.get('isSelectedForNextRound')
+        if selected == "":
+            selected = None
+        completed = bool(round_feedback.get('feedback')) or selected is not None or rating is not None
+        return {
+            'total_interviews': 1 if completed else 0,
+            'rated_interviews': 1 if rating is not None else 0,
+            'total_rating_sum': rating or 0,
+            'selections': 1 if selected is True or selected == "yes" else 0,
+            'rejections': 1 if selected is False or selected == "no" else 0
+        }
+    
+    @staticmethod
+    def get_interviewer_feedback_summary(interviewer_id: str) -> Dict[str, Any]:
+        """
+        Summarise the feedback an interviewer has given
+        
+        Reads the interviewer's counters from the interviewer stats collection, which
+        submit_interview_feedback keeps up to date, instead of scanning every candidate.
+        Results are cached for FEEDBACK_SUMMARY_CACHE_TTL_SECONDS.
+        
+        Args:
+            interviewer_id: ID of the interviewer
+            
+        Returns:
+            Dictionary with total_interviews, average_rating, selections, rejections
+            and selection_rate
+        """
+        with _feedback_summary_cache_lock:
+            cached = _feedback_summary_cache.get(interviewer_id)
+            if cached is not None:
+                if time.time() - cached['fetched_at'] < FEEDBACK_SUMMARY_CACHE_TTL_SECONDS:
+                    _feedback_summary_cache.move_to_end(interviewer_id)
+                    return dict(cached['summary'])
+                del _feedback_summary_cache[interviewer_id]
+        
+        stats = FirestoreDB.get_document(InterviewCoreService.INTERVIEWER_STATS_COLLECTION, interviewer_id) or {}
+        total_interviews = stats.get('total_interviews', 0)
+        rated_interviews = stats.get('rated_interviews', 0)
+        selections = stats.get('selections', 0)
+        rejections = stats.get('rejections', 0)
+        decisions = selections + rejections
+        summary = {
+            'interviewer_id': interviewer_id,
+            'total_interviews': total_interviews,
+            'average_rating': round(stats.get('total_rating_sum', 0) / rated_interviews, 2) if rated_interviews else None,
+            'selections': selections,
+            'rejections': rejections,
+            'selection_rate': round(selections / decisions, 2) if decisions else None
+        }
+        with _feedback_summary_cache_lock:
+            _feedback_summary_cache[interviewer_id] = {'summary': summary, 'fetched_at': time.time()}
+            _feedback_summary_cache.move_to_end(interviewer_id)
+            while len(_feedback_summary_cache) > FEEDBACK_SUMMARY_CACHE_MAX_SIZE:
+                _feedback_summary_cache.popitem(last=False)
+        return dict(summary)
+    
+    @staticmethod
+    def rebuild_interviewer_stats() -> Dict[str, Any]:
+        """
+        Recompute every interviewer's stats from the interview candidates' feedback
+        
+        Runs in a single transaction with the candidate reads, so feedback submitted
+        while it runs is not lost. Interviewers no longer referenced by any feedback
+        have their stats reset to zero. Use this to correct the stats after feedback
+        was written outside submit_interview_feedback.
+        
+        Returns:
+            Dictionary with the number of interviewers whose stats were written
+        """
+        def build_stats(candidates) -> Dict[str, Dict[str, Any]]:
+            stats_by_interviewer: Dict[str, Dict[str, Any]] = {}
+            for candidate in candidates:
+                for round_feedback in candidate.get('feedback') or []:
+                    interviewer_id = round_feedback.get('interviewer_id') if isinstance(round_feedback, dict) else None
+                    if not interviewer_id:
+                        continue
+                    stats = stats_by_interviewer.get(interviewer_id)
+                    if stats is None:
+                        stats = stats_by_interviewer[interviewer_id] = {
+                            'id': interviewer_id, **dict.fromkeys(INTERVIEWER_STAT_FIELDS, 0)
+                        }
+                    for field, value in InterviewTrackingService._round_stats(round_feedback).items():
+                        stats[field] += value
+            return stats_by_interviewer
+        
+        written = FirestoreDB.rebuild_documents(
+            InterviewCoreService.COLLECTION_NAME,
+            InterviewCoreService.INTERVIEWER_STATS_COLLECTION,
+            build_stats,
+            dict.fromkeys(INTERVIEWER_STAT_FIELDS, 0)
+        )
+        with _feedback_summary_cache_lock:
+            _feedback_summary_cache.clear()
+        if written is None:
+            logger.error("Error rebuilding interviewer stats")
+            return {'error': 'Transaction failed', 'interviewers': 0}
+        return {'interviewers': written}
+    
+    @staticmethod
+    def ensure_interviewer_stats() -> None:
+        """
+        Build the interviewer stats if the collection has never been populated
+        
+        Called once at startup, so feedback summaries are correct without a manual
+        rebuild. Once any stats exist, submit_interview_feedback keeps them current.
+        """
+        if FirestoreDB.count_documents(InterviewCoreService.INTERVIEWER_STATS_COLLECTION) == 0:
+            logger.info("Interviewer stats are empty, building them from the interview candidates")
+            InterviewTrackingService.rebuild_interviewer_stats()
+    
+    @staticmethod
+    def update_interview_tracking_status(candidate_id: str, candidate: Optional[Dict[str, Any]] = None) -> bool:
         """
         Update the completedRounds and status fields based on feedback data
         
         Args:
             candidate_id: ID of the interview candidate
+            candidate: Optional candidate record already read by the caller; it is
+                updated in place with the written fields
             
         Returns:
             True if the update was successful, False otherwise
         """
         try:
-            # Get the candidate record
-            candidate = InterviewCoreService.get_interview_candidate(candidate_id)
+            # Get the candidate record unless the caller already has it
+            if candidate is None:
+                candidate = InterviewCoreService.get_interview_candidate(candidate_id)
             if not candidate:
-                print(f"Cannot update tracking status: Candidate {candidate_id} not found")
+                logger.warning("Cannot update tracking status: Candidate %s not found", candidate_id)
                 return False
                 
-            feedback_list = candidate.get('feedback', [])
-            
-            # Initialize default values
-            completed_rounds = 0
-            status = 'scheduled'  # Default status
-            
-            # Check if all feedback rounds have gmeet_link
-            update_data = {}
-            
-            # Count completed rounds based on non-empty feedback
-            for idx, round_feedback in enumerate(feedback_list):
-                # Ensure each round has a meet link
-                if not round_feedback.get('meet_link'):
-                    feedback_list[idx]['meet_link'] = InterviewTrackingService.generate_gmeet_link()
-                    update_data['feedback'] = feedback_list
-                
-                # Ensure each round has a scheduled time
-                if not round_feedback.get('scheduled_time'):
-                    feedback_list[idx]['scheduled_time'] = InterviewTrackingService.format_scheduled_time()
-                    update_data['feedback'] = feedback_list
-                
-                # Count completed rounds
-                if round_feedback and (
-                    round_feedback.get('feedback') or 
-                    round_feedback.get('isSelectedForNextRound') is not None or
-                    round_feedback.get('rating_out_of_10') is not None
-                ):
-                    completed_rounds = idx + 1
-                    
-                    # Update status based on isSelectedForNextRound value
-                    selected = round_feedback.get('isSelectedForNextRound')
-                    if selected is True or selected == "yes":
-                        status = 'passed' if idx < len(feedback_list) - 1 else 'selected'
-                    elif selected is False or selected == "no":
-                        status = 'rejected'
-                    else:
-                        status = 'in_progress'
-            
-            # Special case: if completed_rounds is 1, set status to "completed"
-            if completed_rounds == 1:
-                status = 'completed'
-                
-            # Special case: if any round has a gmeet_link and completed_rounds is 1, set status to "scheduled"
-            has_meet_link = any(round_feedback.get('meet_link') for round_feedback in feedback_list)
-            if has_meet_link and completed_rounds == 1:
-                status = 'scheduled'
-            
-            # Add status and completedRounds to update data
-            update_data['completedRounds'] = completed_rounds
-            update_data['status'] = status
+            update_data = InterviewTrackingService._compute_tracking_update(candidate.get('feedback', []))
+            completed_rounds = update_data['completedRounds']
+            status = update_data['status']
             
             # Update the candidate record
             InterviewCoreService.update_interview_candidate(candidate_id, update_data)
+            candidate.update(update_data)
             
-            print(f"Updated candidate {candidate_id} tracking status to: completedRounds={completed_rounds}, status={status}")
+            logger.debug(
+                "Updated candidate %s tracking status to: completedRounds=%d, status=%s",
+                candidate_id, completed_rounds, status
+            )
             return True
             
         except Exception as e:
-            print(f"Error updating interview tracking status: {e}")
+            logger.exception("Error updating interview tracking status: %s", e)
             return False
     
     @staticmethod
-    def initialize_feedback_array(candidate_id: str, num_rounds: int = 2) -> bool:
+    def initialize_feedback_array(
+        candidate_id: str,
+        num_rounds: int = 2,
+        candidate: Optional[Dict[str, Any]] = None
+    ) -> bool:
         """
         Initialize the feedback array for a candidate
         
@@ -147,15 +316,18 @@ class InterviewTrackingService:
         Args:
             candidate_id: ID of the interview candidate
             num_rounds: Number of rounds to initialize (default: 2)
+            candidate: Optional candidate record already read by the caller; it is
+                updated in place with the written feedback
             
         Returns:
             True if successful, False otherwise
         """
         try:
-            # Get the candidate record
-            candidate = InterviewCoreService.get_interview_candidate(candidate_id)
+            # Get the candidate record unless the caller already has it
+            if candidate is None:
+                candidate = InterviewCoreService.get_interview_candidate(candidate_id)
             if not candidate:
-                print(f"Cannot initialize feedback: Candidate {candidate_id} not found")
+                logger.warning("Cannot initialize feedback: Candidate %s not found", candidate_id)
                 return False
             
             feedback_list = candidate.get('feedback', [])
@@ -209,7 +381,8 @@ class InterviewTrackingService:
                     candidate_id,
                     {'feedback': feedback_list}
                 )
-                print(f"Initialized feedback array for candidate {candidate_id} with {num_rounds} rounds")
+                candidate['feedback'] = feedback_list
+                logger.debug("Initialized feedback array for candidate %s with %d rounds", candidate_id, num_rounds)
             
             # Ensure each existing feedback item has meet_link and scheduled_time
             else:
@@ -229,12 +402,12 @@ class InterviewTrackingService:
                         candidate_id,
                         {'feedback': feedback_list}
                     )
-                    print(f"Updated feedback array for candidate {candidate_id} with missing fields")
+                    logger.debug("Updated feedback array for candidate %s with missing fields", candidate_id)
             
             return True
         
         except Exception as e:
-            print(f"Error initializing feedback array: {e}")
+            logger.exception("Error initializing feedback array: %s", e)
             return False
     
     @staticmethod
@@ -243,7 +416,8 @@ class InterviewTrackingService:
         round_index: int, 
         feedback: str, 
         rating: int, 
-        selected_for_next: bool
+        selected_for_next: bool,
+        candidate: Optional[Dict[str, Any]] = None
     ) -> bool:
         """
         Submit feedback for an interview round and update tracking status
@@ -254,23 +428,33 @@ class InterviewTrackingService:
             feedback: Feedback text
             rating: Rating out of 10
             selected_for_next: Whether the candidate is selected for the next round
+            candidate: Optional candidate record already read by the caller; it is
+                updated in place so the caller holds the post-update state
             
         Returns:
             True if feedback was submitted successfully, False otherwise
         """
-        try:
-            # Get the candidate record
-            candidate = InterviewCoreService.get_interview_candidate(candidate_id)
-            if not candidate:
-                print(f"Cannot submit feedback: Candidate {candidate_id} not found")
-                return False
-                
-            feedback_list = candidate.get('feedback', [])
+        # Change to the round interviewer's stats, worked out from the state the
+        # transaction finally commits against
+        stats_change: Dict[str, Any] = {}
+        
+        def stats_increments() -> List[Tuple[str, str, Dict[str, Any]]]:
+            if stats_change.get('interviewer_id') and stats_change.get('increments'):
+                return [(
+                    InterviewCoreService.INTERVIEWER_STATS_COLLECTION,
+                    stats_change['interviewer_id'],
+                    stats_change['increments']
+                )]
+            return []
+        
+        def apply_feedback(current: Dict[str, Any]) -> Dict[str, Any]:
+            feedback_list = current.get('feedback', [])
             
             # Ensure the feedback list is long enough
             if len(feedback_list) <= round_index:
-                print(f"Cannot submit feedback: Round index {round_index} out of range")
-                return False
+                raise ValueError(f"Round index {round_index} out of range")
+            
+            previous_stats = InterviewTrackingService._round_stats(feedback_list[round_index])
                 
             # Ensure the round has a meet link
             if not feedback_list[round_index].get('meet_link'):
@@ -285,18 +469,8 @@ class InterviewTrackingService:
             feedback_list[round_index]['rating_out_of_10'] = rating
             feedback_list[round_index]['isSelectedForNextRound'] = selected_for_next
             
-            # Update the feedback list
-            InterviewCoreService.update_interview_candidate(
-                candidate_id,
-                {'feedback': feedback_list}
-            )
-            
-            # Update tracking status
-            InterviewTrackingService.update_interview_tracking_status(candidate_id)
-            
             # Special case: if this is round 0 and the candidate is selected for next round
             # and feedback and rating are provided, schedule the next round automatically
-            next_round_scheduled = False
             if (round_index == 0 and selected_for_next and 
                 feedback and rating is not None and 
                 round_index + 1 < len(feedback_list)):
@@ -310,50 +484,92 @@ class InterviewTrackingService:
                     # Schedule 2 days later than current round
                     feedback_list[round_index + 1]['scheduled_time'] = InterviewTrackingService.format_scheduled_time()
                 
-                # Update the feedback list with next round's meet link and scheduled time
-                InterviewCoreService.update_interview_candidate(
-                    candidate_id,
-                    {'feedback': feedback_list}
-                )
-                
-                print(f"Generated Google Meet link for next round: {feedback_list[round_index + 1].get('meet_link')}")
-                next_round_scheduled = True
+                logger.debug("Generated Google Meet link for next round: %s", feedback_list[round_index + 1].get('meet_link'))
+            
+            new_stats = InterviewTrackingService._round_stats(feedback_list[round_index])
+            stats_change['interviewer_id'] = feedback_list[round_index].get('interviewer_id')
+            stats_change['increments'] = {
+                field: new_stats[field] - previous_stats[field]
+                for field in INTERVIEWER_STAT_FIELDS
+                if new_stats[field] != previous_stats[field]
+            }
+            
+            # Write the feedback and the resulting tracking status together
+            update_data = InterviewTrackingService._compute_tracking_update(feedback_list)
+            update_data['feedback'] = feedback_list
+            return update_data
+        
+        try:
+            # Normalise the rating once here so readers can use the stored value as is;
+            # a rating that is not a number fails the submission below
+            rating = int(rating) if rating is not None else None
+            
+            # Read, update and write the candidate in one transaction so concurrent
+            # feedback submissions cannot overwrite each other; the interviewer's stats
+            # are committed with it, keeping the feedback summary current
+            updated = InterviewCoreService.update_interview_candidate_atomically(
+                candidate_id, apply_feedback, stats_increments
+            )
+            if not updated:
+                logger.warning("Cannot submit feedback: Candidate %s not found or update failed", candidate_id)
+                return False
+            
+            if stats_change.get('increments'):
+                with _feedback_summary_cache_lock:
+                    _feedback_summary_cache.pop(stats_change['interviewer_id'], None)
             
-            print(f"Submitted feedback for candidate {candidate_id}, round {round_index}")
+            if candidate is not None:
+                candidate.update(updated)
+            
+            logger.debug("Submitted feedback for candidate %s, round %d", candidate_id, round_index)
             return True
             
         except Exception as e:
-            print(f"Error submitting interview feedback: {e}")
+            logger.exception("Error submitting interview feedback: %s", e)
             return False
     
     @staticmethod
-    def bulk_update_tracking_status() -> Dict[str, Any]:
+    def bulk_update_tracking_status(candidates: Optional[List[Dict[str, Any]]] = None) -> Dict[str, Any]:
         """
         Update tracking status for all interview candidates
         
+        The statuses are computed from the candidate records already read and written
+        back with batched writes, rather than re-reading and updating each candidate.
+        
+        Args:
+            candidates: Optional candidate records to update instead of all candidates;
+                they are updated in place with the written fields
+        
         Returns:
             Dictionary with counts of updated and failed records
         """
         try:
-            candidates = InterviewCoreService.get_all_interview_candidates()
+            if candidates is None:
+                candidates = InterviewCoreService.get_all_interview_candidates()
             
-            success_count = 0
+            updates = {}
             failure_count = 0
             
             for candidate in candidates:
-                if InterviewTrackingService.update_interview_tracking_status(candidate.get('id')):
-                    success_count += 1
-                else:
+                candidate_id = candidate.get('id')
+                if not candidate_id:
                     failure_count += 1
+                    continue
+                update_data = InterviewTrackingService._compute_tracking_update(candidate.get('feedback', []))
+                updates[candidate_id] = update_data
+                candidate.update(update_data)
+            
+            failed_ids = InterviewCoreService.update_interview_candidates_bulk(updates)
+            failure_count += len(failed_ids)
                     
             return {
                 'total': len(candidates),
-                'updated': success_count,
+                'updated': len(updates) - len(failed_ids),
                 'failed': failure_count
             }
             
         except Exception as e:
-            print(f"Error in bulk update tracking status: {e}")
+            logger.exception("Error in bulk update tracking status: %s", e)
             return {
                 'error': str(e),
                 'updated': 0,
@@ -7,6 +7,23 @@ DB = FirestoreDB
 from app.schemas.job_schema import JobPostingCreate, JobPostingResponse
 
 
+def _role_name_search_fields(job_role_name: str) -> Dict[str, Any]:
+    """
+    Build the fields stored with a job so its role name can be searched
+    
+    Args:
+        job_role_name: Role name of the job
+    
+    Returns:
+        Dictionary with the lower-cased role name and its distinct trigrams
+    """
+    role_name_lower = job_role_name.lower()
+    return {
+        "job_role_name_lower": role_name_lower,
+        "job_role_name_trigrams": sorted({role_name_lower[i:i + 3] for i in range(len(role_name_lower) - 2)})
+    }
+
+
 class JobService:
     """Service for handling job posting operations"""
     
@@ -30,6 +47,8 @@ class JobService:
             # Create a new document
             job_data = job_posting.dict()
             job_data["job_id"] = job_id
+            # Stored lower-cased, with trigrams, so role name searches can use an index
+            job_data.update(_role_name_search_fields(job_data["job_role_name"]))
             
             # Add the document to the collection using FirestoreDB
             doc_id = FirestoreDB.create_document(JobService.COLLECTION_NAME, job_data)
@@ -91,18 +110,89 @@ class JobService:
             return None
     
     @staticmethod
-    def get_all_job_postings() -> List[JobPostingResponse]:
+    def get_all_job_postings(limit: Optional[int] = None) -> List[JobPostingResponse]:
         """
         Get all job postings
         
+        Args:
+            limit: Optional maximum number of job postings to return
+        
         Returns:
             List[JobPostingResponse]: List of all job postings
         """
         # Get all documents from the collection
-        docs = FirestoreDB.get_all_documents(JobService.COLLECTION_NAME)
+        docs = FirestoreDB.get_all_documents(JobService.COLLECTION_NAME, limit=limit)
         
         return [JobPostingResponse(**doc) for doc in docs]
     
+    @staticmethod
+    def backfill_role_name_search_fields() -> Dict[str, int]:
+        """
+        Store the role name search fields on jobs saved before they existed
+        
+        Run through POST /jobs/search-fields/rebuild, never on a lookup. Only the role
+        name fields are read, and the missing fields are written with batched updates
+        keyed by each job's document ID.
+        
+        Returns:
+            Dictionary with the number of jobs updated and the number that failed
+        """
+        jobs = FirestoreDB.get_all_documents_by_id(
+            JobService.COLLECTION_NAME,
+            fields=["job_role_name", "job_role_name_lower", "job_role_name_trigrams"]
+        )
+        updates = {}
+        for doc_id, job in jobs.items():
+            if not job.get("job_role_name"):
+                continue
+            search_fields = _role_name_search_fields(job["job_role_name"])
+            if any(job.get(field) != value for field, value in search_fields.items()):
+                updates[doc_id] = search_fields
+        
+        failed_ids = FirestoreDB.batch_update_documents(JobService.COLLECTION_NAME, updates) if updates else []
+        if failed_ids:
+            print(f"Could not store role name search fields for {len(failed_ids)} jobs")
+        return {"updated": len(updates) - len(failed_ids), "failed": len(failed_ids)}
+    
+    @staticmethod
+    def find_job_id_by_role_name(role_name: str) -> Optional[str]:
+        """
+        Find the first job posting whose role name contains the given text, ignoring case
+        
+        Args:
+            role_name: Text to look for in the job role names
+        
+        Returns:
+            ID of the matching job posting, or None if no job matches
+        """
+        role_name_lower = role_name.lower()
+        
+        # Any job containing the search text also contains its first trigram, so an
+        # indexed array_contains query narrows the jobs to check
+        if len(role_name_lower) >= 3:
+            jobs = FirestoreDB.execute_query(
+                JobService.COLLECTION_NAME, "job_role_name_trigrams", "array_contains", role_name_lower[:3],
+                fields=["job_id", "job_role_name_lower"]
+            )
+            for job in jobs:
+                if role_name_lower in (job.get("job_role_name_lower") or "") and job.get("job_id"):
+                    return job["job_id"]
+        
+        # Jobs saved before the search fields existed, and text shorter than a trigram,
+        # are only found by checking the role names; only the fields needed for matching
+        # are read. Jobs with job_role_name_lower also have trigrams, so after an indexed
+        # query they were already checked
+        jobs = FirestoreDB.get_all_documents(
+            JobService.COLLECTION_NAME, fields=["job_id", "job_role_name", "job_role_name_lower"]
+        )
+        for job in jobs:
+            if len(role_name_lower) >= 3 and job.get("job_role_name_lower"):
+                continue
+            job_role_lower = job.get("job_role_name_lower") or (job.get("job_role_name") or "").lower()
+            if role_name_lower in job_role_lower and job.get("job_id"):
+                return job["job_id"]
+        return None
+    
     @staticmethod
     def update_job_posting(job_id: str, job_data: Dict[str, Any]) -> Optional[JobPostingResponse]:
         """
@@ -117,6 +207,8 @@ class JobService:
         """
         # Remove None values
         job_data = {k: v for k, v in job_data.items() if v is not None}
+        if "job_role_name" in job_data:
+            job_data.update(_role_name_search_fields(job_data["job_role_name"]))
         
         # Update the document
         FirestoreDB.update_document(JobService.COLLECTION_NAME, job_id, job_data)
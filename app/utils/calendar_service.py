@@ -1,6 +1,7 @@
 import os
 import random
 import string
+from operator import itemgetter
 from typing import List, Dict, Any, Optional
 import datetime
 from dotenv import load_dotenv
@@ -278,7 +279,7 @@ class CalendarService:
                     busy_slots.append((start_dt, end_dt))
             
             # Sort busy slots by start time
-            busy_slots.sort(key=lambda x: x[0])
+            busy_slots.sort(key=itemgetter(0))
             
             # Look for available slots day by day
             current_date = start_date
@@ -298,12 +298,174 @@ class EmailService:
             print(f'An error occurred: {error}')
             raise
     
+    @classmethod
+    def build_gmail_service(cls):
+        """
+        Build a Gmail API service from the stored OAuth credentials
+        
+        Returns:
+            Gmail API service resource
+        """
+        oauth_manager = cls.get_oauth_manager()
+        creds = oauth_manager.get_credentials()
+        service = build('gmail', 'v1', credentials=creds)
+        print("Gmail API service built successfully")
+        return service
+    
+    @classmethod
+    def send_offer_letters_sync(cls, offers: List[Dict[str, Any]]) -> int:
+        """
+        Send several offer letters over one Gmail API service (blocking)
+        
+        Args:
+            offers: List of keyword-argument dictionaries for send_offer_letter_sync
+                (candidate, job_title and optionally company_name, hr_name, hr_email)
+            
+        Returns:
+            Number of offer letters sent successfully
+        """
+        if not offers:
+            return 0
+        try:
+            service = cls.build_gmail_service()
+        except Exception as e:
+            print(f"❌ Failed to build Gmail API service for offer letters: {e}")
+            return 0
+        
+        sent = 0
+        for offer in offers:
+            if cls.send_offer_letter_sync(service=service, **offer):
+                sent += 1
+        print(f"Sent {sent} of {len(offers)} offer letters")
+        return sent
+    
+    @classmethod
+    def send_offer_letter_sync(cls, candidate: FinalCandidateResponse, job_title: str, 
+                               company_name: str = "YourCompany, Inc.", 
+                               hr_name: str = "HR Representative", hr_email: str = "hr@company.com",
+                               service=None) -> bool:
+        """
+        Build and send the offer letter email with PDF attachment (blocking)
+        
+        Meant to be run as a FastAPI background task so the request does not
+        wait on PDF generation or the Gmail API.
+        
+        Args:
+            candidate: Candidate information
+            job_title: Job title
+            company_name: Name of the company
+            hr_name: Name of the HR representative
+            hr_email: Email of the HR representative
+            service: Optional Gmail API service to reuse; built from the OAuth credentials if omitted
+            
+        Returns:
+            True if the email was sent, False otherwise
+        """
+        try:
+            start_time = time.time()
+            print(f"Starting offer letter email process for {candidate.candidate_name}")
+            
+            if service is None:
+                service = cls.build_gmail_service()
+            
+            # Prepare email content
+            sender_email = "me"  # Special value for authenticated user
+            recipient_email = candidate.email if hasattr(candidate, 'email') and candidate.email else "candidate@example.com"
+            
+            subject = f"Job Offer: {job_title} Position at {company_name}"
+            
+            # Create plain text version of the email
+            plain_text = f"""
+            Dear {candidate.candidate_name},
+            
+            We are delighted to offer you the position of {job_title} at {company_name}.
+            
+            After thorough consideration of your qualifications and experience, we believe you would make an exceptional addition to our team.
+            
+            The details of our offer:
+            - Position: {job_title}
+            - Compensation: {candidate.compensation_offered}
+            - Start Date: To be determined upon acceptance
+            
+            Please find attached our formal offer letter with all details. To accept this offer:
+            1. Review the attached offer letter thoroughly
+            2. Sign and return the offer letter within 7 days
+            
+            If you have any questions, please contact {hr_name} at {hr_email}.
+            
+            Sincerely,
+            {hr_name}
+            Human Resources Department
+            {company_name}
+            {hr_email}
+            """
+            
+            # Create HTML version
+            html_content = cls.create_offer_letter_html(
+                candidate=candidate, 
+                job_title=job_title, 
+                company_name=company_name, 
+                hr_name=hr_name,
+                hr_email=hr_email
+            )
+            
+            # Generate PDF offer letter
+            print("Generating PDF offer letter...")
+            pdf_path = generate_offer_letter_pdf(
+                candidate_name=candidate.candidate_name,
+                job_title=job_title,
+                compensation=candidate.compensation_offered,
+                company_name=company_name,
+                hr_name=hr_name
+            )
+            
+            # Prepare attachments
+            attachments = []
+            if pdf_path and os.path.exists(pdf_path):
+                print(f"PDF generated successfully at {pdf_path}")
+                attachments.append(pdf_path)
+            else:
+                print("⚠️ Warning: PDF generation failed, sending email without attachment")
+            
+            # Create and send the message
+            print(f"Creating email message with {len(attachments)} attachments")
+            message = cls.create_message_with_attachments(
+                sender=sender_email,
+                to=recipient_email,
+                subject=subject,
+                message_text=plain_text,
+                html_content=html_content,
+                file_paths=attachments
+            )
+            
+            # Send the message
+            print("Sending email...")
+            cls.send_message(service, "me", message)
+            
+            # Clean up temporary PDF file
+            if pdf_path and os.path.exists(pdf_path):
+                try:
+                    os.unlink(pdf_path)
+                    print("Temporary PDF file deleted")
+                except Exception as pdf_e:
+                    print(f"Warning: Could not delete temporary PDF file: {pdf_e}")
+            
+            elapsed_time = time.time() - start_time
+            print(f"✅ Offer letter sent to {candidate.candidate_name} in {elapsed_time:.2f} seconds")
+            return True
+        
+        except Exception as e:
+            print(f"❌ Failed to send offer letter: {e}")
+            import traceback
+            traceback.print_exc()
+            return False
+    
     @classmethod
     async def send_offer_letter(cls, candidate: FinalCandidateResponse, job_title: str, 
                            background_tasks: BackgroundTasks, company_name: str = "YourCompany, Inc.", 
                            hr_name: str = "HR Representative", hr_email: str = "hr@company.com") -> bool:
         """
-        Send offer letter to a candidate with PDF attachment
+        Schedule the offer letter email on the background tasks queue
         
         Args:
             candidate: Candidate information
@@ -316,110 +478,7 @@ class EmailService:
         Returns:
             True if the email was scheduled to be sent
         """
-        # This will be run in the background
-        def _send_offer_task(candidate, job_title, company_name, hr_name, hr_email):
-            try:
-                start_time = time.time()
-                print(f"Starting offer letter email process for {candidate.candidate_name}")
-                
-                # Get Gmail credentials
-                oauth_manager = cls.get_oauth_manager()
-                creds = oauth_manager.get_credentials()
-                service = build('gmail', 'v1', credentials=creds)
-                print("Gmail API service built successfully")
-                
-                # Prepare email content
-                sender_email = "me"  # Special value for authenticated user
-                recipient_email = candidate.email if hasattr(candidate, 'email') and candidate.email else "candidate@example.com"
-                
-                subject = f"Job Offer: {job_title} Position at {company_name}"
-                
-                # Create plain text version of the email
-                plain_text = f"""
-                Dear {candidate.candidate_name},
-                
-                We are delighted to offer you the position of {job_title} at {company_name}.
-                
-                After thorough consideration of your qualifications and experience, we believe you would make an exceptional addition to our team.
-                
-                The details of our offer:
-                - Position: {job_title}
-                - Compensation: {candidate.compensation_offered}
-                - Start Date: To be determined upon acceptance
-                
-                Please find attached our formal offer letter with all details. To accept this offer:
-                1. Review the attached offer letter thoroughly
-                2. Sign and return the offer letter within 7 days
-                
-                If you have any questions, please contact {hr_name} at {hr_email}.
-                
-                Sincerely,
-                {hr_name}
-                Human Resources Department
-                {company_name}
-                {hr_email}
-                """
-                
-                # Create HTML version
-                html_content = cls.create_offer_letter_html(
-                    candidate=candidate, 
-                    job_title=job_title, 
-                    company_name=company_name, 
-                    hr_name=hr_name,
-                    hr_email=hr_email
-                )
-                
-                # Generate PDF offer letter
-                print("Generating PDF offer letter...")
-                pdf_path = generate_offer_letter_pdf(
-                    candidate_name=candidate.candidate_name,
-                    job_title=job_title,
-                    compensation=candidate.compensation_offered,
-                    company_name=company_name,
-                    hr_name=hr_name
-                )
-                
-                # Prepare attachments
-                attachments = []
-                if pdf_path and os.path.exists(pdf_path):
-                    print(f"PDF generated successfully at {pdf_path}")
-                    attachments.append(pdf_path)
-                else:
-                    print("⚠️ Warning: PDF generation failed, sending email without attachment")
-                
-                # Create and send the message
-                print(f"Creating email message with {len(attachments)} attachments")
-                message = cls.create_message_with_attachments(
-                    sender=sender_email,
-                    to=recipient_email,
-                    subject=subject,
-                    message_text=plain_text,
-                    html_content=html_content,
-                    file_paths=attachments
-                )
-                
-                # Send the message
-                print("Sending email...")
-                cls.send_message(service, "me", message)
-                
-                # Clean up temporary PDF file
-                if pdf_path and os.path.exists(pdf_path):
-                    try:
-                        os.unlink(pdf_path)
-                        print("Temporary PDF file deleted")
-                    except Exception as pdf_e:
-                        print(f"Warning: Could not delete temporary PDF file: {pdf_e}")
-                
-                elapsed_time = time.time() - start_time
-                print(f"✅ Offer letter sent to {candidate.candidate_name} in {elapsed_time:.2f} seconds")
-                return True
-            
-            except Exception as e:
-                print(f"❌ Failed to send offer letter: {e}")
-                import traceback
-                traceback.print_exc()
-                return False
-        
-        # Add task to background tasks queue
-        background_tasks.add_task(_send_offer_task, candidate, job_title, company_name, hr_name, hr_email)
+        background_tasks.add_task(
+            cls.send_offer_letter_sync, candidate, job_title, company_name, hr_name, hr_email
+        )
         return True
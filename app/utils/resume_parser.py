@@ -3,7 +3,8 @@ Resume parsing utilities using pdfplumber and LLM
 """
 import os
 import pdfplumber
-from typing import Dict, Any, Optional, List
+from functools import lru_cache
+from typing import Dict, Any, FrozenSet, Optional, List, Tuple
 import json
 from openai import OpenAI
 from dotenv import load_dotenv
@@ -158,6 +159,25 @@ def extract_candidate_data_with_llm(resume_text: str, job_data: Dict[str, Any])
         }
 
 
+@lru_cache(maxsize=32)
+def _normalized_job_terms(job_description: str, job_role_name: str) -> Tuple[str, str, FrozenSet[str]]:
+    """
+    Lower-case a job's description and role name and split the description into keywords
+    
+    Every resume processed for a job is scored against the same job, so the result is
+    cached per job text instead of being recomputed for each candidate.
+    
+    Args:
+        job_description: Description of the job
+        job_role_name: Role name of the job
+    
+    Returns:
+        Tuple of (lower-cased description, lower-cased role name, description keywords)
+    """
+    job_desc_lower = job_description.lower()
+    return job_desc_lower, job_role_name.lower(), frozenset(job_desc_lower.split())
+
+
 def calculate_fit_score(candidate_data: Dict[str, Any], job_data: Dict[str, Any]) -> int:
     """
     Calculate a fit score (0-100) based on candidate data and job requirements
@@ -197,12 +217,9 @@ def calculate_fit_score(candidate_data: Dict[str, Any], job_data: Dict[str, Any]
         score += 20
     
     # 2. Skills match (40 points max)
-    job_desc_lower = job_data.get('job_description', '').lower()
-    
-    # Extract key technical terms from job description
-    # This is a simple implementation - in production, use NLP to extract keywords
-    import re
-    technical_terms = set(re.findall(r'\b[A-Za-z][A-Za-z0-9+#.]+\b', job_desc_lower))
+    job_desc_lower, job_title_lower, job_keywords = _normalized_job_terms(
+        job_data.get('job_description', ''), job_data.get('job_role_name', '')
+    )
     
     # Get candidate skills
     candidate_skills = [skill.strip().lower() for skill in candidate_data.get('technical_skills', '').split(',')]
@@ -219,7 +236,6 @@ def calculate_fit_score(candidate_data: Dict[str, Any], job_data: Dict[str, Any]
     score += skills_score
     
     # 3. Role relevance (20 points max)
-    job_title_lower = job_data.get('job_role_name', '').lower()
     relevance_score = 0
     
     # Check previous job responsibilities for relevance
@@ -232,12 +248,13 @@ def calculate_fit_score(candidate_data: Dict[str, Any], job_data: Dict[str, Any]
             break
         
         # Check for domain keyword overlap
-        job_keywords = set(job_desc_lower.split())
-        resp_keywords = set(responsibilities.split())
-        overlap = len(job_keywords.intersection(resp_keywords))
+        overlap = len(job_keywords.intersection(responsibilities.split()))
         
         if overlap > 10:
             relevance_score += min(10, overlap // 2)
+            # Relevance is capped at 20 points, so the remaining companies cannot add to it
+            if relevance_score >= 20:
+                break
     
     score += min(20, relevance_score)
     